@@ -0,0 +1,228 @@
+"""Usage analytics: app events and the rollups the analytics page charts.
+
+Events go into the analytics_events table. These are saved inputs, favorites
+and app feedback ratings. The same transaction that writes an event also
+updates small rollup tables:
+- how many users currently pick each main field, sub-field, goal and interest
+- how many users favorited each resource
+- the number and sum of feedback ratings per day
+
+The dashboard only reads rollups, so it loads in the same time for a
+thousand events as for ten million.
+
+Usage:
+    python analytics.py backfill [--db user_data.db]   # count already saved paths
+    python analytics.py rebuild [--db user_data.db]    # recompute rollups from events
+"""
+import argparse
+import json
+import logging
+import sqlite3
+import sys
+import threading
+import time
+
+from store import DB_PATH, ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+ANALYTICS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analytics_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    user_id TEXT,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS analytics_counts (
+    dimension TEXT NOT NULL,
+    value TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (dimension, value)
+);
+CREATE INDEX IF NOT EXISTS idx_analytics_counts_top ON analytics_counts (dimension, count DESC, value);
+CREATE TABLE IF NOT EXISTS analytics_ratings (
+    day TEXT PRIMARY KEY,
+    rating_count INTEGER NOT NULL,
+    rating_sum INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS analytics_user_inputs (
+    user_id TEXT PRIMARY KEY,
+    inputs TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS analytics_user_favorites (
+    user_id TEXT NOT NULL,
+    resource_id TEXT NOT NULL,
+    PRIMARY KEY (user_id, resource_id)
+);
+"""
+# Rollup tables; `rebuild` empties these and replays the event log
+ROLLUP_TABLES = ("analytics_counts", "analytics_ratings", "analytics_user_inputs", "analytics_user_favorites")
+EVENT_KINDS = ("inputs", "favorite", "feedback")
+
+
+def day_of(timestamp):
+    return time.strftime("%Y-%m-%d", time.gmtime(timestamp))
+
+
+# (dimension, value) pairs counted for one user's saved inputs
+def input_dimensions(inputs):
+    main_field = inputs.get("main_field") or ""
+    pairs = [("main_field", main_field), ("sub_field", f"{main_field} / {inputs.get('sub_field') or ''}"),
+             ("goal", inputs.get("goal") or "")]
+    pairs += [("interest", interest) for interest in sorted(set(inputs.get("interests") or ()))]
+    return [(dimension, value) for dimension, value in pairs if value and value != " / "]
+
+
+def _bump(conn, dimension, value, delta):
+    conn.execute(
+        "INSERT INTO analytics_counts (dimension, value, count) VALUES (?, ?, ?) "
+        "ON CONFLICT(dimension, value) DO UPDATE SET count = count + excluded.count",
+        (dimension, value, delta),
+    )
+    if delta < 0:
+        conn.execute("DELETE FROM analytics_counts WHERE dimension = ? AND value = ? AND count <= 0", (dimension, value))
+
+
+# Fold one event into the rollups. Inputs count each user once, under their latest
+# choice; a favorite counts each user once per resource.
+def _apply(conn, kind, user_id, payload, created_at):
+    _bump(conn, "event", kind, 1)
+    if kind == "inputs":
+        inputs = {
+            "interests": sorted(set(payload.get("interests") or ())),
+            "main_field": payload.get("main_field") or "",
+            "sub_field": payload.get("sub_field") or "",
+            "goal": payload.get("goal") or "",
+        }
+        row = conn.execute("SELECT inputs FROM analytics_user_inputs WHERE user_id = ?", (user_id,)).fetchone()
+        previous = json.loads(row[0]) if row else None
+        if previous == inputs:
+            return
+        if previous is not None:
+            for dimension, value in input_dimensions(previous):
+                _bump(conn, dimension, value, -1)
+        for dimension, value in input_dimensions(inputs):
+            _bump(conn, dimension, value, 1)
+        conn.execute(
+            "INSERT INTO analytics_user_inputs (user_id, inputs) VALUES (?, ?) "
+            "ON CONFLICT(user_id) DO UPDATE SET inputs = excluded.inputs",
+            (user_id, json.dumps(inputs)),
+        )
+    elif kind == "favorite":
+        inserted = conn.execute(
+            "INSERT OR IGNORE INTO analytics_user_favorites (user_id, resource_id) VALUES (?, ?)",
+            (user_id, payload["resource_id"]),
+        ).rowcount
+        if inserted:
+            _bump(conn, "favorite", payload["resource_id"], 1)
+    elif kind == "feedback":
+        conn.execute(
+            "INSERT INTO analytics_ratings (day, rating_count, rating_sum) VALUES (?, 1, ?) "
+            "ON CONFLICT(day) DO UPDATE SET rating_count = rating_count + 1, "
+            "rating_sum = rating_sum + excluded.rating_sum",
+            (day_of(created_at), int(payload["rating"])),
+        )
+    else:
+        raise ValueError(f"unknown analytics event kind: {kind!r}")
+
+
+# Event log plus incrementally maintained rollups, in the app's SQLite database
+class AnalyticsStore:
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self._pool = ConnectionPool(path)
+        self._write_lock = threading.Lock()
+        with self._pool.connection() as conn:
+            conn.executescript(ANALYTICS_SCHEMA)
+
+    # Store events [(kind, user_id, payload, created_at or None)] and fold them into
+    # the rollups in one transaction
+    def record_many(self, events):
+        with self._pool.connection() as conn, self._write_lock, conn:
+            for kind, user_id, payload, created_at in events:
+                created_at = time.time() if created_at is None else created_at
+                conn.execute(
+                    "INSERT INTO analytics_events (kind, user_id, payload, created_at) VALUES (?, ?, ?, ?)",
+                    (kind, user_id, json.dumps(payload), created_at),
+                )
+                _apply(conn, kind, user_id, payload, created_at)
+
+    # Record one event from the app; analytics never break a page, so failures are only logged
+    def record(self, kind, user_id, payload):
+        try:
+            self.record_many([(kind, user_id, payload, None)])
+        except (sqlite3.Error, ValueError, KeyError):
+            logger.exception("Could not record %s event", kind)
+
+    # Recompute every rollup from the event log
+    def rebuild(self):
+        with self._pool.connection() as conn, self._write_lock, conn:
+            for table in ROLLUP_TABLES:
+                conn.execute(f"DELETE FROM {table}")
+            events = conn.execute("SELECT kind, user_id, payload, created_at FROM analytics_events ORDER BY id")
+            for kind, user_id, payload, created_at in events:
+                _apply(conn, kind, user_id, json.loads(payload), created_at)
+
+    # Top `limit` (value, count) pairs of a dimension, largest first
+    def top(self, dimension, limit=20):
+        with self._pool.connection() as conn:
+            return conn.execute(
+                "SELECT value, count FROM analytics_counts WHERE dimension = ? ORDER BY count DESC, value LIMIT ?",
+                (dimension, limit),
+            ).fetchall()
+
+    # {kind: events recorded}
+    def totals(self):
+        return dict(self.top("event", len(EVENT_KINDS)))
+
+    # (day, rating_count, average rating) for the last `days` days with feedback, oldest first
+    def daily_ratings(self, days=90):
+        with self._pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT day, rating_count, rating_sum FROM analytics_ratings ORDER BY day DESC LIMIT ?", (days,)
+            ).fetchall()
+        return [(day, count, total / count) for day, count, total in reversed(rows)]
+
+
+# Events for the saved paths already in the store, as if each had just been saved
+def saved_path_events(items):
+    for user_id, data in items:
+        yield "inputs", user_id, {field: data.get(field) for field in ("interests", "main_field", "sub_field", "goal")}, None
+        for resource_id in data.get("favorites") or ():
+            yield "favorite", user_id, {"resource_id": resource_id}, None
+
+
+def main(argv=None):
+    from store import PathStore
+
+    parser = argparse.ArgumentParser(description="Maintain the usage analytics rollups.")
+    parser.add_argument("command", choices=("backfill", "rebuild"))
+    parser.add_argument("--db", default=DB_PATH)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    store = AnalyticsStore(args.db)
+    started = time.perf_counter()
+    if args.command == "rebuild":
+        store.rebuild()
+        print(f"Rebuilt rollups in {time.perf_counter() - started:.1f}s")
+        return 0
+
+    # Re-running a backfill is harmless: inputs and favorites count each user once
+    count = 0
+    batch = []
+    for event in saved_path_events(PathStore(args.db).iter_all()):
+        batch.append(event)
+        if len(batch) >= args.batch_size:
+            store.record_many(batch)
+            count += len(batch)
+            batch = []
+    store.record_many(batch)
+    count += len(batch)
+    print(f"Recorded {count} events from saved paths in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
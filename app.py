@@ -1,222 +1,631 @@
 import streamlit as st
-import json
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+import functools
 import io
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import os
 import re
+import threading
+import uuid
+from html import escape
+from catalog import get_catalog
+from templates import get_templates
+from locales import get_locales, negotiate
+from store import DB_PATH, PathStore
+from analytics import AnalyticsStore
+from steps import StepList
+from bulk import format_for, import_records, read_records, write_records
+from reviews import ReviewStore, add_review, dump_reviews, load_reviews
+import profiler
+from session_memory import SessionRegistry, footprint
+from throttle import SubmissionGuard
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from assets import THEME_SOURCE, stylesheet_html
+
+# Shared outbound mail queue, created once per process from secrets.toml
+@st.cache_resource(show_spinner=False)
+def get_mailer():
+    # Imported on first use: smtplib and email.mime are not needed to serve a page
+    from mailer import Mailer, MemoryTransport, SMTPTransport
+
+    config = st.secrets["email"]
+    if config.get("transport", "smtp") == "memory":
+        transport = MemoryTransport()
+    else:
+        transport = SMTPTransport(
+            config.get("smtp_host", "smtp.gmail.com"),  # Use Gmail's SMTP server by default
+            int(config.get("smtp_port", 587)),
+            config["email"],
+            config["password"],
+            use_tls=config.get("use_tls", True),
+        )
+    return Mailer(transport, config["email"], config["email"])
 
 # Function to send email
+@profiler.timed("send_email")
 def send_email(review, user_email=None, subject="New Review Submitted on Learning Path Creator"):
     # Validate email
     if user_email and not is_valid_email(user_email):
-        st.error("Please enter a valid email address.")
+        st.error(t("Please enter a valid email address."))
         return False
 
     # Fetch email credentials from secrets.toml
     try:
-        sender_email = st.secrets["email"]["email"]
-        sender_password = st.secrets["email"]["password"]
-        receiver_email = st.secrets["email"]["email"]
-
-    # Create the email
-        body = f"""
-        A new review has been submitted:
-        
-        Review: {review}
-        
-        User Email: {user_email if user_email else "Not provided"}
-        """
-
-        message = MIMEMultipart()
-        message["From"] = sender_email
-        message["To"] = receiver_email
-        message["Subject"] = subject
-        message.attach(MIMEText(body, "plain"))
-
-        # Send the email
-        try:
-            with smtplib.SMTP("smtp.gmail.com", 587) as server:  # Use Gmail's SMTP server
-                server.starttls()
-                server.login(sender_email, sender_password)
-                server.sendmail(sender_email, receiver_email, message.as_string())
-            return True
-        except Exception as e:
-            st.error(f"Failed to send email: {e}")
-            return False
-
+        mailer = get_mailer()
     except KeyError as e:
         st.error(f"Missing configuration: {e}. Please check your secrets.toml file.")
         st.stop()
 
+    # Create the email
+    body = f"""
+    A new review has been submitted:
+    
+    Review: {review}
+    
+    User Email: {user_email if user_email else "Not provided"}
+    """
+
+    # Hand the email to the background worker so the rerun isn't blocked on SMTP
+    if not mailer.submit(subject, body):
+        st.error(t("Our mail queue is busy right now. Please try again in a moment."))
+        return False
+    return True
+
+
+# Shared store of saved learning paths, opened once per process
+@st.cache_resource(show_spinner=False)
+def get_path_store():
+    return PathStore()
+
+# Reviews shared by all users, stored next to the saved learning paths
+@st.cache_resource(show_spinner=False)
+def get_review_store():
+    return ReviewStore(DB_PATH)
+
+# Usage events and rollups behind the analytics page (pages/Analytics.py)
+@st.cache_resource(show_spinner=False)
+def get_analytics():
+    return AnalyticsStore(DB_PATH)
+
+# Dead catalog links as recorded by the link audit (linkcheck.py); re-read from the
+# database at most once a minute, so reruns never touch the network
+@st.cache_resource(ttl=60, show_spinner=False)
+def dead_links(db_path):
+    from linkcheck import LinkStatusStore
+
+    return LinkStatusStore(db_path).dead_links()
+
+# (version, dead urls) for the current DEAD_LINKS mode
+def link_health():
+    if DEAD_LINKS == "off":
+        return 0, frozenset()
+    return dead_links(DB_PATH)
+
+# Rate limits and duplicate detection for feedback and reviews, shared by every session
+@st.cache_resource(show_spinner=False)
+def get_submission_guard():
+    return SubmissionGuard()
+
+# The client's address as reported by a reverse proxy. Streamlit does not expose the
+# socket address, and a client reaching the app directly can forge these headers, so
+# the per-session limit always applies as well.
+def client_address():
+    forwarded = st.context.headers.get("X-Forwarded-For")
+    if forwarded:
+        return forwarded.split(",")[0].strip()
+    return st.context.headers.get("X-Real-Ip")
+
+# Run a submission past the guard; tells the user why and returns False if it was dropped
+def allow_submission(kind, target, text):
+    ctx = get_script_run_ctx()
+    session_id = ctx.session_id if ctx is not None else st.session_state.user_id
+    outcome = get_submission_guard().check(kind, session_id, client_address(), target, text)
+    if outcome == "duplicate":
+        st.info(t("You already sent this. Thank you!"))
+    elif outcome == "rate_limited":
+        st.warning(t("You're sending a lot right now. Please wait a minute and try again."))
+    return outcome == "accepted"
 
 # Function to validate email
 def is_valid_email(email):
     regex = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
     return re.match(regex, email)
 
+# Session state entries holding a learner's data; idle sessions have these spilled to disk
+SESSION_KEYS = ("steps", "favorites", "reviews", "user_data")
+
+# Tracks every session in this process so idle ones can be measured and spilled
+@st.cache_resource(show_spinner=False)
+def get_session_registry():
+    registry = SessionRegistry(SESSION_KEYS)
+    registry.start_sweeper()
+    return registry
+
+# Mark this session active, bringing back its data if the sweeper spilled it;
+# False if that data was lost
+def activate_session():
+    ctx = get_script_run_ctx()
+    return ctx is None or get_session_registry().activate(ctx.session_id, ctx.session_state)
+
+# A fragment whose reruns, which skip main(), still keep the session active and
+# profiled as main() left them. If the session's spilled data was lost, a full
+# rerun sets up fresh state first.
+def session_fragment(func):
+    @functools.wraps(func)
+    def run(*args, **kwargs):
+        if not activate_session():
+            st.rerun(scope="app")
+        profiler.enable_for_run(st.session_state.get("profile", False), st.session_state.get("profile_timings"))
+        return func(*args, **kwargs)
+    return st.fragment(run)
+
 # Initialize session states
 def initialize_session_states():
+    activate_session()
     if 'steps' not in st.session_state:
-        st.session_state.steps = []
+        st.session_state.steps = StepList()
     if 'favorites' not in st.session_state:
-        st.session_state.favorites = []
+        st.session_state.favorites = {}  # ordered set of resource ids
     if 'reviews' not in st.session_state:
         st.session_state.reviews = {}
     if 'show_tutorial' not in st.session_state:
         st.session_state.show_tutorial = True
     if 'user_data' not in st.session_state:
         st.session_state.user_data = {}
+    if 'user_id' not in st.session_state:
+        # Keep the id in the URL so a bookmarked link finds the saved path again
+        if "uid" not in st.query_params:
+            st.query_params["uid"] = uuid.uuid4().hex
+        st.session_state.user_id = st.query_params["uid"]
+
+# The locale of the current script run, cached per script thread
+_run_locale = threading.local()
+
+# Locale for this rerun: ?lang= first, then the browser's Accept-Language. The headers
+# belong to the session's connection and never change, so the header is read once.
+def resolve_locale(locales):
+    if "accept_language" not in st.session_state:
+        st.session_state.accept_language = st.context.headers.get("Accept-Language")
+    return locales[negotiate(locales, st.query_params.get("lang"), st.session_state.accept_language)]
+
+# The current locale and the loaded bundles, resolved once per script run; main() clears
+# them at the start of every full rerun, and a fragment rerun on a new script thread resolves them again
+def current_locale():
+    ctx = get_script_run_ctx()
+    if getattr(_run_locale, "ctx", None) is not ctx:
+        locales = get_locales()
+        _run_locale.ctx, _run_locale.locales, _run_locale.locale = ctx, locales, resolve_locale(locales)
+    return _run_locale.locale
+
+# Translate a UI string into the current locale; the English text is the key
+def t(text, **values):
+    return current_locale().t(text, **values)
+
+# Language picker; the choice goes into the URL (?lang=) so a bookmark keeps it
+def language_picker():
+    current = current_locale().code
+    locales = _run_locale.locales
+    if len(locales) < 2:
+        return
+    codes = sorted(locales, key=lambda code: locales[code].name)
+    choice = st.sidebar.selectbox(
+        t("🌐 Language"), codes, index=codes.index(current), key=f"language_{current}",
+        format_func=lambda code: locales[code].name,
+    )
+    if choice != current:
+        st.query_params["lang"] = choice
+        st.rerun()
 
 # Page Configuration
 def configure_page():
     st.set_page_config(
-        page_title="Learning Path Creator",
+        page_title=t("Learning Path Creator"),
         page_icon="📚",
         layout="wide"
     )
 
-# Custom CSS for Styling
+# "1" links the built stylesheet from static/ (see assets.py); "0" inlines it on every rerun
+STATIC_CSS = os.environ.get("LPC_STATIC_CSS", "1") != "0"
+
+# Theme HTML, built once per process and again whenever the theme source changes
+@st.cache_resource(show_spinner=False)
+def theme_stylesheet(path, mtime_ns, inline):
+    return stylesheet_html(path, inline=inline)
+
+# Custom CSS for Styling; normally a single <link> to the cached, hashed stylesheet
 def apply_custom_css():
-    st.markdown("""
-    <style>
-    .stTextArea textarea {
-        color: #000000 !important; 
-        background-color: #ffffff !important; 
-    }
-    .stTextArea label {
-        color: #000000 !important; 
-    }
-    .stButton button {
-        color:rgb(136, 135, 135) !important; 
-    }
-    .big-font {
-        font-size:24px !important;
-        margin-bottom: 20px !important;
-    }
-    .medium-font {
-        font-size:18px !important;
-        margin-bottom: 15px !important;
-    }
-    .section-spacing {
-        margin-top: 40px !important;
-        margin-bottom: 30px !important;
-    }
-    .progress-bar {
-        background-color: #f0f0f0;
-        border-radius: 10px;
-        padding: 3px;
-    }
-    .resource-card {
-        padding: 15px;
-        margin: 10px 0;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    .review-section {
-        margin-top: 10px;
-        padding: 10px;
-        background: #f8f9fa;
-        border-radius: 8px;
-        color: #000000;
-        font-family: Arial;
-        font-weight: 500 
-    }
-    .footer {
-        position: fixed;
-        bottom: 0;
-        left: 0;
-        width: 100%;
-        background-color: #f8f9fa;
-        padding: 10px;
-        text-align: center;
-        font-size: 14px;
-        color: #000000;
-        border-top: 1px solid #e9ecef;
-        z-index: 1000; 
-    }
-    .stApp {
-        padding-bottom: 60px; 
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(theme_stylesheet(THEME_SOURCE, os.stat(THEME_SOURCE).st_mtime_ns, not STATIC_CSS), unsafe_allow_html=True)
+
+# Render the PDF once per distinct report content; identical downloads are served from cache
+@st.cache_data(max_entries=256, show_spinner=False)
+def _render_report(digest, _data):
+    from report import render_pdf
+
+    buffer = io.BytesIO()
+    render_pdf(_data, buffer)
+    return buffer.getvalue()
+
+# Everything saved for a user: inputs, steps, favorite ids and reviews
+def saved_path_payload():
+    data = dict(st.session_state.user_data)
+    data["learning_path"] = list(st.session_state.steps)
+    data["favorites"] = list(st.session_state.favorites)
+    data["reviews"] = dump_reviews(st.session_state.reviews)
+    return data
+
+# Function to build the PDF report for the current session
+@profiler.timed("pdf")
+def build_report_pdf():
+    # reportlab is only loaded once somebody actually asks for a PDF
+    from report import expand_resource_ids, report_digest
+
+    data = expand_resource_ids(saved_path_payload(), get_catalog().by_id)
+    return _render_report(report_digest(data), data)
 
 
 # Onboarding Tutorial
 def show_onboarding_tutorial():
     if st.session_state.show_tutorial:
         st.markdown("<div class='section-spacing'></div>", unsafe_allow_html=True)
-        st.markdown("<div class='big-font'>🎉 Welcome to Learning Path Creator! 🎉</div>", unsafe_allow_html=True)
-        st.markdown("""
-        <div class='medium-font'>
-        Here's how to get started:<br>
-        1. 📌 Enter your interests in the sidebar<br>
-        2. 🎯 Select your main field and sub-field<br>
-        3. 🚀 Set your learning goal<br>
-        4. 📊 Track your progress<br>
-        5. 📥 Download your progress report<br>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(f"<div class='big-font'>{t('🎉 Welcome to Learning Path Creator! 🎉')}</div>", unsafe_allow_html=True)
+        intro = t("Here's how to get started:")
+        tips = (
+            t("📌 Enter your interests in the sidebar"),
+            t("🎯 Select your main field and sub-field"),
+            t("🚀 Set your learning goal"),
+            t("📊 Track your progress"),
+            t("📥 Download your progress report"),
+        )
+        st.markdown(
+            f"<div class='medium-font'>{intro}<br>"
+            + "".join(f"{i}. {tip}<br>" for i, tip in enumerate(tips, 1))
+            + "</div>",
+            unsafe_allow_html=True,
+        )
         
-        if st.button("Got it! Let's get started ✨"):
+        if st.button(t("Got it! Let's get started ✨")):
             st.session_state.show_tutorial = False
             st.rerun()
 
+# Resource card rendering mode: "html" renders each list as one prebuilt block,
+# "classic" renders every card from its own set of elements
+CARD_MODE = os.environ.get("LPC_CARD_MODE", "html")
+REVIEWS_PER_PAGE = 10
+RECOMMENDATIONS = 5
+# What to do with links the audit found dead: "flag" them, "hide" them, or "off"
+DEAD_LINKS = os.environ.get("LPC_DEAD_LINKS", "flag")
+# "1" lets anyone using the app export every saved path (for admin deployments)
+BULK_ADMIN = os.environ.get("LPC_BULK_ADMIN") == "1"
+# Paths longer than this open in the grid editor by default
+STEP_GRID_THRESHOLD = int(os.environ.get("LPC_STEP_GRID_THRESHOLD", "100"))
+
+# Add a resource to the session's favorites
+def add_favorite(resource):
+    if resource['id'] not in st.session_state.favorites:
+        get_analytics().record("favorite", st.session_state.user_id, {"resource_id": resource['id']})
+    st.session_state.favorites[resource['id']] = None
+
+# Review form and submitted reviews for one resource
+@profiler.timed("reviews")
+def render_review_panel(resource):
+    review = st.text_area(t("Your review:"), key=f"review_{resource['id']}")
+    rating = st.slider(t("Your rating:"), 1, 5, 5, key=f"rating_{resource['id']}")
+    if st.button(t("Submit Review"), key=f"submit_{resource['id']}"):
+        review = review.strip()
+        if not review:
+            st.warning(t("Please write a review before submitting."))
+        elif allow_submission("review", resource['id'], f"{rating}/5 {review}"):
+            add_review(st.session_state.reviews, resource['id'], review, rating)
+            get_review_store().add(resource['id'], review, rating, st.session_state.user_id)
+            # Jump back to the newest page so the new review is visible
+            st.session_state.pop(f"review_pages_{resource['id']}", None)
+        
+            # Ask user if they want to send the review via email
+            send_to_email = st.checkbox(t("Send this review to the admin via email"), key=f"email_checkbox_{resource['id']}")
+            if send_to_email:
+                user_email = st.text_input(t("Enter your email (optional):"), key=f"user_email_{resource['id']}")
+                if send_email(review, user_email):
+                    st.success(t("Review submitted and email sent successfully!"))
+                else:
+                    st.error(t("Failed to send email. Please try again."))
+    
+    render_shared_reviews(resource['id'])
+
+# One page of the reviews every user has written for a resource, newest first
+def render_shared_reviews(resource_id):
+    store = get_review_store()
+    stats = store.stats(resource_id)
+    if not stats.count:
+        return
+
+    st.markdown("### " + t("User Reviews"))
+    if stats.average is not None:
+        st.caption(t(
+            "⭐ {average} / 5 from {ratings} ratings · {reviews} reviews",
+            average=f"{stats.average:.1f}", ratings=stats.rating_count, reviews=stats.count,
+        ))
+
+    # Keyset pagination: remember the last review id of every page we paged past
+    cursors = st.session_state.setdefault(f"review_pages_{resource_id}", [])
+    rows = store.page(resource_id, cursors[-1] if cursors else None, REVIEWS_PER_PAGE)
+    st.markdown(
+        "".join(
+            f"<div class='review-section'>📝 {'⭐' * rating if rating else ''} {escape(text)}</div>"
+            for _, rating, text in rows
+        ),
+        unsafe_allow_html=True,
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        if cursors:
+            st.button(t("◀ Newer"), key=f"newer_{resource_id}", on_click=cursors.pop)
+    with col2:
+        if len(rows) == REVIEWS_PER_PAGE:
+            st.button(t("Older ▶"), key=f"older_{resource_id}", on_click=cursors.append, args=(rows[-1][0],))
+
+# Build the markup for a whole card list once per (catalog, sub-field, query, link audit);
+# a localized catalog has its own etag, so each locale gets its own markup
+@st.cache_data(max_entries=512, show_spinner=False)
+def resource_cards_html(etag, main_field, sub_field, query, links_version, _resources, _dead=frozenset()):
+    type_label, broken = escape(t("Type:")), escape(t("⚠️ This link looks broken."))
+    return "".join(
+        "<div class='resource-card'>"
+        f"<h3><a href='{escape(resource['link'])}' target='_blank'>{escape(resource['title'])}</a></h3>"
+        f"<p><b>{type_label}</b> {escape(resource['type'])}</p>"
+        + (f"<p>{broken}</p>" if resource['link'] in _dead else "")
+        + "</div>"
+        for resource in _resources
+    )
+
+# (links_version, resources, dead) arguments for resource_cards_html; in "hide"
+# mode dead links are left out instead of flagged
+def link_args(resources):
+    version, dead = link_health()
+    if DEAD_LINKS == "hide":
+        return version, [resource for resource in resources if resource['link'] not in dead], frozenset()
+    return version, list(resources), dead
+
+# Catalog-wide picks for the user's interests, goal, favorites and ratings,
+# leaving out the resources already listed for their sub-field
+@profiler.timed("recommend")
+def render_recommendations(catalog, listed):
+    from recommend import make_profile, profile_digest, review_ratings
+
+    user_data = st.session_state.user_data
+    profile = make_profile(user_data, st.session_state.favorites, review_ratings(st.session_state.reviews))
+    picks = catalog.recommender.recommend(
+        profile, RECOMMENDATIONS, exclude=[resource['id'] for resource in listed]
+    )
+    if not picks:
+        return
+    st.markdown("### " + t("✨ Recommended for You"))
+    st.markdown(
+        resource_cards_html(
+            catalog.etag,
+            user_data["main_field"],
+            user_data["sub_field"],
+            f"recommended:{profile_digest(profile)}",
+            *link_args(catalog.by_id[resource['id']] for _, _, resource in picks),
+        ),
+        unsafe_allow_html=True,
+    )
+
+# One markdown block for all cards, with the favorite/review controls grouped below it
+def render_resources_html(catalog, query, resources):
+    st.markdown(
+        resource_cards_html(
+            catalog.etag,
+            st.session_state.user_data["main_field"],
+            st.session_state.user_data["sub_field"],
+            query,
+            *link_args(resources),
+        ),
+        unsafe_allow_html=True,
+    )
+    if resources:
+        resource_actions(resources)
+
+# Favorite/review controls for the card list; interacting reruns only this fragment
+@session_fragment
+def resource_actions(resources):
+    by_id = {resource['id']: resource for resource in resources}
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        selected = st.selectbox(
+            t("Pick a resource to favorite or review:"),
+            list(by_id),
+            format_func=lambda rid: by_id[rid]['title']
+        )
+    with col2:
+        if st.button(t("⭐ Add to Favorites"), key="fav_selected"):
+            add_favorite(by_id[selected])
+            st.rerun()  # favorites are shown outside this fragment
+    with st.expander(t("💬 Add Review")):
+        render_review_panel(by_id[selected])
+
+# One container per card with its own favorite button and review expander
+def render_resources_classic(resources):
+    for resource in resources:
+        resource_card(resource)
+
+# A single card; interacting with it reruns only this fragment
+@session_fragment
+def resource_card(resource):
+    with st.container():
+        st.markdown(f"<div class='resource-card'>", unsafe_allow_html=True)
+        st.markdown(f"### [{resource['title']}]({resource['link']})")
+        st.markdown(f"**{t('Type:')}** {resource['type']}")
+        if resource['link'] in link_health()[1]:
+            st.caption(t("⚠️ This link looks broken."))
+        
+        # Favorites
+        col1, col2 = st.columns([1,3])
+        with col1:
+            if st.button(t("⭐ Add to Favorites"), key=f"fav_{resource['id']}"):
+                add_favorite(resource)
+                st.rerun()  # favorites are shown outside this fragment
+        
+        # Reviews
+        with st.expander(t("💬 Add Review")):
+            render_review_panel(resource)
+        
+        st.markdown("</div>", unsafe_allow_html=True)
+
+# Text edits write back only the step that changed
+def _edit_step(step_id):
+    st.session_state.steps.update(step_id, st.session_state[f"step_{step_id}"])
+
+# Move or delete the step picked in the step controls
+def _move_step():
+    steps = st.session_state.steps
+    steps.move(st.session_state.step_pick, st.session_state.step_move_to - 1)
+
+def _delete_step():
+    st.session_state.steps.delete(st.session_state.step_pick)
+
+# Per-step text inputs keyed by step id, plus one shared move/delete row
+def render_step_inputs(steps):
+    for i, (step_id, text) in enumerate(steps.items(), 1):
+        key = f"step_{step_id}"
+        if key not in st.session_state:
+            st.session_state[key] = text
+        st.text_input(t("Step {number}:", number=i), key=key, on_change=_edit_step, args=(step_id,))
+
+    if not steps:
+        return
+    positions = {step_id: i for i, (step_id, _) in enumerate(steps.items(), 1)}
+    # Drop choices left over from a step that was deleted or a path that got shorter
+    if st.session_state.get("step_pick") not in positions:
+        st.session_state.pop("step_pick", None)
+    if st.session_state.get("step_move_to", 1) > len(steps):
+        st.session_state.step_move_to = len(steps)
+    locale = current_locale()
+    col1, col2, col3, col4 = st.columns([4, 2, 1, 1], vertical_alignment="bottom")
+    with col1:
+        st.selectbox(t("Step to move or delete:"), list(positions), key="step_pick",
+                     format_func=lambda step_id: locale.t("Step {number}", number=positions[step_id]))
+    with col2:
+        st.number_input(t("Move to position:"), 1, len(steps), key="step_move_to")
+    with col3:
+        st.button(t("↕️ Move"), on_click=_move_step)
+    with col4:
+        st.button(t("🗑️ Delete"), on_click=_delete_step)
+
+# A single grid for long paths instead of one row of widgets per step
+def render_step_grid(steps):
+    import pandas as pd
+
+    column = t("Step")
+    edited = st.data_editor(
+        pd.DataFrame({column: list(steps)}),
+        num_rows="dynamic",
+        use_container_width=True,
+        hide_index=False,
+        key="step_grid",
+    )
+    steps.assign(edited[column].fillna("").astype(str).tolist())
+
+# Learning path editor; edits rerun only this fragment, not the whole page
+@session_fragment
+@profiler.timed("steps")
+def learning_path_editor():
+    steps = st.session_state.steps
+
+    # Step Customization (the editable steps below are drawn after these buttons,
+    # so they already reflect an added or removed step without another rerun)
+    with st.expander(t("✏️ Customize Your Learning Path")):
+        new_step = st.text_input(t("Add new step:"))
+        position = st.number_input(t("At position:"), 1, len(steps) + 1, len(steps) + 1)
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button(t("➕ Add Step")) and new_step:
+                steps.insert(position - 1, new_step)
+        with col2:
+            if st.button(t("➖ Remove Last Step")) and steps:
+                steps.pop()
+
+        # Editable Steps
+        if st.toggle(t("Edit as grid"), value=len(steps) > STEP_GRID_THRESHOLD):
+            render_step_grid(steps)
+        else:
+            render_step_inputs(steps)
+
+    # Display Steps
+    st.markdown("  \n".join(
+        f"📌 **{t('Step {number}:', number=idx)}** {step}" for idx, step in enumerate(steps, 1)
+    ))
+
+    # Save Learning Path
+    if steps.has_changes:
+        st.caption(t("You have unsaved changes to your learning path."))
+    if st.button(t("💾 Save Learning Path")):
+        get_path_store().save(st.session_state.user_id, saved_path_payload())
+        steps.mark_clean()
+        st.success(t("Learning path saved!"))
+
+# Favorites Section
+@session_fragment
+def favorites_panel():
+    with st.expander(t("❤️ My Favorites")):
+        if st.session_state.favorites:
+            by_id = get_catalog().localized(current_locale()).by_id
+            for fav in (by_id[rid] for rid in st.session_state.favorites if rid in by_id):
+                st.markdown(f"### {fav['title']}")
+                st.markdown(f"{t('Type:')} {fav['type']}")
+        else:
+            st.write(t("No favorites yet!"))
+
 # Main App
 def main_app():
     if not st.session_state.show_tutorial:
+        # Fields and goals keep their English keys; widgets show them translated
+        locale = current_locale()
+        catalog = get_catalog().localized(locale)
+        templates = get_templates().localized(locale)
+
         # App title and welcome message
         st.markdown("<div class='section-spacing'></div>", unsafe_allow_html=True)
-        st.markdown("<div class='big-font'>📚 Personalized Learning Path Creator 🎯</div>", unsafe_allow_html=True)
+        st.markdown(f"<div class='big-font'>{t('📚 Personalized Learning Path Creator 🎯')}</div>", unsafe_allow_html=True)
         
         # Sidebar Section
-        with st.sidebar:
-            st.title("⚙️ User Inputs")
+        with st.sidebar, profiler.section("sidebar"):
+            st.title(t("⚙️ User Inputs"))
             
             # Interests
-            st.header("🎨 Your Interests")
+            st.header(t("🎨 Your Interests"))
             interests = st.multiselect(
-                'Select your interests:',
-                ['Programming', 'Reading', 'Gaming', 'Traveling', 'Cooking', 'Sports']
+                t('Select your interests:'),
+                list(catalog.fields),
+                format_func=locale.field
             )
 
             # Main Field
-            st.header("🎯 Main Field")
+            st.header(t("🎯 Main Field"))
             main_field = st.selectbox(
-                'Select your main field:',
-                ['', 'Programming', 'Reading', 'Gaming', 'Traveling', 'Cooking', 'Sports']
+                t('Select your main field:'),
+                [''] + list(catalog.fields),
+                format_func=locale.field
             )
 
-            # Sub-fields
-            sub_fields = {
-                "Programming": ['Python', 'JavaScript', 'Java', 'C++', 'Ruby', "AI/ML"],
-                "Reading": ['Fiction', 'Non-fiction', 'Science Fiction', 'Fantasy', 'Biography'],
-                "Gaming": ['Action', 'Adventure', 'Strategy', 'RPG', 'Sports'],
-                "Traveling": ['Adventure', 'Cultural', 'Beach', 'Mountain', 'City'],
-                "Cooking": ['Baking', 'Grilling', 'Vegetarian', 'Seafood', 'Desserts'],
-                "Sports": ['Football', 'Basketball', 'Cricket', 'Tennis', 'Swimming']
-            }
-
             if main_field:
-                st.header(f"🔍 {main_field} Sub-Field")
+                st.header(t("🔍 {field} Sub-Field", field=locale.field(main_field)))
                 sub_field = st.selectbox(
-                    f'Select sub-field:',
-                    sub_fields[main_field]
+                    t('Select sub-field:'),
+                    catalog.fields[main_field],
+                    format_func=locale.field
                 )
 
             # Goals
-            st.header("🚀 Your Goals")
+            st.header(t("🚀 Your Goals"))
             goals = st.selectbox(
-                'Select your primary goal:',
-                ['', 'Learn a new skill', 'Improve fitness', 'Read more books', 'Travel more', 'Cook new recipes']
+                t('Select your primary goal:'),
+                [''] + list(templates.goals),
+                format_func=locale.goal
             )
 
             # Save/Reset buttons
             col1, col2 = st.columns(2)
             with col1:
-                if st.button("💾 Save Inputs"):
+                if st.button(t("💾 Save Inputs")):
                     if main_field and sub_field and goals:
                         st.session_state.user_data = {
                             "interests": interests,
@@ -224,390 +633,200 @@ def main_app():
                             "sub_field": sub_field,
                             "goal": goals
                         }
-                        st.success("Inputs saved!")
+                        get_analytics().record("inputs", st.session_state.user_id, st.session_state.user_data)
+                        st.success(t("Inputs saved!"))
             with col2:
-                if st.button("🔄 Reset All"):
-                    st.session_state.steps = []
-                    st.session_state.favorites = []
+                if st.button(t("🔄 Reset All")):
+                    st.session_state.steps = StepList()
+                    st.session_state.favorites = {}
                     st.session_state.reviews = {}
                     st.session_state.user_data = {}
                     st.rerun()
 
+            if st.button(t("📂 Load Saved Path")):
+                saved = get_path_store().load(st.session_state.user_id)
+                if saved:
+                    st.session_state.favorites = dict.fromkeys(saved.pop("favorites", []))
+                    st.session_state.reviews = load_reviews(saved.pop("reviews", None))
+                    st.session_state.steps = StepList(saved.pop("learning_path", []))
+                    st.session_state.user_data = saved
+                    st.rerun()
+                else:
+                    st.info(t("No saved learning path yet. Bookmark this page to come back to it later."))
+
+            bulk_panel()
+
             # Feedback Section
-            with st.expander("💬 Feedback & Rating"):
-                st.write("We'd love to hear your feedback!")
-                rating = st.slider("Rate the app (1 to 5 stars):", 1, 5, 5)
-                feedback = st.text_area("Your feedback:")
-                if st.button("Submit Feedback"):
-                    if feedback:
+            with st.expander(t("💬 Feedback & Rating")):
+                st.write(t("We'd love to hear your feedback!"))
+                rating = st.slider(t("Rate the app (1 to 5 stars):"), 1, 5, 5)
+                feedback = st.text_area(t("Your feedback:"))
+                if st.button(t("Submit Feedback")):
+                    if not feedback:
+                        st.warning(t("Please provide feedback before submitting."))
+                    elif allow_submission("feedback", "app", f"{rating}/5 {feedback}"):
+                        get_analytics().record("feedback", st.session_state.user_id, {"rating": rating})
                         send_email(f"App Rating: {rating}/5\nFeedback: {feedback}")
-                        st.success("Thank you for your feedback! We appreciate it.")
-                    else:
-                        st.warning("Please provide feedback before submitting.")
+                        st.success(t("Thank you for your feedback! We appreciate it."))
 
         # Learning Path Section
         if st.session_state.user_data.get("goal"):
-            st.markdown(f"<div class='big-font'>📚 Your {st.session_state.user_data['goal']} Learning Path</div>", unsafe_allow_html=True)
+            goal = locale.goal(st.session_state.user_data['goal'])
+            st.markdown(f"<div class='big-font'>{t('📚 Your {goal} Learning Path', goal=goal)}</div>", unsafe_allow_html=True)
             
             # Initialize steps
             if not st.session_state.steps:
-                predefined_steps = {
-                    "Learn a new skill": [
-                        "Identify the skill you want to learn",
-                        "Gather resources (books, courses, articles)",
-                        "Set daily/weekly practice schedule",
-                        "Join a community or find a mentor",
-                        "Track progress and adjust learning plan"
-                    ],
-                    "Improve fitness": [
-                        "Set specific fitness goals",
-                        "Create a workout plan",
-                        "Find a workout buddy",
-                        "Track your progress",
-                        "Adjust your plan as needed"
-                    ],
-                    "Read more books": [
-                        "Create a reading list",
-                        "Set reading goals",
-                        "Find a reading spot",
-                        "Join a book club",
-                        "Track your progress"
-                    ],
-                    "Travel more": [
-                        "Create a travel bucket list",
-                        "Set a travel budget",
-                        "Research destinations",
-                        "Plan your trips",
-                        "Track your experiences"
-                    ],
-                    "Cook new recipes": [
-                        "Identify recipes to try",
-                        "Gather ingredients",
-                        "Set a cooking schedule",
-                        "Join a cooking class",
-                        "Track your experiments"
-                    ]
-                }.get(st.session_state.user_data["goal"], [])
-                st.session_state.steps = predefined_steps.copy()
-
-            # Step Customization
-            with st.expander("✏️ Customize Your Learning Path"):
-                new_step = st.text_input("Add new step:")
-                col1, col2 = st.columns(2)
-                with col1:
-                    if st.button("➕ Add Step") and new_step:
-                        st.session_state.steps.append(new_step)
-                        st.rerun()
-                with col2:
-                    if st.button("➖ Remove Last Step") and st.session_state.steps:
-                        st.session_state.steps.pop()
-                        st.rerun()
-
-                # Editable Steps
-                edited_steps = []
-                for i, step in enumerate(st.session_state.steps, 1):
-                    edited_step = st.text_input(f"Step {i}:", value=step)
-                    edited_steps.append(edited_step)
-                st.session_state.steps = edited_steps
-
-            # Display Steps
-            for idx, step in enumerate(st.session_state.steps, 1):
-                st.markdown(f"📌 **Step {idx}:** {step}")
-
-            # Save Learning Path
-            if st.button("💾 Save Learning Path"):
-                st.session_state.user_data["learning_path"] = st.session_state.steps
-                with open("user_data.json", "w") as f:
-                    json.dump(st.session_state.user_data, f)
-                st.success("Learning path saved!")
+                user_data = st.session_state.user_data
+                predefined_steps = templates.steps_for(
+                    user_data["goal"], user_data.get("main_field", ""), user_data.get("sub_field", "")
+                )
+                st.session_state.steps = StepList(predefined_steps)
+
+            learning_path_editor()
 
         # Resource Recommendations Section
         if st.session_state.user_data.get("main_field") and st.session_state.user_data.get("sub_field"):
             st.markdown("<div class='section-spacing'></div>", unsafe_allow_html=True)
-            st.markdown("<div class='big-font'>📚 Recommended Resources</div>", unsafe_allow_html=True)
+            st.markdown(f"<div class='big-font'>{t('📚 Recommended Resources')}</div>", unsafe_allow_html=True)
             
             # Search Bar
-            search_query = st.text_input("🔍 Search resources:")
+            search_query = st.text_input(t("🔍 Search resources:"))
             
-            # Resources Database
-            resources = {
-                "Programming": {
-                    "Python": [
-                        {"title": "Learn Python the Hard Way", "type": "Book", "link": "https://learnpythonthehardway.org/"},
-                        {"title": "Eric Mathes Python Crash Course PDF", "type": "Book", "link": "https://khwarizmi.org/wp-content/uploads/2021/04/Eric_Matthes_Python_Crash_Course_A_Hands.pdf"},
-                        {"title": "Automate the Boring Stuff with Python", "type": "Course", "link": "https://automatetheboringstuff.com/"},
-                        {"title": "Corey Schafer's Python Tutorials", "type": "YouTube Channel", "link": "https://www.youtube.com/user/schafer5"},
-                        {"title": "Python Crash Course - Panaversity", "type": "YouTube Channel", "link": "https://www.youtube.com/playlist?list=PL0vKVrkG4hWrEujmnC7v2mSiaXMV_Tfu0"},
-                        {"title": "Code With Mosh Python Tutorial", "type": "YouTube Channel", "link": "https://www.youtube.com/watch?v=K5KVEU3aaeQ&t=866s"},
-                        {"title": "Python for Data Science 2024", "type": "Course", "link": "https://www.coursera.org/specializations/python-data-science"},
-                        {"title": "Advanced Python Programming 2025", "type": "Book", "link": "https://www.oreilly.com/library/view/advanced-python-programming/9781492051367/"}
-                    ],
-                    "JavaScript": [
-                        {"title": "Eloquent JavaScript", "type": "Book", "link": "https://eloquentjavascript.net/"},
-                        {"title": "JavaScript.info", "type": "Article", "link": "https://javascript.info/"},
-                        {"title": "Traversy Media", "type": "YouTube Channel", "link": "https://www.youtube.com/user/TechGuyWeb"},
-                        {"title": "Javascript Beginners Course - FreeCodeCamp", "type": "YouTube Channel", "link": "https://www.youtube.com/watch?v=Zi-Q0t4gMC8"},
-                        {"title": "Modern JavaScript 2024", "type": "Course", "link": "https://www.udemy.com/course/modern-javascript/"},
-                        {"title": "JavaScript Frameworks 2025", "type": "Book", "link": "https://www.manning.com/books/javascript-frameworks"}
-                    ],
-                    "Java": [
-                        {"title": "Effective Java", "type": "Book", "link": "https://www.oreilly.com/library/view/effective-java/9780134686097/"},
-                        {"title": "Java Programming and Software Engineering Fundamentals", "type": "Course", "link": "https://www.coursera.org/specializations/java-programming"},
-                        {"title": "Java Brains", "type": "YouTube Channel", "link": "https://www.youtube.com/user/koushks"},
-                        {"title": "FreeCodeCamps Java Tutorial", "type": "YouTube Channel", "link": "https://www.youtube.com/watch?v=A74TOX803D0"},
-                        {"title": "Java for Beginners 2024", "type": "Course", "link": "https://www.udemy.com/course/java-for-beginners/"},
-                        {"title": "Advanced Java Programming 2025", "type": "Book", "link": "https://www.oreilly.com/library/view/advanced-java-programming/9781492051367/"}
-                    ],
-                    "C++": [
-                        {"title": "C++ Primer", "type": "Book", "link": "https://www.oreilly.com/library/view/c-primer-5th/9780133053043/"},
-                        {"title": "The Cherno", "type": "YouTube Channel", "link": "https://www.youtube.com/user/TheChernoProject"},
-                        {"title": "FreeCodeCamp C++ Tutorial", "type": "YouTube Channel", "link": "https://www.youtube.com/watch?v=8jLOx1hD3_o"},
-                        {"title": "C++ for Game Development 2024", "type": "Course", "link": "https://www.udemy.com/course/cpp-for-game-development/"},
-                        {"title": "Advanced C++ Programming 2025", "type": "Book", "link": "https://www.oreilly.com/library/view/advanced-c-programming/9781492051367/"}
-                    ],
-                    "Ruby": [
-                        {"title": "The Well-Grounded Rubyist", "type": "Book", "link": "https://www.manning.com/books/the-well-grounded-rubyist-third-edition"},
-                        {"title": "Ruby on Rails Tutorial", "type": "Course", "link": "https://www.railstutorial.org/"},
-                        {"title": "Ruby for Web Development 2024", "type": "Course", "link": "https://www.udemy.com/course/ruby-for-web-development/"},
-                        {"title": "Advanced Ruby Programming 2025", "type": "Book", "link": "https://www.oreilly.com/library/view/advanced-ruby-programming/9781492051367/"}
-                    ],
-                    "AI/ML": [
-                        {"title": "Deep Learning Specialization by Andrew Ng", "type": "Course", "link": "https://www.coursera.org/specializations/deep-learning"},
-                        {"title": "Hands-On Machine Learning with Scikit-Learn, Keras, and TensorFlow", "type": "Book", "link": "https://www.oreilly.com/library/view/hands-on-machine-learning/9781492032632/"},
-                        {"title": "3Blue1Brown - Neural Networks", "type": "YouTube Channel", "link": "https://www.youtube.com/c/3blue1brown"},
-                        {"title": "Krish Naik - AI/ML Tutorials", "type": "YouTube Channel", "link": "https://www.youtube.com/c/KrishNaik"},
-                        {"title": "Fast.ai - Practical Deep Learning for Coders", "type": "Course", "link": "https://www.fast.ai/"},
-                        {"title": "StatQuest with Josh Starmer", "type": "YouTube Channel", "link": "https://www.youtube.com/c/joshstarmer"},
-                        {"title": "Google Machine Learning Crash Course", "type": "Course", "link": "https://developers.google.com/machine-learning/crash-course"},
-                        {"title": "AI/ML Trends 2024", "type": "Article", "link": "https://www.towardsdatascience.com/ai-ml-trends-2024"},
-                        {"title": "Advanced AI/ML Techniques 2025", "type": "Book", "link": "https://www.oreilly.com/library/view/advanced-ai-ml-techniques/9781492051367/"}
-                    ]
-                },
-                "Reading": {
-                    "Fiction": [
-                        {"title": "The Great Gatsby", "type": "Book", "link": "https://www.goodreads.com/book/show/4671.The_Great_Gatsby"},
-                        {"title": "1984 by George Orwell", "type": "Book", "link": "https://www.goodreads.com/book/show/5470.1984"},
-                        {"title": "BookTubers to Follow", "type": "YouTube Channel", "link": "https://www.youtube.com/results?search_query=booktubers"},
-                        {"title": "Best Fiction Books 2024", "type": "Article", "link": "https://www.goodreads.com/list/show/175351.Best_Fiction_Books_2024"}
-                    ],
-                    "Non-fiction": [
-                        {"title": "Sapiens: A Brief History of Humankind", "type": "Book", "link": "https://www.goodreads.com/book/show/23692271-sapiens"},
-                        {"title": "TED Talks", "type": "YouTube Channel", "link": "https://www.youtube.com/user/TEDtalksDirector"},
-                        {"title": "Best Non-Fiction Books 2024", "type": "Article", "link": "https://www.goodreads.com/list/show/175352.Best_Non_Fiction_Books_2024"}
-                    ],
-                    "Science Fiction": [
-                        {"title": "Dune by Frank Herbert", "type": "Book", "link": "https://www.goodreads.com/book/show/44767458-dune"},
-                        {"title": "Sci-Fi Book Recommendations", "type": "YouTube Channel", "link": "https://www.youtube.com/results?search_query=sci-fi+books"},
-                        {"title": "Best Sci-Fi Books 2024", "type": "Article", "link": "https://www.goodreads.com/list/show/175353.Best_Sci_Fi_Books_2024"}
-                    ],
-                    "Fantasy": [
-                        {"title": "The Hobbit by J.R.R. Tolkien", "type": "Book", "link": "https://www.goodreads.com/book/show/5907.The_Hobbit_or_There_and_Back_Again"},
-                        {"title": "Fantasy Book Reviews", "type": "YouTube Channel", "link": "https://www.youtube.com/results?search_query=fantasy+book+reviews"},
-                        {"title": "Best Fantasy Books 2024", "type": "Article", "link": "https://www.goodreads.com/list/show/175354.Best_Fantasy_Books_2024"}
-                    ],
-                    "Biography": [
-                        {"title": "Steve Jobs by Walter Isaacson", "type": "Book", "link": "https://www.goodreads.com/book/show/11084145-steve-jobs"},
-                        {"title": "Biographies to Read", "type": "YouTube Channel", "link": "https://www.youtube.com/results?search_query=biographies"},
-                        {"title": "Best Biographies 2024", "type": "Article", "link": "https://www.goodreads.com/list/show/175355.Best_Biographies_2024"}
-                    ]
-                },
-                "Gaming": {
-                    "Action": [
-                        {"title": "Game Development with Unity", "type": "Course", "link": "https://unity.com/learn"},
-                        {"title": "Brackeys", "type": "YouTube Channel", "link": "https://www.youtube.com/user/Brackeys"},
-                        {"title": "Best Action Games 2024", "type": "Article", "link": "https://www.ign.com/lists/best-action-games-2024"}
-                    ],
-                    "Adventure": [
-                        {"title": "Game Design and Development", "type": "Course", "link": "https://www.coursera.org/specializations/game-design"},
-                        {"title": "Extra Credits", "type": "YouTube Channel", "link": "https://www.youtube.com/user/ExtraCreditz"},
-                        {"title": "Best Adventure Games 2024", "type": "Article", "link": "https://www.ign.com/lists/best-adventure-games-2024"}
-                    ],
-                    "Strategy": [
-                        {"title": "The Art of Game Design", "type": "Book", "link": "https://www.goodreads.com/book/show/409640.The_Art_of_Game_Design"},
-                        {"title": "GDC", "type": "YouTube Channel", "link": "https://www.youtube.com/user/gdconf"},
-                        {"title": "Best Strategy Games 2024", "type": "Article", "link": "https://www.ign.com/lists/best-strategy-games-2024"}
-                    ],
-                    "RPG": [
-                        {"title": "RPG Maker Tutorials", "type": "Course", "link": "https://www.rpgmakerweb.com/support/tutorial"},
-                        {"title": "RPG Limit Break", "type": "YouTube Channel", "link": "https://www.youtube.com/user/RPGLimitBreak"},
-                        {"title": "Best RPG Games 2024", "type": "Article", "link": "https://www.ign.com/lists/best-rpg-games-2024"}
-                    ],
-                    "Sports": [
-                        {"title": "FIFA Coaching and Tips", "type": "YouTube Channel", "link": "https://www.youtube.com/user/EAFIFADevTeam"},
-                        {"title": "Best Sports Games 2024", "type": "Article", "link": "https://www.ign.com/lists/best-sports-games-2024"}
-                    ]
-                },
-                "Cooking": {
-                    "Baking": [
-                        {"title": "The Joy of Baking", "type": "Book", "link": "https://www.goodreads.com/book/show/14494.Joy_of_Baking"},
-                        {"title": "Cupcake Jemma", "type": "YouTube Channel", "link": "https://www.youtube.com/user/CupcakeJemma"},
-                        {"title": "Best Baking Recipes 2024", "type": "Article", "link": "https://www.allrecipes.com/best-baking-recipes-2024"}
-                    ],
-                    "Grilling": [
-                        {"title": "The Barbecue Bible", "type": "Book", "link": "https://www.goodreads.com/book/show/527234.The_Barbecue_Bible"},
-                        {"title": "BBQ Pit Boys", "type": "YouTube Channel", "link": "https://www.youtube.com/user/BarbecueWeb"},
-                        {"title": "Best Grilling Recipes 2024", "type": "Article", "link": "https://www.allrecipes.com/best-grilling-recipes-2024"}
-                    ],
-                    "Vegetarian": [
-                        {"title": "Vegetarian Cooking for Everyone", "type": "Book", "link": "https://www.goodreads.com/book/show/61913.Vegetarian_Cooking_for_Everyone"},
-                        {"title": "Pick Up Limes", "type": "YouTube Channel", "link": "https://www.youtube.com/channel/UCq2E1mIwUKMWzCA4liA_XGQ"},
-                        {"title": "Best Vegetarian Recipes 2024", "type": "Article", "link": "https://www.allrecipes.com/best-vegetarian-recipes-2024"}
-                    ],
-                    "Seafood": [
-                        {"title": "Fish: Recipes from the Sea", "type": "Book", "link": "https://www.goodreads.com/book/show/161303.Fish"},
-                        {"title": "Bart’s Fish Tales", "type": "YouTube Channel", "link": "https://www.youtube.com/user/bartsfishtales"},
-                        {"title": "Best Seafood Recipes 2024", "type": "Article", "link": "https://www.allrecipes.com/best-seafood-recipes-2024"}
-                    ],
-                    "Desserts": [
-                        {"title": "The Art of French Pastry", "type": "Book", "link": "https://www.goodreads.com/book/show/18167490-the-art-of-french-pastry"},
-                        {"title": "Preppy Kitchen", "type": "YouTube Channel", "link": "https://www.youtube.com/channel/UCB4gFkDmRZ2fFTEZ3P8FI3g"},
-                        {"title": "Best Dessert Recipes 2024", "type": "Article", "link": "https://www.allrecipes.com/best-dessert-recipes-2024"}
-                    ]
-                },
-                "Sports": {
-                    "Football": [
-                        {"title": "Coaching Soccer Tactics", "type": "YouTube Channel", "link": "https://www.youtube.com/user/LaureusTV"},
-                        {"title": "Inverting The Pyramid: The History of Football Tactics", "type": "Book", "link": "https://www.amazon.com/Inverting-Pyramid-History-Football-Tactics/dp/1409102041"},
-                        {"title": "Best Football Drills 2024", "type": "Article", "link": "https://www.soccercoachweekly.net/best-football-drills-2024"}
-                    ],
-                    "Basketball": [
-                        {"title": "Basketball Fundamentals", "type": "YouTube Channel", "link": "https://www.youtube.com/user/LaureusTV"},
-                        {"title": "Basketball: Steps to Success", "type": "Book", "link": "https://www.amazon.com/Basketball-Steps-Success/dp/0736067078"},
-                        {"title": "Best Basketball Drills 2024", "type": "Article", "link": "https://www.basketballforcoaches.com/best-basketball-drills-2024"}
-                    ],
-                    "Cricket": [
-                        {"title": "Cricket Coaching Tips", "type": "YouTube Channel", "link": "https://www.youtube.com/user/LaureusTV"},
-                        {"title": "The Art of Cricket", "type": "Book", "link": "https://www.amazon.com/Art-Cricket-Don-Bradman/dp/1405278242"},
-                        {"title": "Best Cricket Drills 2024", "type": "Article", "link": "https://www.cricketcoaching.com/best-cricket-drills-2024"}
-                    ],
-                    "Tennis": [
-                        {"title": "Tennis Instruction and Tips", "type": "YouTube Channel", "link": "https://www.youtube.com/user/LaureusTV"},
-                        {"title": "Tennis Science for Tennis Players", "type": "Book", "link": "https://www.amazon.com/Tennis-Science-Players-Howard-Brody/dp/0812213340"},
-                        {"title": "Best Tennis Drills 2024", "type": "Article", "link": "https://www.tenniscoaching.com/best-tennis-drills-2024"}
-                    ],
-                    "Swimming": [
-                        {"title": "Swimming Techniques", "type": "YouTube Channel", "link": "https://www.youtube.com/user/LaureusTV"},
-                        {"title": "Total Immersion: The Revolutionary Way To Swim Better, Faster, and Easier", "type": "Book", "link": "https://www.amazon.com/Total-Immersion-Revolutionary-Better-Faster/dp/0743253434"},
-                        {"title": "Best Swimming Drills 2024", "type": "Article", "link": "https://www.swimmingcoach.com/best-swimming-drills-2024"}
-                    ]
-                },
-                "Traveling": {
-                    "Adventure": [
-                        {"title": "Lonely Planet Adventure Travel Guide", "type": "Website", "link": "https://www.lonelyplanet.com/"},
-                        {"title": "Best Adventure Travel Destinations", "type": "Article", "link": "https://www.nationalgeographic.com/adventure/travel"},
-                        {"title": "Top Adventure Travel Spots 2024", "type": "Article", "link": "https://www.travelandleisure.com/top-adventure-travel-spots-2024"}
-                    ],
-                    "Cultural": [
-                        {"title": "Cultural Travel Guide", "type": "Website", "link": "https://www.culturaltravelguide.com/"},
-                        {"title": "UNESCO World Heritage Sites", "type": "Website", "link": "https://whc.unesco.org/"},
-                        {"title": "Top Cultural Destinations 2024", "type": "Article", "link": "https://www.cntraveler.com/top-cultural-destinations-2024"}
-                    ],
-                    "Beach": [
-                        {"title": "Top Beach Destinations", "type": "Website", "link": "https://www.travelchannel.com/interests/beaches/articles/top-beach-destinations"},
-                        {"title": "Beach Travel Tips", "type": "Article", "link": "https://www.travelandleisure.com/travel-tips/beach"},
-                        {"title": "Best Beaches 2024", "type": "Article", "link": "https://www.tripadvisor.com/best-beaches-2024"}
-                    ],
-                    "Mountain": [
-                        {"title": "Mountain Travel Guide", "type": "Website", "link": "https://www.backpacker.com/"},
-                        {"title": "Best Hiking Trails in the World", "type": "Article", "link": "https://www.nationalgeographic.com/adventure/adventures/best-hikes/"},
-                        {"title": "Top Mountain Destinations 2024", "type": "Article", "link": "https://www.outsideonline.com/top-mountain-destinations-2024"}
-                    ],
-                    "City": [
-                        {"title": "Top City Destinations", "type": "Website", "link": "https://www.cntraveler.com/galleries/2015-09-08/world-s-best-cities"},
-                        {"title": "City Travel Tips", "type": "Article", "link": "https://www.thetravel.com/best-city-travel-tips/"},
-                        {"title": "Best Cities to Visit 2024", "type": "Article", "link": "https://www.lonelyplanet.com/best-cities-to-visit-2024"}
-                    ]
-                }
-            }.get(st.session_state.user_data["main_field"], {}).get(st.session_state.user_data["sub_field"], [])
-
-            # Filter resources
-            filtered_resources = [r for r in resources if search_query.lower() in r['title'].lower()]
+            with profiler.section("resource_lookup"):
+                # Resources Database
+                resources = catalog.resources_for(
+                    st.session_state.user_data["main_field"],
+                    st.session_state.user_data["sub_field"]
+                )
+
+                # Filter resources: a query searches the whole catalog, otherwise show the selected sub-field
+                if search_query.strip():
+                    filtered_resources = [resource for _, _, resource in catalog.search(search_query)]
+                    if not filtered_resources:
+                        st.info(t("No resources match your search."))
+                else:
+                    filtered_resources = resources
+                if DEAD_LINKS == "hide":
+                    dead = link_health()[1]
+                    filtered_resources = [r for r in filtered_resources if r['link'] not in dead]
+
+            if not search_query.strip():
+                render_recommendations(catalog, resources)
 
             # Display Resources
-            for resource in filtered_resources:
-                with st.container():
-                    st.markdown(f"<div class='resource-card'>", unsafe_allow_html=True)
-                    st.markdown(f"### [{resource['title']}]({resource['link']})")
-                    st.markdown(f"**Type:** {resource['type']}")
-                    
-                    # Favorites
-                    col1, col2 = st.columns([1,3])
-                    with col1:
-                        if st.button(f"⭐ Add to Favorites", key=f"fav_{resource['title']}"):
-                            if resource not in st.session_state.favorites:
-                                st.session_state.favorites.append(resource)
-                    
-                    # Reviews
-                    with st.expander("💬 Add Review"):
-                        review = st.text_area("Your review:", key=f"review_{resource['title']}")
-                        if st.button("Submit Review", key=f"submit_{resource['title']}"):
-                            if resource['title'] not in st.session_state.reviews:
-                                st.session_state.reviews[resource['title']] = []
-                            st.session_state.reviews[resource['title']].append(review)
-                            
-                            # Ask user if they want to send the review via email
-                            send_to_email = st.checkbox("Send this review to the admin via email", key=f"email_checkbox_{resource['title']}")
-                            if send_to_email:
-                                user_email = st.text_input("Enter your email (optional):", key=f"user_email_{resource['title']}")
-                                if send_email(review, user_email):
-                                    st.success("Review submitted and email sent successfully!")
-                                else:
-                                    st.error("Failed to send email. Please try again.")
-                        
-                        if resource['title'] in st.session_state.reviews:
-                            st.markdown("### User Reviews")
-                            for idx, rev in enumerate(st.session_state.reviews[resource['title']], 1):
-                                st.markdown(f"<div class='review-section'>📝 Review {idx}: {rev}</div>", unsafe_allow_html=True)
-                    
-                    st.markdown("</div>", unsafe_allow_html=True)
-
-            # Favorites Section
-            with st.expander("❤️ My Favorites"):
-                if st.session_state.favorites:
-                    for fav in st.session_state.favorites:
-                        st.markdown(f"### {fav['title']}")
-                        st.markdown(f"Type: {fav['type']}")
+            with profiler.section("resource_render"):
+                if CARD_MODE == "classic":
+                    render_resources_classic(filtered_resources)
                 else:
-                    st.write("No favorites yet!")
+                    render_resources_html(catalog, search_query.strip().lower(), filtered_resources)
+
+            favorites_panel()
 
         # PDF Report Generation
         st.markdown("<div class='section-spacing'></div>", unsafe_allow_html=True)
-        st.markdown("<div class='big-font'>📄 Download Progress Report</div>", unsafe_allow_html=True)
+        st.markdown(f"<div class='big-font'>{t('📄 Download Progress Report')}</div>", unsafe_allow_html=True)
         
-        if st.button("📥 Download PDF Report"):
-            buffer = io.BytesIO()
-            c = canvas.Canvas(buffer, pagesize=letter)
-            c.drawString(100, 750, "Learning Path Report")
-            y = 730
-            for key, value in st.session_state.user_data.items():
-                if isinstance(value, list):
-                    c.drawString(100, y, f"{key}:")
-                    y -= 20
-                    for item in value:
-                        c.drawString(120, y, f"- {item}")
-                        y -= 20
-                else:
-                    c.drawString(100, y, f"{key}: {value}")
-                    y -= 20
-            c.save()
-            buffer.seek(0)
+        if st.button(t("📥 Download PDF Report")):
             st.download_button(
-                label="Download PDF",
-                data=buffer,
+                label=t("Download PDF"),
+                data=build_report_pdf(),
                 file_name="learning_path_report.pdf",
                 mime="application/pdf"
             )
 
-    # Footer
-    st.markdown("<div class='medium-font footer'>© 2024 Learning Path Creator. All rights reserved.</div>", unsafe_allow_html=True)
+# Upload/download of saved paths as JSON Lines or CSV (see bulk.py)
+def bulk_panel():
+    with st.expander(t("📦 Import / Export")):
+        fmt = st.radio(t("Format:"), ("jsonl", "csv"), horizontal=True, format_func=str.upper)
+        mime = "text/csv" if fmt == "csv" else "application/jsonl"
+        st.download_button(
+            t("⬇️ Export my path"),
+            "".join(write_records([(st.session_state.user_id, saved_path_payload())], fmt)),
+            file_name=f"learning_path.{fmt}",
+            mime=mime,
+        )
+        if BULK_ADMIN and st.button(t("Prepare export of all saved paths")):
+            st.download_button(
+                t("⬇️ Download all paths"),
+                "".join(write_records(get_path_store().iter_all(), fmt)),
+                file_name=f"learning_paths.{fmt}",
+                mime=mime,
+            )
+
+        # Admins import paths for any user; everyone else can only restore their own path
+        uploaded = st.file_uploader(t("Import paths:") if BULK_ADMIN else t("Import my path:"), type=["jsonl", "json", "csv"])
+        if uploaded is not None and st.button(t("⬆️ Import")):
+            # Parsed line by line straight from the upload, never read whole
+            parsed = read_records(uploaded, format_for(uploaded.name))
+            if BULK_ADMIN:
+                summary = import_records(parsed, get_path_store())
+            else:
+                summary = import_records(parsed, get_path_store(), user_id=st.session_state.user_id, limit=1)
+            st.success(t("Imported {count} path(s).", count=summary['imported']))
+            if summary["failed"]:
+                st.warning(t("{count} line(s) rejected.", count=summary['failed']))
+                st.dataframe(
+                    [{"line": line, "error": error} for line, error in summary["errors"]],
+                    hide_index=True,
+                )
+            if summary["imported"]:
+                st.caption(t("Use 📂 Load Saved Path to open an imported path for your user id."))
+
+# "1" also shows everyone who profiles the process-wide timings and submission metrics
+# and every session's memory, and lets them reset the timings
+PROFILE_ADMIN = os.environ.get("LPC_PROFILE_ADMIN") == "1"
+
+# This session's own section timings, kept while profiling is on
+def session_timings():
+    if not (profiler.ENABLED or st.session_state.get("profile")):
+        return None
+    return st.session_state.setdefault("profile_timings", profiler.Registry())
+
+# Section timings, shown when profiling is on (LPC_PROFILE=1 or ?profile=1). Without
+# LPC_PROFILE_ADMIN a visitor only sees their own session.
+def show_profiler_panel():
+    if not profiler.is_enabled():
+        return
+    with st.sidebar.expander("📈 Performance"):
+        st.caption("This session:")
+        st.dataframe(session_timings().summary(), hide_index=True)
+        if PROFILE_ADMIN:
+            st.caption("All sessions in this process:")
+            st.dataframe(profiler.REGISTRY.summary(), hide_index=True)
+            guard = get_submission_guard()
+            st.caption("Feedback and review submissions:")
+            st.dataframe(guard.summary(), hide_index=True)
+            metrics = profiler.REGISTRY.prometheus_text() + guard.prometheus_text()
+            st.download_button("Download metrics", metrics, file_name="metrics.prom", mime="text/plain")
+            with st.popover("Prometheus text"):
+                st.code(metrics, language=None)
+            if st.button("Reset timings"):
+                profiler.REGISTRY.reset()
+    with st.sidebar.expander("🧠 Session memory"):
+        sizes = footprint(get_script_run_ctx().session_state)
+        st.caption(f"This session: {sum(sizes.values()) / 1024:.1f} KiB")
+        st.dataframe(
+            [{"key": key, "kib": round(size / 1024, 2)} for key, size in sizes.items()],
+            hide_index=True,
+        )
+        if PROFILE_ADMIN:
+            st.caption("All sessions in this process (sizes from the last sweep):")
+            st.dataframe(get_session_registry().report(), hide_index=True)
 
 # Main function to run the app
 def main():
+    _run_locale.ctx = None
     initialize_session_states()
     configure_page()
-    apply_custom_css()
-    show_onboarding_tutorial()
-    main_app()
+    # Kept in the session so fragment reruns, which skip main(), are profiled too
+    st.session_state.profile = st.query_params.get("profile") == "1"
+    profiler.enable_for_run(st.session_state.profile, session_timings())
+    with profiler.section("rerun"):
+        apply_custom_css()
+        language_picker()
+        show_onboarding_tutorial()
+        main_app()
+    show_profiler_panel()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""Build the app's static stylesheet.
+
+The theme is written in assets/theme.css. Building minifies it into
+static/theme.<hash>.min.css, which Streamlit serves at app/static/ when
+`server.enableStaticServing` is on (see .streamlit/config.toml). The hash in
+the file name changes with the content, so browsers can cache each build for
+good and only fetch a new one after the theme changes.
+
+Usage: python assets.py
+"""
+import glob
+import hashlib
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+THEME_SOURCE = os.path.join(ROOT, "assets", "theme.css")
+STATIC_DIR = os.path.join(ROOT, "static")
+# URL Streamlit serves STATIC_DIR under
+STATIC_URL = "app/static"
+
+_CSS_STRING = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""")
+
+
+# Strip comments and redundant whitespace, leaving quoted strings untouched
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    parts = _CSS_STRING.split(css)
+    for i in range(0, len(parts), 2):  # even parts are outside strings
+        part = re.sub(r"\s+", " ", parts[i])
+        part = re.sub(r"\s*([{};,>])\s*", r"\1", part)
+        part = re.sub(r":\s+", ":", part)  # not before ':', "a :hover" differs from "a:hover"
+        parts[i] = part.replace(";}", "}")
+    return "".join(parts).strip()
+
+
+def asset_name(minified):
+    digest = hashlib.sha256(minified.encode("utf-8")).hexdigest()[:12]
+    return f"theme.{digest}.min.css"
+
+
+def read_theme(source=THEME_SOURCE):
+    with open(source, encoding="utf-8") as f:
+        return minify_css(f.read())
+
+
+# Write the hashed stylesheet into out_dir, removing older builds; returns its path
+def build(source=THEME_SOURCE, out_dir=STATIC_DIR):
+    minified = read_theme(source)
+    name = asset_name(minified)
+    os.makedirs(out_dir, exist_ok=True)
+    for old in glob.glob(os.path.join(out_dir, "theme.*.min.css")):
+        if os.path.basename(old) != name:
+            os.remove(old)
+    path = os.path.join(out_dir, name)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(minified)
+    return path
+
+
+# HTML that applies the theme: a <link> to the built asset when it is current,
+# otherwise (not built yet, or static serving off) the minified CSS inline
+def stylesheet_html(source=THEME_SOURCE, static_dir=STATIC_DIR, inline=False):
+    minified = read_theme(source)
+    name = asset_name(minified)
+    if inline or not os.path.exists(os.path.join(static_dir, name)):
+        return f"<style>{minified}</style>"
+    # Tornado's static handler sends a long max-age for requests carrying ?v=
+    version = name.split(".")[1]
+    return f'<link rel="stylesheet" href="{STATIC_URL}/{name}?v={version}">'
+
+
+def main():
+    path = build()
+    print(f"Wrote {os.path.relpath(path, ROOT)} ({os.path.getsize(path)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""Render PDF reports for many saved learning paths at once.
+
+Usage:
+    python batch_reports.py saved_paths/ --out reports.zip
+    python batch_reports.py --db user_data.db --out reports/ --workers 8
+"""
+import argparse
+import collections
+import csv
+import io
+import itertools
+import json
+import os
+import re
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from catalog import CATALOG_PATH, load_catalog
+from report import expand_resource_ids, render_pdf
+
+
+# Yield (file path, data) for each saved path in the given JSON files / directories. A
+# file that cannot be read or is not a JSON object is reported and yielded with data None.
+def iter_json_sources(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            files = sorted(
+                os.path.join(path, name) for name in os.listdir(path) if name.endswith(".json")
+            )
+        else:
+            files = [path]
+        for file_path in files:
+            try:
+                with open(file_path, encoding="utf-8") as f:
+                    data = json.load(f)
+                if not isinstance(data, dict):
+                    raise ValueError("not a JSON object")
+            except (OSError, ValueError) as e:
+                print(f"{file_path}: {type(e).__name__}: {e}", file=sys.stderr)
+                data = None
+            yield file_path, data
+
+
+# Yield (user_id, data) for every path saved in the SQLite store, which is only read
+def iter_db_source(db_path):
+    from store import iter_saved_paths
+
+    yield from iter_saved_paths(db_path, read_only=True)
+
+
+def safe_name(name):
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", name) or "report"
+
+
+# Worker entry point: runs in a child process, so it only takes and returns plain data
+def render_one(item):
+    name, data = item
+    buffer = io.BytesIO()
+    try:
+        render_pdf(data, buffer)
+    except Exception as e:
+        return name, None, f"{type(e).__name__}: {e}"
+    return name, buffer.getvalue(), None
+
+
+def render_chunk(items):
+    return [render_one(item) for item in items]
+
+
+# Lists of up to `size` consecutive items
+def _chunks(items, size):
+    items = iter(items)
+    while chunk := list(itertools.islice(items, size)):
+        yield chunk
+
+
+# Report file name for a source: a JSON file's name without directory and extension,
+# or a user id, made safe for any file system
+def report_stem(source):
+    if source.endswith(".json"):
+        source = os.path.splitext(os.path.basename(source))[0]
+    return safe_name(source)
+
+
+# Writes reports either into a zip archive or a directory, with a manifest.csv that maps
+# every source to its report. Names that collide (the same file name in two directories,
+# or "a b" and "a_b") get a -2, -3, ... suffix.
+class _Output:
+    MANIFEST = "manifest.csv"
+
+    def __init__(self, target):
+        if target.endswith(".zip"):
+            self._zip = zipfile.ZipFile(target, "w", compression=zipfile.ZIP_STORED)
+        else:
+            self._zip = None
+            os.makedirs(target, exist_ok=True)
+        self.target = target
+        self._taken = set()
+        self._manifest = io.StringIO()
+        self._manifest_writer = csv.writer(self._manifest)
+        self._manifest_writer.writerow(("source", "report"))
+        self.renamed = 0
+
+    def write(self, source, pdf):
+        stem = report_stem(source)
+        file_name, n = f"{stem}.pdf", 1
+        # Case-insensitive, so reports never overwrite each other on macOS or Windows either
+        while file_name.lower() in self._taken:
+            n += 1
+            file_name = f"{stem}-{n}.pdf"
+        self._taken.add(file_name.lower())
+        self.renamed += n > 1
+        self._manifest_writer.writerow((source, file_name))
+        self._write_file(file_name, pdf)
+
+    def _write_file(self, file_name, content):
+        if self._zip is not None:
+            self._zip.writestr(file_name, content)
+        else:
+            with open(os.path.join(self.target, file_name), "wb") as f:
+                f.write(content)
+
+    def close(self):
+        self._write_file(self.MANIFEST, self._manifest.getvalue().encode("utf-8"))
+        if self._zip is not None:
+            self._zip.close()
+
+
+# Chunks are submitted in a bounded window, two per worker, so a large store is read
+# only as fast as reports are rendered instead of being queued in memory up front
+def run(items, out, workers=None, chunksize=8):
+    workers = workers or os.cpu_count() or 1
+    output = _Output(out)
+    stats = {"rendered": 0, "failed": 0, "bytes": 0}
+    started = time.perf_counter()
+
+    def collect(future):
+        for name, pdf, error in future.result():
+            if error:
+                stats["failed"] += 1
+                print(f"{name}: {error}", file=sys.stderr)
+                continue
+            output.write(name, pdf)
+            stats["rendered"] += 1
+            stats["bytes"] += len(pdf)
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = collections.deque()
+            for chunk in _chunks(items, chunksize):
+                # Unreadable sources were reported as they were read
+                stats["failed"] += sum(1 for name, data in chunk if data is None)
+                pending.append(executor.submit(render_chunk, [item for item in chunk if item[1] is not None]))
+                if len(pending) >= 2 * workers:
+                    collect(pending.popleft())
+            while pending:
+                collect(pending.popleft())
+    finally:
+        output.close()
+    elapsed = time.perf_counter() - started
+    return {
+        "renamed": output.renamed,
+        "rendered": stats["rendered"],
+        "failed": stats["failed"],
+        "seconds": elapsed,
+        "reports_per_second": stats["rendered"] / elapsed if elapsed else 0.0,
+        "bytes": stats["bytes"],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render PDF reports for saved learning paths.")
+    parser.add_argument("sources", nargs="*", help="saved-path JSON files or directories of them")
+    parser.add_argument("--db", help="read saved paths from this SQLite store instead")
+    parser.add_argument("--catalog", default=CATALOG_PATH, help="resource catalog used to resolve favorites")
+    parser.add_argument("--out", required=True, help="output directory, or a .zip file")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=8, help="reports handed to a worker at a time")
+    args = parser.parse_args(argv)
+
+    if bool(args.db) == bool(args.sources):
+        parser.error("give either JSON sources or --db")
+    if args.db and not os.path.isfile(args.db):
+        parser.error(f"no such database: {args.db}")
+    items = iter_db_source(args.db) if args.db else iter_json_sources(args.sources)
+    # Favorites and reviews are saved as catalog ids; resolve them before handing off to workers
+    by_id = load_catalog(args.catalog).by_id
+    items = ((name, data if data is None else expand_resource_ids(data, by_id)) for name, data in items)
+
+    stats = run(items, args.out, workers=args.workers, chunksize=args.chunksize)
+    print(
+        f"Rendered {stats['rendered']} reports ({stats['failed']} failed) in {stats['seconds']:.2f}s "
+        f"- {stats['reports_per_second']:.1f} reports/s, {stats['bytes'] / 1024:.0f} KiB -> {args.out}"
+    )
+    if stats["renamed"]:
+        print(f"{stats['renamed']} reports were renamed to keep names unique; see {_Output.MANIFEST}")
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
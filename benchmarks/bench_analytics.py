@@ -0,0 +1,80 @@
+"""Ingest cost of analytics events and dashboard read time as events pile up.
+
+Records synthetic inputs, favorite and feedback events in batches, then times
+the queries the analytics page runs. Dashboard reads only touch the rollup
+tables, so they should take the same time at every event count.
+
+Usage: python benchmarks/bench_analytics.py [--events 10000 100000 300000] [--users N]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import common  # noqa: F401  (puts the app on sys.path)
+from analytics import AnalyticsStore
+
+FIELDS = {f"field {f}": [f"sub {s}" for s in range(8)] for f in range(12)}
+GOALS = [f"goal {g}" for g in range(10)]
+
+
+def synthetic_events(rng, count, users, resources, start):
+    fields = list(FIELDS)
+    for i in range(count):
+        user_id = f"user-{rng.randrange(users)}"
+        created_at = start + i * 30.0  # one event every 30 s, spread over many days
+        kind = rng.choices(("inputs", "favorite", "feedback"), (5, 4, 1))[0]
+        if kind == "inputs":
+            main_field = rng.choice(fields)
+            payload = {
+                "interests": rng.sample(fields, 3), "main_field": main_field,
+                "sub_field": rng.choice(FIELDS[main_field]), "goal": rng.choice(GOALS),
+            }
+        elif kind == "favorite":
+            payload = {"resource_id": f"res-{rng.randrange(resources)}"}
+        else:
+            payload = {"rating": rng.randint(1, 5)}
+        yield kind, user_id, payload, created_at
+
+
+# The same reads as pages/Analytics.py
+def read_dashboard(store):
+    store.totals()
+    for dimension in ("main_field", "sub_field", "goal", "interest", "favorite"):
+        store.top(dimension, 15)
+    store.daily_ratings(90)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, nargs="+", default=[10_000, 100_000, 300_000])
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--resources", type=int, default=2_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--reads", type=int, default=200)
+    args = parser.parse_args()
+
+    store = AnalyticsStore(os.path.join(tempfile.mkdtemp(prefix="lpc-analytics-"), "user_data.db"))
+    rng = random.Random(0)
+    recorded = 0
+    start = time.time() - 120 * 86400
+    print(f"{'events':>8} {'ingest/s':>10} {'dashboard ms':>13}")
+    for target in sorted(args.events):
+        events = list(synthetic_events(rng, target - recorded, args.users, args.resources, start + recorded * 30.0))
+        started = time.perf_counter()
+        for i in range(0, len(events), args.batch_size):
+            store.record_many(events[i:i + args.batch_size])
+        ingest_rate = len(events) / max(time.perf_counter() - started, 1e-9)
+        recorded = target
+
+        read_dashboard(store)  # warm the connection and page cache
+        started = time.perf_counter()
+        for _ in range(args.reads):
+            read_dashboard(store)
+        read_ms = (time.perf_counter() - started) / args.reads * 1000
+        print(f"{recorded:>8} {ingest_rate:>10.0f} {read_ms:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
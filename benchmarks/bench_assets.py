@@ -0,0 +1,51 @@
+"""Bytes sent per rerun with the theme inlined versus linked as a static asset.
+
+Inline mode (LPC_STATIC_CSS=0) sends the whole stylesheet in a <style> block on
+every rerun; static mode sends one <link> to static/theme.<hash>.min.css, which
+the browser fetches once and then serves from its cache.
+
+Usage: python benchmarks/bench_assets.py
+"""
+import os
+import sys
+
+from common import ROOT, element_stats, make_app, onboard
+
+from assets import asset_name, read_theme  # common puts the app on sys.path
+
+
+# Serialized size of the delta that carries the theme (the first markdown element)
+def theme_bytes(at):
+    element = next(e for e in at.markdown if "<style>" in e.value or "<link" in e.value)
+    return element.proto.ByteSize()
+
+
+def measure(static):
+    results = {}
+    at = make_app(LPC_STATIC_CSS="1" if static else "0")
+    at.run()
+    results["tutorial"] = element_stats(at) + (theme_bytes(at),)
+    onboard_at = onboard(make_app(LPC_STATIC_CSS="1" if static else "0"))
+    results["main page"] = element_stats(onboard_at) + (theme_bytes(onboard_at),)
+    return results
+
+
+def main():
+    name = asset_name(read_theme())
+    if not os.path.exists(os.path.join(ROOT, "static", name)):
+        print(f"static/{name} is missing; run `python assets.py` first")
+        return 1
+
+    inline, static = measure(False), measure(True)
+    print(f"{'page':<10} {'mode':<7} {'elements':>9} {'bytes/rerun':>12} {'theme bytes':>12}")
+    for page in inline:
+        for mode, results in (("inline", inline), ("static", static)):
+            elements, size, theme = results[page]
+            print(f"{page:<10} {mode:<7} {elements:>9} {size:>12} {theme:>12}")
+        saved = inline[page][1] - static[page][1]
+        print(f"{page:<10} saved {saved} bytes per rerun ({saved / inline[page][1]:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
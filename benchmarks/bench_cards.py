@@ -0,0 +1,33 @@
+"""Compare element deltas and rerun time of the classic and prebuilt-HTML card modes.
+
+Usage: python benchmarks/bench_cards.py [--repeat N]
+"""
+import argparse
+
+from common import element_stats, make_app, onboard, summarize, time_reruns
+
+
+def measure(mode, sub_field, repeat):
+    at = onboard(make_app(LPC_CARD_MODE=mode), sub_field=sub_field)
+    samples = time_reruns(at.run, repeat)
+    count, size = element_stats(at)
+    return dict(summarize(samples), elements=count, bytes=size)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'sub-field':<10} {'mode':<8} {'elements':>9} {'bytes':>8} {'mean ms':>8} {'p50 ms':>8}")
+    for sub_field in ("Python", "AI/ML"):
+        for mode in ("classic", "html"):
+            r = measure(mode, sub_field, args.repeat)
+            print(
+                f"{sub_field:<10} {mode:<8} {r['elements']:>9} {r['bytes']:>8} "
+                f"{r['mean_ms']:>8.1f} {r['p50_ms']:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
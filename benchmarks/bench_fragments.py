@@ -0,0 +1,62 @@
+"""Rerun cost of a widget interaction before and after fragment isolation.
+
+Before fragments every interaction reran the whole script; now an interaction
+inside the learning path editor, the resource controls or the favorites panel
+reruns only that fragment. AppTest always executes full script runs, so the
+fragment cost is measured by running each fragment on its own against the
+same session state.
+
+Usage: python benchmarks/bench_fragments.py [--repeat N] [--steps N]
+"""
+import argparse
+
+from common import AppTest, make_app, onboard, summarize, time_reruns
+from steps import StepList  # common puts the app on sys.path
+
+SESSION_KEYS = ("steps", "favorites", "reviews", "user_data", "user_id", "show_tutorial")
+
+
+# Runs a single panel of the app, exactly as its fragment rerun would
+def fragment_script(panel):
+    import streamlit as st
+
+    import app
+    from catalog import get_catalog
+
+    if panel == "learning_path_editor":
+        app.learning_path_editor()
+    elif panel == "resource_actions":
+        data = st.session_state.user_data
+        app.resource_actions(list(get_catalog().resources_for(data["main_field"], data["sub_field"])))
+    elif panel == "favorites_panel":
+        app.favorites_panel()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--steps", type=int, default=50, help="length of the learning path")
+    args = parser.parse_args()
+
+    full = onboard(make_app())
+    full.session_state["steps"] = StepList(f"Step number {i}" for i in range(args.steps))
+    full.run()
+    state = {key: full.session_state[key] for key in SESSION_KEYS}
+
+    before = summarize(time_reruns(full.run, args.repeat))
+    print(f"{'full script rerun (before)':<40} p50 {before['p50_ms']:7.1f} ms  mean {before['mean_ms']:7.1f} ms")
+    for panel in ("learning_path_editor", "resource_actions", "favorites_panel"):
+        at = AppTest.from_function(fragment_script, args=(panel,), default_timeout=60)
+        for key, value in state.items():
+            at.session_state[key] = value
+        at.run()
+        assert not at.exception, at.exception
+        after = summarize(time_reruns(at.run, args.repeat))
+        print(
+            f"{panel + ' fragment (after)':<40} p50 {after['p50_ms']:7.1f} ms  mean {after['mean_ms']:7.1f} ms"
+            f"  ({before['p50_ms'] / after['p50_ms']:.1f}x faster)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Cold-start import benchmark for app.py, based on `python -X importtime`.
+
+Streamlit is imported first so the numbers isolate what app.py itself adds to
+a cold start. The run fails when that exceeds the budget, or when a module that
+should only load on first use (PDF, email, data frames, recommendations) is imported eagerly.
+
+Usage: python benchmarks/bench_import.py [--runs N] [--budget-ms MS]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Budget for the time app.py adds on top of importing streamlit
+BUDGET_MS = 80
+# Modules that must only be imported when their feature is first used
+LAZY_MODULES = ("reportlab", "smtplib", "email.mime", "pandas", "numpy", "mailer", "report", "recommend")
+
+LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+
+
+# One cold interpreter: returns [(module, cumulative_us, depth)] for modules app.py pulled in
+def measure_once():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import streamlit; import app"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    entries = []
+    after_streamlit = False
+    for line in result.stderr.splitlines():
+        match = LINE_RE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, module = match.groups()
+        if not after_streamlit:
+            after_streamlit = module == "streamlit" and not indent
+            continue
+        entries.append((module, int(cumulative), len(indent) // 2))
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    args = parser.parse_args()
+
+    runs = [measure_once() for _ in range(args.runs)]
+    app_ms = statistics.median(
+        next(us for module, us, depth in entries if module == "app" and depth == 0) / 1000
+        for entries in runs
+    )
+
+    print(f"app.py import on top of streamlit: {app_ms:.1f} ms (median of {args.runs}, budget {args.budget_ms:.0f} ms)")
+    print("Slowest direct imports:")
+    direct = sorted((e for e in runs[-1] if e[2] == 1), key=lambda e: -e[1])
+    for module, us, _ in direct[:10]:
+        print(f"  {module:<24} {us / 1000:7.1f} ms")
+
+    eager = sorted({
+        module for module, _, _ in runs[-1]
+        if any(module == lazy or module.startswith(lazy + ".") for lazy in LAZY_MODULES)
+    })
+    failed = False
+    if eager:
+        failed = True
+        print(f"FAIL: imported eagerly, should load on first use: {', '.join(eager)}")
+    if app_ms > args.budget_ms:
+        failed = True
+        print(f"FAIL: import time {app_ms:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
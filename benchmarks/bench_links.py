@@ -0,0 +1,137 @@
+"""Link audit against a local stand-in HTTP server (no internet needed).
+
+The server answers like real sites do: working pages, 404/410 pages, hosts
+that reject HEAD, and pages slower than the timeout. It also records how many
+requests were in flight at once. The script checks that each URL is classified
+correctly and that the per-host limit is respected. It also times a serial and a
+concurrent audit, and round-trips the results through the SQLite status store.
+
+Usage: python benchmarks/bench_links.py [--urls N] [--latency-ms MS]
+"""
+import argparse
+import asyncio
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import common  # noqa: F401  (puts the app on sys.path)
+from linkcheck import LinkStatusStore, check_links
+
+
+class StandIn(BaseHTTPRequestHandler):
+    latency = 0.0
+    timeout_path_delay = 2.0
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def _answer(self, body):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            time.sleep(self.timeout_path_delay if self.path.startswith("/slow") else self.latency)
+            if self.path.startswith("/gone"):
+                status = 404
+            elif self.path.startswith("/removed"):
+                status = 410
+            elif self.path.startswith("/nohead") and self.command == "HEAD":
+                status = 405
+            elif self.path.startswith("/moved"):
+                self.send_response(301)
+                self.send_header("Location", "/ok")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            else:
+                status = 200
+            self.send_response(status)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            if body:
+                self.wfile.write(b"ok")
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the checker gave up on a slow page
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def do_HEAD(self):
+        self._answer(False)
+
+    def do_GET(self):
+        self._answer(True)
+
+    def log_message(self, *args):
+        pass
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--urls", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    args = parser.parse_args()
+
+    StandIn.latency = args.latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    expected = {
+        f"{base}/ok": "ok",
+        f"{base}/moved": "ok",
+        f"{base}/nohead": "ok",
+        f"{base}/gone": "dead",
+        f"{base}/removed": "dead",
+        f"{base}/slow": "unknown",
+        f"http://127.0.0.1:{free_port()}/refused": "dead",
+    }
+    results = asyncio.run(check_links(list(expected), timeout=0.5))
+    failures = [
+        f"{url}: expected {expected[url]}, got {state} ({status} {error})"
+        for url, state, status, error, _ in results
+        if state != expected[url]
+    ]
+
+    # Throughput: one host, many pages
+    urls = [f"{base}/ok/{i}" for i in range(args.urls)]
+    timings = {}
+    for label, concurrency, per_host in (("serial", 1, 1), ("concurrent", 32, 8)):
+        while StandIn.in_flight:  # let the slow page from the checks above finish
+            time.sleep(0.05)
+        StandIn.max_in_flight = 0
+        started = time.perf_counter()
+        asyncio.run(check_links(urls, concurrency=concurrency, per_host=per_host, timeout=5))
+        timings[label] = time.perf_counter() - started
+        if StandIn.max_in_flight > per_host:
+            failures.append(f"{label}: {StandIn.max_in_flight} requests in flight, per-host limit {per_host}")
+        print(f"{label:<11} {args.urls} links in {timings[label]:.2f}s (max {StandIn.max_in_flight} in flight per host)")
+    print(f"speedup: {timings['serial'] / timings['concurrent']:.1f}x")
+
+    # Results survive a round trip through the status store the app reads
+    store = LinkStatusStore(os.path.join(tempfile.mkdtemp(prefix="lpc-links-"), "links.db"))
+    store.save_many(results)
+    _, dead = store.dead_links()
+    if dead != {url for url, state in expected.items() if state == "dead"}:
+        failures.append(f"stored dead links differ: {sorted(dead)}")
+
+    server.shutdown()
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""Rerun cost with many locale bundles loaded, and the one-off cost of a locale.
+
+Each configuration runs in its own process with LPC_LOCALES_PATH pointing at a
+directory of synthetic bundles that translate every UI string, field, type,
+goal, step and resource title. A session is onboarded, then visits every locale
+once to warm the per-locale catalog and templates. The processes then take
+turns timing reruns, so machine noise hits them alike: staying on one locale,
+and switching ?lang= on every rerun. With the per-locale builds cached, neither
+should cost more than English alone.
+
+Usage: python benchmarks/bench_locales.py [--locales 0 1 10] [--repeat N]
+"""
+import argparse
+import contextlib
+import glob
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import ROOT, make_app, onboard, summarize, time_reruns
+
+CONFIG_FLAG = "--run-config"
+
+
+# One synthetic bundle per code, with every entry the app could look up translated
+def write_bundles(path, count):
+    from catalog import get_catalog
+    from locales import source_strings
+    from templates import TEMPLATES_PATH
+
+    catalog = get_catalog()
+    strings = source_strings(os.path.join(ROOT, "app.py"))
+    names = {name for main, subs in catalog.fields.items() for name in (main, *subs)}
+    types = {resource["type"] for resource in catalog.by_id.values()}
+    templates = []
+    for file_path in glob.glob(os.path.join(TEMPLATES_PATH, "*.json")):
+        with open(file_path, encoding="utf-8") as f:
+            templates.extend(json.load(f)["templates"])
+    goals = {template["goal"] for template in templates}
+    steps = {step for template in templates for step in template["steps"]}
+    for i in range(count):
+        code = f"x{i:02d}"
+        bundle = {"version": 1, "name": f"Locale {i:02d}"}
+        for section, entries in (("strings", strings), ("fields", names), ("types", types), ("goals", goals), ("steps", steps)):
+            bundle[section] = {text: f"[{code}] {text}" for text in entries}
+        bundle["titles"] = {resource_id: f"[{code}] {resource['title']}" for resource_id, resource in catalog.by_id.items()}
+        with open(os.path.join(path, f"{code}.json"), "w", encoding="utf-8") as f:
+            json.dump(bundle, f, ensure_ascii=False)
+
+
+# Runs inside the child process, after LPC_LOCALES_PATH is set. Reports the load
+# and build costs, then times one rerun per command read from stdin.
+def serve_config():
+    from catalog import get_catalog
+    from locales import LOCALES_PATH, load_locales
+    from templates import get_templates
+
+    started = time.perf_counter()
+    locales = load_locales(LOCALES_PATH)
+    load_ms = (time.perf_counter() - started) * 1000
+
+    # The one-off build of a locale's catalog (with its search index) and templates
+    build_ms = []
+    for locale in locales.values():
+        if locale.etag:
+            started = time.perf_counter()
+            get_catalog().localized(locale)
+            get_templates().localized(locale)
+            build_ms.append((time.perf_counter() - started) * 1000)
+
+    at = onboard(make_app())
+    codes = sorted(locales)
+    for code in codes:
+        at.query_params["lang"] = code
+        at.run()
+        assert not at.exception, at.exception
+    at.query_params["lang"] = codes[-1]
+    at.run()
+    cycle = iter(range(10**9))
+
+    def switch():
+        at.query_params["lang"] = codes[next(cycle) % len(codes)]
+        at.run()
+    actions = {"same": at.run, "switching": switch}
+
+    print(json.dumps({"locales": len(codes), "load_ms": load_ms,
+                      "build_ms": sum(build_ms) / len(build_ms) if build_ms else 0.0}), flush=True)
+    for line in sys.stdin:
+        print(time_reruns(actions[line.strip()], 1)[0], flush=True)
+
+
+# One worker process per bundle count, each with its own warmed session
+class Worker:
+    def __init__(self, count, path):
+        write_bundles(path, count)
+        self.count = count
+        self.process = subprocess.Popen(
+            [sys.executable, __file__, CONFIG_FLAG], env=dict(os.environ, LPC_LOCALES_PATH=path),
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        )
+        self.info = json.loads(self.process.stdout.readline())
+        self.samples = {"same": [], "switching": []}
+
+    def rerun(self, action):
+        self.process.stdin.write(action + "\n")
+        self.process.stdin.flush()
+        self.samples[action].append(float(self.process.stdout.readline()))
+
+    def close(self):
+        self.process.stdin.close()
+        self.process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--locales", type=int, nargs="+", default=[0, 1, 10], help="bundle counts to compare")
+    parser.add_argument("--repeat", type=int, default=60)
+    parser.add_argument(CONFIG_FLAG, action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_config:
+        serve_config()
+        return 0
+
+    with contextlib.ExitStack() as stack:
+        workers = []
+        for count in args.locales:
+            workers.append(Worker(count, stack.enter_context(tempfile.TemporaryDirectory(prefix="lpc-locales-"))))
+            stack.callback(workers[-1].close)
+        # Workers take turns, in alternating order, so machine noise hits every configuration alike
+        for i in range(args.repeat):
+            for action in ("same", "switching"):
+                for worker in workers if i % 2 else reversed(workers):
+                    worker.rerun(action)
+
+    # Paired samples were taken back to back, so their difference cancels most of the noise
+    base = workers[0]
+    print(f"{'bundles':>8} {'load':>9} {'build/locale':>13} {'rerun p50':>10} {'switching p50':>14}  vs {base.count} bundles")
+    for worker in workers:
+        same, switching = summarize(worker.samples["same"]), summarize(worker.samples["switching"])
+        delta = statistics.median(
+            (b - a) * 1000 for action in worker.samples for a, b in zip(base.samples[action], worker.samples[action])
+        )
+        print(
+            f"{worker.count:>8} {worker.info['load_ms']:>7.1f}ms {worker.info['build_ms']:>11.1f}ms "
+            f"{same['p50_ms']:>8.1f}ms {switching['p50_ms']:>12.1f}ms  {delta:+.1f}ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""Mail delivery against a local stand-in SMTP server (no mail server needed).
+
+The server speaks enough SMTP for smtplib and can misbehave the way real ones
+do: answer NOOP with 421 on a connection it is about to drop, close idle
+connections without a word, and reject DATA with a transient 451. It counts
+connections and every DATA attempt. The script checks that SMTPTransport
+reuses one connection, notices a dead one with NOOP and reconnects. It checks
+that the mailer retries with exponential backoff and gives up after
+max_retries, that any other error costs one message and not the worker, and
+that messages with one subject arrive as a single digest.
+It also times delivery over the reused connection against a new one per message.
+
+Usage: python benchmarks/bench_mailer.py [--messages N]
+"""
+import argparse
+import email
+import logging
+import socketserver
+import sys
+import threading
+import time
+
+import common  # noqa: F401  (puts the app on sys.path)
+from mailer import Mailer, SMTPTransport
+
+SENDER = RECEIVER = "admin@example.com"
+
+# The give-up check below logs a delivery error on purpose
+logging.getLogger("mailer").setLevel(logging.CRITICAL)
+
+
+class StandIn(socketserver.StreamRequestHandler):
+    lock = threading.Lock()
+    connections = 0
+    data_attempts = 0
+    received = []
+    # Misbehaviour switches, set by the checks below
+    fail_data = 0            # reject this many DATA commands with 451
+    noop_reply = b"250 OK"   # what NOOP answers
+    drop_after = None        # close the connection after this many messages
+
+    def reply(self, line):
+        self.wfile.write(line + b"\r\n")
+
+    def handle(self):
+        cls = type(self)
+        with cls.lock:
+            cls.connections += 1
+        self.reply(b"220 stand-in ESMTP")
+        delivered = 0
+        while line := self.rfile.readline():
+            command = line.strip().split(b" ", 1)[0].upper()
+            if command == b"EHLO":
+                self.reply(b"250-stand-in")
+                self.reply(b"250 8BITMIME")
+            elif command in (b"HELO", b"MAIL", b"RCPT", b"RSET"):
+                self.reply(b"250 OK")
+            elif command == b"NOOP":
+                self.reply(cls.noop_reply)
+            elif command == b"DATA":
+                with cls.lock:
+                    cls.data_attempts += 1
+                    rejected = cls.fail_data > 0
+                    cls.fail_data -= rejected
+                if rejected:
+                    self.reply(b"451 try again later")
+                    continue
+                self.reply(b"354 end with <CRLF>.<CRLF>")
+                lines = []
+                while (line := self.rfile.readline()) not in (b".\r\n", b""):
+                    lines.append(line[1:] if line.startswith(b"..") else line)
+                with cls.lock:
+                    cls.received.append(email.message_from_bytes(b"".join(lines)))
+                self.reply(b"250 queued")
+                delivered += 1
+                if cls.drop_after is not None and delivered >= cls.drop_after:
+                    return
+            elif command == b"QUIT":
+                self.reply(b"221 bye")
+                return
+            else:
+                self.reply(b"502 not implemented")
+
+    @classmethod
+    def reset(cls):
+        cls.connections = cls.data_attempts = cls.fail_data = 0
+        cls.received = []
+        cls.noop_reply = b"250 OK"
+        cls.drop_after = None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=200)
+    args = parser.parse_args()
+
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), StandIn)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    failures = []
+
+    def transport(keepalive=60):
+        return SMTPTransport("127.0.0.1", port, use_tls=False, timeout=5, keepalive=keepalive)
+
+    def expect(label, actual, wanted):
+        if actual != wanted:
+            failures.append(f"{label}: expected {wanted}, got {actual}")
+
+    # One connection carries every message
+    StandIn.reset()
+    smtp = transport()
+    for i in range(5):
+        smtp.send(SENDER, [RECEIVER], f"Subject: reuse {i}\r\n\r\nbody")
+    expect("connections for 5 messages", StandIn.connections, 1)
+
+    # An idle connection the server is closing answers NOOP with 421: reconnect before sending
+    smtp.keepalive = 0
+    StandIn.noop_reply = b"421 closing idle connection"
+    smtp.send(SENDER, [RECEIVER], "Subject: after noop\r\n\r\nbody")
+    expect("connections after a 421 NOOP", StandIn.connections, 2)
+    expect("messages received after a 421 NOOP", len(StandIn.received), 6)
+    smtp.close()
+
+    # A connection the server dropped without a word: retried once on a fresh one
+    StandIn.reset()
+    StandIn.drop_after = 1
+    smtp = transport()
+    for i in range(3):
+        smtp.send(SENDER, [RECEIVER], f"Subject: dropped {i}\r\n\r\nbody")
+    smtp.close()
+    expect("messages received over dropped connections", len(StandIn.received), 3)
+    expect("connections over dropped connections", StandIn.connections, 3)
+
+    # Transient failures: retried with exponential backoff (0.05s, then 0.1s)
+    StandIn.reset()
+    StandIn.fail_data = 2
+    mailer = Mailer(transport(), SENDER, RECEIVER, batch_window=0, max_retries=3, backoff=0.05)
+    started = time.perf_counter()
+    mailer.submit("transient", "body")
+    mailer.flush()
+    elapsed = time.perf_counter() - started
+    expect("DATA attempts for 2 transient failures", StandIn.data_attempts, 3)
+    expect("messages delivered after retrying", len(StandIn.received), 1)
+    if not 0.15 <= elapsed < 1.0:
+        failures.append(f"two retries took {elapsed:.2f}s, expected about 0.15s of backoff")
+
+    # A server that never accepts: max_retries + 1 attempts, then the message is dropped
+    StandIn.reset()
+    StandIn.fail_data = 10**6
+    started = time.perf_counter()
+    mailer.submit("permanent", "body")
+    mailer.flush()
+    elapsed = time.perf_counter() - started
+    expect("DATA attempts before giving up", StandIn.data_attempts, 4)
+    expect("messages delivered by a failing server", len(StandIn.received), 0)
+    if not 0.35 <= elapsed < 1.5:
+        failures.append(f"giving up took {elapsed:.2f}s, expected about 0.35s of backoff")
+    print(f"retries      2 transient failures, then giving up after 4 attempts in {elapsed:.2f}s")
+
+    # Messages queued within one batch window arrive as one digest per subject
+    StandIn.reset()
+    mailer = Mailer(transport(), SENDER, RECEIVER, batch_window=0.5)
+    for i in range(3):
+        mailer.submit("New Review", f"review {i}")
+    mailer.submit("App Rating", "5/5")
+    mailer.flush()
+    subjects = sorted(message["Subject"] for message in StandIn.received)
+    expect("digest subjects", subjects, ["App Rating", "New Review (3 submissions)"])
+    digest = next((m for m in StandIn.received if m["Subject"].startswith("New Review")), None)
+    if digest is not None:
+        body = digest.get_payload()[0].get_payload()
+        expect("reviews in the digest", [f"review {i}" in body for i in range(3)], [True] * 3)
+
+    # An error that is not an SMTP or socket error loses its message, not the worker
+    StandIn.reset()
+    smtp = transport()
+    real_send = smtp.send
+
+    def send(sender, recipients, message):
+        if "Subject: crash" in message:
+            raise RuntimeError("STARTTLS extension not supported by server")
+        real_send(sender, recipients, message)
+    smtp.send = send
+    mailer = Mailer(smtp, SENDER, RECEIVER, batch_window=0, max_retries=0)
+    mailer.submit("crash", "body")
+    mailer.flush()
+    mailer._worker.join(0.2)  # a worker that died exits right after its last task_done
+    expect("worker alive after an unexpected error", mailer._worker.is_alive(), True)
+    if mailer._worker.is_alive():
+        mailer.submit("after the crash", "body")
+        mailer.flush()
+        expect("messages delivered after an unexpected error", [m["Subject"] for m in StandIn.received], ["after the crash"])
+    smtp.close()
+
+    # Throughput: one reused connection against a new connection per message
+    timings = {}
+    for label, keep_open in (("reused", True), ("reconnecting", False)):
+        StandIn.reset()
+        smtp = transport()
+        started = time.perf_counter()
+        for i in range(args.messages):
+            smtp.send(SENDER, [RECEIVER], f"Subject: load {i}\r\n\r\nbody")
+            if not keep_open:
+                smtp.close()
+        smtp.close()
+        timings[label] = time.perf_counter() - started
+        print(f"{label:<13}{args.messages} messages in {timings[label]:.2f}s over {StandIn.connections} connection(s)")
+    print(f"speedup: {timings['reconnecting'] / timings['reused']:.1f}x")
+
+    server.shutdown()
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
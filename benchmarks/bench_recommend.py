@@ -0,0 +1,74 @@
+"""Build and query cost of the recommender on a large synthetic catalog.
+
+Usage: python benchmarks/bench_recommend.py [--resources N] [--queries N]
+"""
+import argparse
+import random
+import statistics
+import time
+
+import common  # noqa: F401  (puts the app on sys.path)
+from recommend import Recommender, make_profile
+
+COMMON_WORDS = "guide course book tutorial advanced beginner complete introduction".split()
+# Long-tail vocabulary, like real titles: a few common words and many rare ones
+RARE_WORDS = [f"topic{i}" for i in range(20_000)]
+TYPES = ("Book", "Course", "Video", "Article", "Podcast")
+
+
+def synthetic_entries(n, rng):
+    for i in range(n):
+        main_field = f"field{i % 20}"
+        sub_field = f"sub{i % 200}"
+        title = " ".join([rng.choice(COMMON_WORDS)] + rng.sample(RARE_WORDS, 3))
+        yield main_field, sub_field, {
+            "id": f"r{i}",
+            "title": title,
+            "type": rng.choice(TYPES),
+            "link": f"https://site{i % 500}.example.com/{i}",
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resources", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=10)
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    started = time.perf_counter()
+    recommender = Recommender(synthetic_entries(args.resources, rng))
+    build_s = time.perf_counter() - started
+
+    profiles = [
+        make_profile(
+            {
+                "interests": rng.sample([f"field{i}" for i in range(20)], 2),
+                "main_field": f"field{i % 20}",
+                "sub_field": f"sub{i % 200}",
+                "goal": "Learn a new skill",
+            },
+            favorites=[f"r{rng.randrange(args.resources)}" for _ in range(5)],
+            ratings={f"r{rng.randrange(args.resources)}": rng.randint(1, 5) for _ in range(3)},
+        )
+        for i in range(args.queries)
+    ]
+    cold, warm = [], []
+    for samples in (cold, warm):
+        for profile in profiles:
+            started = time.perf_counter()
+            recommender.recommend(profile, args.k)
+            samples.append((time.perf_counter() - started) * 1000)
+
+    print(f"{args.resources} resources, {len(recommender.columns)} features, built in {build_s:.2f}s")
+    for label, samples in (("uncached", cold), ("cached", warm)):
+        samples.sort()
+        print(
+            f"  {label:<9} top-{args.k}: p50 {statistics.median(samples):.3f} ms, "
+            f"p99 {samples[int(len(samples) * 0.99) - 1]:.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
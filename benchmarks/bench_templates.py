@@ -0,0 +1,54 @@
+"""Load and lookup cost of the goal template engine with many templates.
+
+Generates synthetic goal x field x sub-field templates, times building the
+TemplateSet once and resolving a path per session afterwards.
+
+Usage: python benchmarks/bench_templates.py [--goals N] [--fields N] [--sub-fields N]
+"""
+import argparse
+import itertools
+import random
+import time
+
+import common  # noqa: F401  (puts the app on sys.path)
+from templates import TemplateSet
+
+
+def synthetic_templates(goals, fields, sub_fields):
+    steps = ["Plan your {sub_field} week", "Practice {sub_field} for {goal}", "Review progress", "Share what you learned"]
+    for g, f in itertools.product(range(goals), range(fields)):
+        yield "bench", {"goal": f"goal {g}", "steps": steps} if f == 0 else {
+            "goal": f"goal {g}", "main_field": f"field {f}", "steps": steps,
+        }
+        for s in range(sub_fields):
+            yield "bench", {"goal": f"goal {g}", "main_field": f"field {f}", "sub_field": f"sub {s}", "steps": steps}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--goals", type=int, default=20)
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--sub-fields", type=int, default=10)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    template_set = TemplateSet(synthetic_templates(args.goals, args.fields, args.sub_fields))
+    build_ms = (time.perf_counter() - started) * 1000
+
+    rng = random.Random(0)
+    # A mix of exact, main-field and goal-only hits
+    keys = [
+        (f"goal {rng.randrange(args.goals)}", f"field {rng.randrange(args.fields + 5)}", f"sub {rng.randrange(args.sub_fields + 5)}")
+        for _ in range(1000)
+    ]
+    started = time.perf_counter()
+    for key in itertools.islice(itertools.cycle(keys), args.lookups):
+        template_set.steps_for(*key)
+    lookup_us = (time.perf_counter() - started) / args.lookups * 1e6
+
+    print(f"{len(template_set)} templates built in {build_ms:.1f} ms; {lookup_us:.2f} us per path lookup")
+
+
+if __name__ == "__main__":
+    main()
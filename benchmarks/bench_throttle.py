@@ -0,0 +1,51 @@
+"""Cost of one submission check as clients and threads grow.
+
+Hammers a SubmissionGuard from several threads with unique submissions spread
+over a growing number of sessions and addresses. A check is O(1), so the time
+per check should stay flat as the number of tracked keys grows.
+
+Usage: python benchmarks/bench_throttle.py [--clients 1000 100000] [--threads 1 8] [--checks N]
+"""
+import argparse
+import threading
+import time
+
+import common  # noqa: F401  (puts the app on sys.path)
+from throttle import Deduper, RateLimiter, SubmissionGuard
+
+
+def hammer(guard, clients, checks, offset):
+    for i in range(checks):
+        client = (i * 7919 + offset) % clients
+        guard.check("review", f"session-{client}", f"10.0.{client // 256 % 256}.{client % 256}", "res", f"text {offset} {i}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, nargs="+", default=[1_000, 100_000])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--checks", type=int, default=200_000, help="checks per measurement, over all threads")
+    args = parser.parse_args()
+
+    print(f"{'clients':>8} {'threads':>8} {'us/check':>9} {'dropped':>8}")
+    for clients in args.clients:
+        for threads in args.threads:
+            guard = SubmissionGuard(
+                RateLimiter(60, 5, max_keys=clients), RateLimiter(600, 30, max_keys=clients),
+                Deduper(600, max_keys=args.checks),
+            )
+            per_thread = args.checks // threads
+            workers = [threading.Thread(target=hammer, args=(guard, clients, per_thread, t)) for t in range(threads)]
+            started = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - started
+            rows = guard.summary()
+            dropped = sum(row["duplicate"] + row["rate_limited"] for row in rows)
+            print(f"{clients:>8} {threads:>8} {elapsed / (per_thread * threads) * 1e6:>9.2f} {dropped:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tomllib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "app.py")
+
+# `streamlit run` puts the app directory on sys.path; AppTest does not
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from streamlit import config  # noqa: E402
+from streamlit.testing.v1 import AppTest, local_script_runner  # noqa: E402
+
+# Streamlit only reads .streamlit/config.toml from the directory it started in;
+# benchmark with the app's own settings wherever the benchmark was started from
+CONFIG_PATH = os.path.join(ROOT, ".streamlit", "config.toml")
+with open(CONFIG_PATH, "rb") as f:
+    for section, options in tomllib.load(f).items():
+        for name, value in options.items():
+            config.set_option(f"{section}.{name}", value, CONFIG_PATH)
+
+# `streamlit run` compiles the script once per process and every rerun reuses the
+# bytecode; AppTest compiles it again on every run. Share one cache so a benchmark
+# rerun does (and allocates) what a server rerun does.
+_script_cache = local_script_runner.ScriptCache()
+local_script_runner.ScriptCache = lambda: _script_cache
+
+# Importing app modules outside a script run is expected here; keep the output readable
+logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").addFilter(
+    lambda record: record.levelno >= logging.ERROR
+)
+
+# Each benchmark process gets its own throwaway database
+os.environ.setdefault("LPC_DB_PATH", os.path.join(tempfile.mkdtemp(prefix="lpc-bench-"), "user_data.db"))
+# One benchmark session submits far faster than a person; keep it under the rate limit
+os.environ.setdefault("LPC_SUBMIT_BURST", "1000000")
+
+
+# Headless app with mail kept in memory so nothing leaves the machine
+def make_app(timeout=60, **env):
+    os.environ.update(env)
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    at.secrets["email"] = {"email": "bench@example.com", "password": "unused", "transport": "memory"}
+    return at
+
+
+def button(at, label, sidebar=False):
+    buttons = at.sidebar.button if sidebar else at.button
+    return next(b for b in buttons if label in b.label)
+
+
+def selectbox(at, label, sidebar=False):
+    boxes = at.sidebar.selectbox if sidebar else at.selectbox
+    return next(s for s in boxes if label in s.label)
+
+
+def text_input(at, label):
+    return next(t for t in at.text_input if label in t.label)
+
+
+# Click through the tutorial and save a complete set of sidebar inputs
+def onboard(at, main_field="Programming", sub_field="Python", goal="Learn a new skill"):
+    at.run()
+    button(at, "Got it").click().run()
+    selectbox(at, "main field", sidebar=True).select(main_field).run()
+    selectbox(at, "sub-field", sidebar=True).select(sub_field).run()
+    selectbox(at, "goal", sidebar=True).select(goal).run()
+    button(at, "Save Inputs", sidebar=True).click().run()
+    assert not at.exception, at.exception
+    return at
+
+
+# Number of deltas (elements and blocks) and their serialized size for the last run
+def element_stats(at):
+    count = size = 0
+    for node in at._tree:
+        if node is at._tree:
+            continue
+        count += 1
+        proto = getattr(node, "proto", None)
+        if proto is not None:
+            size += proto.ByteSize()
+    return count, size
+
+
+# Time `action` (which should trigger a rerun) `repeat` times; returns per-run seconds
+def time_reruns(action, repeat=20):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    return {
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p50_ms": ordered[len(ordered) // 2] * 1000,
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+    }
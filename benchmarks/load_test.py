@@ -0,0 +1,221 @@
+"""Multi-user load test: many simulated learners driving app.py at once.
+
+Every simulated session is its own AppTest with its own session state. Sessions
+are spread over worker processes, which stand in for server workers. Sessions
+in one process share its caches and connections, the way sessions on one
+server do. Each session is onboarded and then replays a
+weighted mix of realistic interactions: searching, editing and adding steps,
+favoriting, reviewing, saving and plain reruns.
+
+Reported: overall throughput (reruns/s), p50/p99 rerun latency overall and per
+interaction, and per-session memory. Memory is given both as the pickled size
+of a session's state and as the process RSS growth per session, measured after
+the first session so shared imports and caches are not counted.
+
+Usage:
+    python benchmarks/load_test.py --sessions 32 --workers 4 --iterations 20
+    python benchmarks/load_test.py --sessions 8 --json load.json
+"""
+import argparse
+import json
+import os
+import pickle
+import random
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from common import button, make_app, onboard, summarize, text_input
+
+SEARCHES = ["python", "best 2024", "youtube", "book", "oreilly course", "java", "machine learning"]
+PROFILES = [
+    ("Programming", "Python", "Learn a new skill"),
+    ("Programming", "AI/ML", "Learn a new skill"),
+    ("Reading", "Fantasy", "Read more books"),
+    ("Cooking", "Baking", "Cook new recipes"),
+    ("Traveling", "City", "Travel more"),
+]
+
+
+def act_search(at, rng):
+    return text_input(at, "Search resources").input(rng.choice(SEARCHES)).run()
+
+
+def act_clear_search(at, rng):
+    return text_input(at, "Search resources").input("").run()
+
+
+def act_edit_step(at, rng):
+    steps = [t for t in at.text_input if t.key and t.key.startswith("step_")]
+    if not steps:
+        return at.run()
+    return rng.choice(steps).input(f"Practice block {rng.randrange(10**6)}").run()
+
+
+def act_add_step(at, rng):
+    text_input(at, "Add new step").input(f"New step {rng.randrange(10**6)}")
+    return button(at, "Add Step").click().run()
+
+
+def act_favorite(at, rng):
+    fav = [b for b in at.button if "Add to Favorites" in b.label]
+    if not fav:
+        return at.run()
+    return rng.choice(fav).click().run()
+
+
+def act_review(at, rng):
+    boxes = [t for t in at.text_area if t.key and t.key.startswith("review_")]
+    if not boxes:
+        return at.run()
+    box = rng.choice(boxes)
+    box.input(f"Useful resource, note {rng.randrange(10**6)}")
+    return at.button(key="submit_" + box.key[len("review_"):]).click().run()
+
+
+def act_save_path(at, rng):
+    return button(at, "Save Learning Path").click().run()
+
+
+def act_rerun(at, rng):
+    return at.run()
+
+
+# name -> (action, weight): roughly what a learner does in a sitting
+SCRIPT = {
+    "search": (act_search, 20),
+    "clear_search": (act_clear_search, 5),
+    "edit_step": (act_edit_step, 20),
+    "add_step": (act_add_step, 10),
+    "favorite": (act_favorite, 15),
+    "review": (act_review, 10),
+    "save_path": (act_save_path, 10),
+    "rerun": (act_rerun, 10),
+}
+
+
+def rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:  # not Linux: peak RSS is the closest we have
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def session_state_bytes(at):
+    try:
+        return len(pickle.dumps(dict(at.session_state.filtered_state)))
+    except Exception:
+        return 0
+
+
+# One worker process: onboard its sessions, then interleave their interactions.
+# AppTest drives the script through process-wide runtime state, so sessions in
+# one process take turns; concurrency comes from running several processes.
+def run_worker(worker, session_count, iterations, seed):
+    rng = random.Random(seed * 1000 + worker)
+    sessions = []
+    for i in range(session_count):
+        main_field, sub_field, goal = rng.choice(PROFILES)
+        sessions.append(onboard(make_app(), main_field=main_field, sub_field=sub_field, goal=goal))
+        if i == 0:
+            # The first session also pays for imports and shared caches; measure from here
+            rss_first = rss_bytes()
+    # Onboarding happens before the clock starts, so setup does not count as load
+    rss_onboarded = rss_bytes()
+
+    samples, errors = [], []
+    names = list(SCRIPT)
+    weights = [SCRIPT[name][1] for name in names]
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for at in sessions:
+            name = rng.choices(names, weights)[0]
+            action_started = time.perf_counter()
+            try:
+                SCRIPT[name][0](at, rng)
+            except Exception as e:
+                errors.append(f"{name}: {type(e).__name__}: {e}")
+                continue
+            samples.append((name, time.perf_counter() - action_started))
+            if at.exception:
+                errors.append(f"{name}: {at.exception[0].message}")
+    return {
+        "samples": samples,
+        "errors": errors,
+        "session_bytes": [session_state_bytes(at) for at in sessions],
+        "rss_growth": rss_onboarded - rss_first,
+        "extra_sessions": session_count - 1,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate many concurrent learners against app.py.")
+    parser.add_argument("--sessions", type=int, default=16, help="simulated sessions in total")
+    parser.add_argument("--workers", type=int, default=2, help="worker processes")
+    parser.add_argument("--iterations", type=int, default=10, help="interactions per session")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args(argv)
+
+    per_worker = [args.sessions // args.workers + (i < args.sessions % args.workers) for i in range(args.workers)]
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = [
+            executor.submit(run_worker, i, count, args.iterations, args.seed)
+            for i, count in enumerate(per_worker) if count
+        ]
+        results = [future.result() for future in futures]
+
+    samples = [sample for r in results for sample in r["samples"]]
+    errors = [error for r in results for error in r["errors"]]
+    sizes = [size for r in results for size in r["session_bytes"]]
+    seconds = max(r["seconds"] for r in results)
+    if not samples:
+        print("No interactions completed", *errors[:10], sep="\n")
+        return 1
+
+    report = {
+        "sessions": args.sessions,
+        "workers": args.workers,
+        "reruns": len(samples),
+        "errors": len(errors),
+        "seconds": round(seconds, 2),
+        "reruns_per_second": round(len(samples) / seconds, 1),
+        "latency": {k: round(v, 1) for k, v in summarize([s for _, s in samples]).items()},
+        "per_action": {
+            name: dict(count=len(times), **{k: round(v, 1) for k, v in summarize(times).items()})
+            for name in SCRIPT
+            for times in [[s for n, s in samples if n == name]]
+            if times
+        },
+        "session_state_kib": round(sum(sizes) / len(sizes) / 1024, 1),
+        "rss_per_session_mib": round(
+            sum(r["rss_growth"] for r in results) / max(1, sum(r["extra_sessions"] for r in results)) / 2**20, 2
+        ),
+    }
+
+    print(
+        f"{args.sessions} sessions on {args.workers} workers: "
+        f"{report['reruns']} reruns in {seconds:.1f}s = {report['reruns_per_second']} reruns/s"
+    )
+    print(f"latency: p50 {report['latency']['p50_ms']} ms, p99 {report['latency']['p99_ms']} ms")
+    print(f"{'action':<13} {'count':>6} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, stats in report["per_action"].items():
+        print(f"{name:<13} {stats['count']:>6} {stats['p50_ms']:>8} {stats['p99_ms']:>8}")
+    print(
+        f"memory per session: {report['session_state_kib']} KiB of session state, "
+        f"{report['rss_per_session_mib']} MiB process RSS"
+    )
+    if errors:
+        print(f"{len(errors)} errors, first ones:", *errors[:5], sep="\n  ")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
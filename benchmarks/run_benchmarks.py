@@ -0,0 +1,179 @@
+"""Headless benchmark suite for app.py built on Streamlit's AppTest.
+
+Each scenario drives the app the way a user would and reports the per-rerun
+wall time, the peak Python memory allocated during the scenario and the number
+of elements sent on the last rerun. As under `streamlit run`, the script is
+compiled once and not on every rerun; the memory that compile takes is reported
+on its own line. Results are compared against
+benchmarks/baselines.json; the run fails if any scenario regresses.
+
+Usage:
+    python benchmarks/run_benchmarks.py                  # compare against baselines
+    python benchmarks/run_benchmarks.py --update-baselines
+    python benchmarks/run_benchmarks.py --only search pdf
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import tracemalloc
+
+from common import APP_PATH, button, element_stats, make_app, onboard, summarize, text_input, time_reruns
+from steps import StepList  # common puts the app on sys.path
+
+BASELINES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+LONG_PATH_STEPS = 50
+
+
+# Each scenario prepares an app and returns an `action` callable that performs one
+# interaction and returns the AppTest it drove
+def scenario_onboarding():
+    # A fresh session every time: tutorial, three sidebar selections and Save Inputs
+    return lambda: onboard(make_app())
+
+
+def scenario_save_inputs():
+    at = onboard(make_app())
+    return lambda: button(at, "Save Inputs", sidebar=True).click().run()
+
+
+def scenario_edit_long_path():
+    at = onboard(make_app())
+    at.session_state["steps"] = StepList(f"Step number {i}" for i in range(LONG_PATH_STEPS))
+    at.run()
+    edits = iter(range(10**9))
+    return lambda: text_input(at, f"Step {LONG_PATH_STEPS // 2}:").input(f"Edited step {next(edits)}").run()
+
+
+def scenario_search():
+    at = onboard(make_app())
+    queries = itertools.cycle(["python", "best 2024", "youtube", "book", "oreilly course"])
+    return lambda: text_input(at, "Search resources").input(next(queries)).run()
+
+
+def scenario_add_favorite():
+    at = onboard(make_app())
+    return lambda: button(at, "Add to Favorites").click().run()
+
+
+def scenario_pdf():
+    at = onboard(make_app())
+    at.session_state["steps"] = StepList(f"Step number {i}" for i in range(LONG_PATH_STEPS))
+    at.run()
+    return lambda: button(at, "Download PDF Report").click().run()
+
+
+def scenario_feedback():
+    at = onboard(make_app())
+    messages = iter(range(10**9))
+
+    def action():
+        at.sidebar.text_area[0].input(f"Great app #{next(messages)}")
+        return button(at, "Submit Feedback", sidebar=True).click().run()
+    return action
+
+
+# name -> (factory, reruns triggered by one action)
+SCENARIOS = {
+    "onboarding": (scenario_onboarding, 5),
+    "save_inputs": (scenario_save_inputs, 1),
+    "edit_long_path": (scenario_edit_long_path, 1),
+    "search": (scenario_search, 1),
+    "add_favorite": (scenario_add_favorite, 1),
+    "pdf": (scenario_pdf, 1),
+    "feedback": (scenario_feedback, 1),
+}
+
+
+def run_scenario(name, repeat):
+    factory, reruns = SCENARIOS[name]
+
+    # Timing pass, without allocation tracing slowing the script down
+    action = factory()
+    last = []
+    samples = time_reruns(lambda: last.append(action()), repeat)
+    at = last[-1]
+    assert not at.exception, f"{name}: {at.exception}"
+    elements, size = element_stats(at)
+
+    # Memory pass on a fresh app
+    action = factory()
+    tracemalloc.start()
+    action()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = summarize([sample / reruns for sample in samples])
+    result.update(elements=elements, bytes=size, peak_kib=peak / 1024)
+    return result
+
+
+# Peak memory of compiling app.py, which happens once per process and so is left
+# out of the scenario peaks
+def script_compile_kib():
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+
+    tracemalloc.start()
+    ScriptCache().get_bytecode(APP_PATH)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+# Compare a result with its baseline; returns a list of human-readable regressions
+def regressions(result, baseline, time_tolerance, memory_tolerance):
+    problems = []
+    if result["p50_ms"] > baseline["p50_ms"] * (1 + time_tolerance):
+        problems.append(f"p50 {result['p50_ms']:.1f} ms > baseline {baseline['p50_ms']:.1f} ms")
+    if result["peak_kib"] > baseline["peak_kib"] * (1 + memory_tolerance):
+        problems.append(f"peak {result['peak_kib']:.0f} KiB > baseline {baseline['peak_kib']:.0f} KiB")
+    if result["elements"] > baseline["elements"]:
+        problems.append(f"{result['elements']} elements > baseline {baseline['elements']}")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark app.py reruns with AppTest.")
+    parser.add_argument("--repeat", type=int, default=20, help="interactions per scenario")
+    parser.add_argument("--only", nargs="+", choices=sorted(SCENARIOS), help="run only these scenarios")
+    parser.add_argument("--update-baselines", action="store_true", help="store these results as the new baselines")
+    parser.add_argument("--time-tolerance", type=float, default=0.5, help="allowed p50 slowdown (0.5 = +50%%)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25, help="allowed peak memory growth")
+    args = parser.parse_args(argv)
+
+    baselines = {}
+    if os.path.exists(BASELINES_PATH):
+        with open(BASELINES_PATH, encoding="utf-8") as f:
+            baselines = json.load(f)
+
+    failed = False
+    results = {}
+    print(f"{'scenario':<16} {'p50 ms':>8} {'p99 ms':>8} {'peak KiB':>9} {'elements':>9}  status")
+    for name in args.only or SCENARIOS:
+        result = results[name] = run_scenario(name, args.repeat)
+        problems = [] if args.update_baselines or name not in baselines else regressions(
+            result, baselines[name], args.time_tolerance, args.memory_tolerance
+        )
+        failed = failed or bool(problems)
+        status = "; ".join(problems) if problems else ("new" if name not in baselines else "ok")
+        print(
+            f"{name:<16} {result['p50_ms']:>8.1f} {result['p99_ms']:>8.1f} "
+            f"{result['peak_kib']:>9.0f} {result['elements']:>9}  {status}"
+        )
+    print(f"compiling app.py peaks at {script_compile_kib():.0f} KiB")
+
+    if args.update_baselines:
+        baselines.update({
+            name: {key: round(r[key], 2) for key in ("p50_ms", "peak_kib", "elements")}
+            for name, r in results.items()
+        })
+        with open(BASELINES_PATH, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baselines written to {BASELINES_PATH}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,289 @@
+"""Bulk import and export of saved learning paths as JSON Lines or CSV.
+
+Records are the saved-path payload plus a user_id:
+    {"user_id": "...", "interests": [...], "main_field": "...", "sub_field": "...",
+     "goal": "...", "learning_path": [...], "favorites": [resource ids],
+     "reviews": {resource_id: [{"text": "...", "rating": 5, "created_at": 0.0}]}}
+
+In CSV, list columns hold one value per line of the cell. The reviews column
+holds the reviews object as JSON.
+
+Parsing streams line by line and imports in batches, so memory stays flat for
+any file size. Each line is decoded on its own. An invalid line (bad UTF-8,
+JSON or CSV) is reported with its line number and skipped; it does not abort
+the import.
+
+Usage:
+    python bulk.py import paths.jsonl [--db user_data.db]
+    python bulk.py export paths.csv [--db user_data.db]
+"""
+import argparse
+import codecs
+import csv
+import io
+import json
+import os
+import sys
+
+from store import DB_PATH
+
+FORMATS = ("jsonl", "csv")
+CSV_COLUMNS = ("user_id", "interests", "main_field", "sub_field", "goal", "learning_path", "favorites", "reviews")
+LIST_FIELDS = ("interests", "learning_path", "favorites")
+TEXT_FIELDS = ("main_field", "sub_field", "goal")
+MAX_USER_ID = 128
+MAX_STEPS = 1000
+MAX_STEP_LENGTH = 1000
+# Errors kept for the report; the rest are only counted
+MAX_REPORTED_ERRORS = 1000
+
+
+class RecordError(ValueError):
+    pass
+
+
+def format_for(path):
+    ext = os.path.splitext(path)[1].lower()
+    return "csv" if ext == ".csv" else "jsonl"
+
+
+def _string_list(record, field, limit=None, max_length=None):
+    value = record.get(field) or []
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise RecordError(f"{field} must be a list of strings")
+    if limit is not None and len(value) > limit:
+        raise RecordError(f"{field} has {len(value)} entries, at most {limit} allowed")
+    if max_length is not None and any(len(item) > max_length for item in value):
+        raise RecordError(f"{field} entries must be at most {max_length} characters")
+    return value
+
+
+def _reviews(record):
+    value = record.get("reviews") or {}
+    if not isinstance(value, dict):
+        raise RecordError("reviews must be an object of resource id -> list of reviews")
+    for resource_id, items in value.items():
+        if not isinstance(items, list):
+            raise RecordError(f"reviews[{resource_id!r}] must be a list")
+        for item in items:
+            if isinstance(item, str):
+                continue
+            if not isinstance(item, dict) or not isinstance(item.get("text"), str):
+                raise RecordError(f"reviews[{resource_id!r}] entries need a text")
+            rating = item.get("rating")
+            if rating is not None and (not isinstance(rating, int) or not 1 <= rating <= 5):
+                raise RecordError(f"reviews[{resource_id!r}] rating must be 1-5")
+    return value
+
+
+# Check one record and split it into (user_id, saved-path payload)
+def validate_record(record):
+    if not isinstance(record, dict):
+        raise RecordError("record must be an object")
+    user_id = record.get("user_id")
+    if not isinstance(user_id, str) or not user_id.strip() or len(user_id) > MAX_USER_ID:
+        raise RecordError(f"user_id must be a non-empty string of at most {MAX_USER_ID} characters")
+    data = {}
+    for field in TEXT_FIELDS:
+        value = record.get(field, "")
+        if not isinstance(value, str):
+            raise RecordError(f"{field} must be a string")
+        data[field] = value
+    data["interests"] = _string_list(record, "interests")
+    data["learning_path"] = _string_list(record, "learning_path", MAX_STEPS, MAX_STEP_LENGTH)
+    data["favorites"] = _string_list(record, "favorites")
+    data["reviews"] = _reviews(record)
+    return user_id.strip(), data
+
+
+# Decode binary lines one at a time, so a bad byte only rejects its own line.
+# Yields (line_number, text, error_or_None); a line that is not UTF-8 comes back
+# with its bad bytes replaced and an error. A leading byte order mark is dropped.
+def decode_lines(lines):
+    for line_number, line in enumerate(lines, 1):
+        if line_number == 1 and line.startswith(codecs.BOM_UTF8):
+            line = line[len(codecs.BOM_UTF8):]
+        try:
+            yield line_number, line.decode("utf-8"), None
+        except UnicodeDecodeError as e:
+            yield line_number, line.decode("utf-8", errors="replace"), f"not valid UTF-8: {e.reason} at byte {e.start}"
+
+
+# Yield (line_number, record_or_None, error_or_None) from JSON Lines bytes
+def read_jsonl(lines):
+    for line_number, line, error in decode_lines(lines):
+        if error is not None:
+            yield line_number, None, error
+            continue
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line), None
+        except ValueError as e:
+            yield line_number, None, f"invalid JSON: {e}"
+
+
+def _split_cell(cell):
+    return [item for item in (cell or "").splitlines() if item.strip()]
+
+
+# Yield (line_number, record_or_None, error_or_None) from CSV bytes with a header row
+def read_csv(lines):
+    bad_lines = {}
+
+    def text_lines():
+        for line_number, line, error in decode_lines(lines):
+            if error is not None:
+                bad_lines[line_number] = error
+            yield line
+
+    reader = csv.DictReader(text_lines())
+    try:
+        fieldnames = reader.fieldnames or ()
+    except csv.Error as e:
+        yield 1, None, f"invalid CSV header: {e}"
+        return
+    missing = [column for column in ("user_id",) if column not in fieldnames]
+    if 1 in bad_lines or missing:
+        yield 1, None, bad_lines.get(1) or f"missing column(s): {', '.join(missing)}"
+        return
+    line_number = reader.line_num
+    while True:
+        # Multi-line cells span several physical lines; report where the row starts
+        start = line_number + 1
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            line_number = reader.line_num
+            yield start, None, f"invalid CSV: {e}"
+            continue
+        line_number = reader.line_num
+        errors = [bad_lines.pop(n) for n in range(start, line_number + 1) if n in bad_lines]
+        if errors:
+            yield start, None, errors[0]
+            continue
+        if None in row:
+            yield start, None, "more cells than header columns"
+            continue
+        record = {key: value for key, value in row.items() if key in CSV_COLUMNS}
+        for field in LIST_FIELDS:
+            record[field] = _split_cell(record.get(field))
+        for field in TEXT_FIELDS:
+            record[field] = record.get(field) or ""
+        try:
+            record["reviews"] = json.loads(record["reviews"]) if (record.get("reviews") or "").strip() else {}
+        except ValueError as e:
+            yield start, None, f"reviews is not valid JSON: {e}"
+            continue
+        yield start, record, None
+
+
+def read_records(lines, fmt):
+    return read_csv(lines) if fmt == "csv" else read_jsonl(lines)
+
+
+# Import parsed records into a PathStore in batches; returns a summary with
+# per-line errors as [(line_number, message)]. With `user_id`, every record is
+# saved under that id instead of its own, and only the first `limit` are imported.
+def import_records(parsed, store, batch_size=500, user_id=None, limit=None):
+    imported = failed = 0
+    errors = []
+    batch = []
+    for line_number, record, error in parsed:
+        if limit is not None and imported + len(batch) >= limit:
+            break
+        if error is None:
+            if user_id is not None and isinstance(record, dict):
+                record = dict(record, user_id=user_id)
+            try:
+                batch.append(validate_record(record))
+            except RecordError as e:
+                error = str(e)
+        if error is not None:
+            failed += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append((line_number, error))
+            continue
+        if len(batch) >= batch_size:
+            store.save_many(batch)
+            imported += len(batch)
+            batch = []
+    if batch:
+        store.save_many(batch)
+        imported += len(batch)
+    return {"imported": imported, "failed": failed, "errors": errors}
+
+
+def _record(user_id, data):
+    record = {"user_id": user_id}
+    record.update({field: data.get(field, "") for field in TEXT_FIELDS})
+    record.update({field: data.get(field) or [] for field in LIST_FIELDS})
+    record["reviews"] = data.get("reviews") or {}
+    return record
+
+
+# Yield JSON Lines text, one line per (user_id, data) pair
+def write_jsonl(items):
+    for user_id, data in items:
+        yield json.dumps(_record(user_id, data), ensure_ascii=False) + "\n"
+
+
+# Yield CSV text (header first), one row per (user_id, data) pair
+def write_csv(items):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    for user_id, data in items:
+        record = _record(user_id, data)
+        for field in LIST_FIELDS:
+            record[field] = "\n".join(record[field])
+        record["reviews"] = json.dumps(record["reviews"], ensure_ascii=False) if record["reviews"] else ""
+        writer.writerow([record[column] for column in CSV_COLUMNS])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def write_records(items, fmt):
+    return write_csv(items) if fmt == "csv" else write_jsonl(items)
+
+
+def main(argv=None):
+    from store import PathStore
+
+    parser = argparse.ArgumentParser(description="Import or export saved learning paths.")
+    parser.add_argument("command", choices=("import", "export"))
+    parser.add_argument("path", help=".jsonl or .csv file")
+    parser.add_argument("--format", choices=FORMATS, help="default: from the file extension")
+    parser.add_argument("--db", default=DB_PATH)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    fmt = args.format or format_for(args.path)
+    store = PathStore(args.db)
+    if args.command == "export":
+        count = 0
+        with open(args.path, "w", encoding="utf-8", newline="") as f:
+            for chunk in write_records(store.iter_all(), fmt):
+                f.write(chunk)
+                count += 1
+        print(f"Exported {count - (fmt == 'csv')} paths to {args.path}")  # the CSV header is a chunk too
+        return 0
+
+    with open(args.path, "rb") as f:
+        summary = import_records(read_records(f, fmt), store, args.batch_size)
+    for line_number, error in summary["errors"]:
+        print(f"line {line_number}: {error}", file=sys.stderr)
+    if summary["failed"] > len(summary["errors"]):
+        print(f"... and {summary['failed'] - len(summary['errors'])} more errors", file=sys.stderr)
+    print(f"Imported {summary['imported']} paths, {summary['failed']} lines rejected")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""Resource catalog: data/resources.json, loaded once per process.
+
+Every entry carries an "id" that favorites, reviews, analytics and locale
+titles refer to. It is written into the file once, so later edits to an
+entry's title or link keep its id. Give new entries one with assign-ids.
+
+Usage:
+    python catalog.py assign-ids   # add an id to every entry that has none
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+
+import streamlit as st
+
+from search import SearchIndex
+
+CATALOG_PATH = os.environ.get(
+    "LPC_CATALOG_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "resources.json"),
+)
+
+
+# Id for a new catalog entry, derived from where it is filed and what it links to.
+# assign_ids() writes it into the file; entries still without one get it on load.
+def resource_id(main_field, sub_field, entry):
+    key = "\x1f".join((main_field, sub_field, entry["title"], entry["link"]))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+
+
+# Prebuilt, read-only view of the resource catalog. A localized catalog shows
+# translated resource types and titles and has its own search index; ids and
+# field names stay the same in every locale.
+class Catalog:
+    def __init__(self, data, etag, locale=None):
+        self.locale = locale
+        self.etag = etag if locale is None else f"{etag}.{locale.code}.{locale.etag}"
+        self.version = data.get("version", 1)
+        self.fields = {main: tuple(subs) for main, subs in data["fields"].items()}
+        # Precomputed per-(main_field, sub_field) lists so a rerun is a single dict lookup
+        self.by_field = {}
+        self.by_id = {}
+        for main_field, sub_fields in data["resources"].items():
+            for sub_field, entries in sub_fields.items():
+                resources = tuple(
+                    dict(entry, id=entry.get("id") or resource_id(main_field, sub_field, entry))
+                    for entry in entries
+                )
+                if locale is not None:
+                    for resource in resources:
+                        resource["type"] = locale.type(resource["type"])
+                        resource["title"] = locale.titles.get(resource["id"], resource["title"])
+                self.by_field[(main_field, sub_field)] = resources
+                for resource in resources:
+                    self.by_id[resource["id"]] = resource
+        # Full-text index across the whole catalog, shared by every session
+        self.index = SearchIndex(
+            (main_field, sub_field, resource)
+            for (main_field, sub_field), entries in self.by_field.items()
+            for resource in entries
+        )
+        self._recommender = None
+        self._recommender_lock = threading.Lock()
+        self._data = data
+        self._base = None
+        self._base_etag = etag
+        self._localized = {}
+        self._localized_lock = threading.Lock()
+
+    def resources_for(self, main_field, sub_field):
+        return self.by_field.get((main_field, sub_field), ())
+
+    def search(self, query, limit=50):
+        return self.index.search(query.strip().lower(), limit)
+
+    # Built on first use: it pulls in numpy and is not needed to serve the first page.
+    # Localized catalogs share the base catalog's recommender; its entries are in the
+    # same order, so map picks through by_id to show them localized.
+    @property
+    def recommender(self):
+        if self._base is not None:
+            return self._base.recommender
+        with self._recommender_lock:
+            if self._recommender is None:
+                from recommend import Recommender
+
+                self._recommender = Recommender(self.index.entries)
+        return self._recommender
+
+    # This catalog for `locale`, built on first use and kept until the catalog file or
+    # the bundle changes, so switching locales never rebuilds anything on a rerun
+    def localized(self, locale):
+        if locale is None or not locale.etag:
+            return self
+        with self._localized_lock:
+            catalog = self._localized.get(locale.code)
+            if catalog is None or catalog.locale.etag != locale.etag:
+                catalog = Catalog(self._data, self._base_etag, locale)
+                catalog._base = self
+                self._localized[locale.code] = catalog
+        return catalog
+
+    def __len__(self):
+        return len(self.by_id)
+
+
+# Give every entry without an id its own, in place, as the first key of the entry;
+# returns how many were added
+def assign_ids(data):
+    added = 0
+    for main_field, sub_fields in data["resources"].items():
+        for sub_field, entries in sub_fields.items():
+            for i, entry in enumerate(entries):
+                if not entry.get("id"):
+                    entries[i] = {"id": resource_id(main_field, sub_field, entry), **entry}
+                    added += 1
+    return added
+
+
+# Parse the catalog file into a Catalog, tagging it with a content hash
+def load_catalog(path=CATALOG_PATH):
+    with open(path, "rb") as f:
+        raw = f.read()
+    etag = hashlib.sha256(raw).hexdigest()[:12]
+    return Catalog(json.loads(raw), etag)
+
+
+# Built once per process per file revision; the mtime is part of the cache key
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _cached_catalog(path, mtime_ns):
+    return load_catalog(path)
+
+
+# Return the shared catalog, hot-reloading it when the file on disk changes
+def get_catalog(path=CATALOG_PATH):
+    return _cached_catalog(path, os.stat(path).st_mtime_ns)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Maintain the resource catalog file.")
+    parser.add_argument("command", choices=("assign-ids",))
+    parser.add_argument("--catalog", default=CATALOG_PATH)
+    args = parser.parse_args(argv)
+
+    with open(args.catalog, encoding="utf-8") as f:
+        data = json.load(f)
+    added = assign_ids(data)
+    ids = [entry["id"] for sub_fields in data["resources"].values() for entries in sub_fields.values() for entry in entries]
+    duplicates = sorted({entry_id for entry_id in ids if ids.count(entry_id) > 1})
+    if duplicates:
+        print(f"Duplicate ids: {', '.join(duplicates)}")
+        return 1
+    if added:
+        tmp_path = args.catalog + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(data, indent=2, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, args.catalog)
+    print(f"{added} id(s) added, {len(ids)} entries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
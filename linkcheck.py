@@ -0,0 +1,201 @@
+"""Audit every catalog link and record whether it still works.
+
+Links are checked concurrently with asyncio. requests runs in a thread pool
+and shares one pooled Session, so each host keeps its connections alive.
+There is a per-host limit on parallel requests and a per-host minimum delay
+between them. Results go into the link_status table of the app's SQLite
+database. The app reads that table to flag or hide dead links, so pages
+never touch the network.
+
+Usage:
+    python linkcheck.py                      # check links not checked in the last day
+    python linkcheck.py --force --per-host 1 --host-delay 0.5
+"""
+import argparse
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from store import DB_PATH, connect
+
+LINK_SCHEMA = """
+CREATE TABLE IF NOT EXISTS link_status (
+    url TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    status INTEGER,
+    error TEXT,
+    checked_at REAL NOT NULL
+);
+"""
+USER_AGENT = "LearningPathCreator-LinkCheck/1.0"
+# Only answers that mean the page is really gone count as dead. Sites that block
+# bots (401/403/429) or are briefly down (5xx) are recorded as "unknown".
+DEAD_STATUSES = {404, 410}
+# Errors that mean the host or URL itself is gone; timeouts and TLS trouble are "unknown"
+DEAD_ERRORS = ("ConnectionError", "InvalidURL", "MissingSchema", "InvalidSchema")
+# HEAD is not allowed everywhere; retry these with a GET
+HEAD_UNSUPPORTED = {400, 403, 405, 501}
+
+
+def classify(status, error):
+    if error is not None:
+        return "dead" if error.startswith(DEAD_ERRORS) else "unknown"
+    if status < 400:
+        return "ok"
+    return "dead" if status in DEAD_STATUSES else "unknown"
+
+
+# Stored link states: {url: (state, status, error, checked_at)}
+class LinkStatusStore:
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        conn = connect(path)
+        try:
+            conn.executescript(LINK_SCHEMA)
+        finally:
+            conn.close()
+
+    def save_many(self, results):
+        conn = connect(self.path)
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO link_status (url, state, status, error, checked_at) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(url) DO UPDATE SET state = excluded.state, status = excluded.status, "
+                    "error = excluded.error, checked_at = excluded.checked_at",
+                    results,
+                )
+        finally:
+            conn.close()
+
+    def load_all(self):
+        conn = connect(self.path)
+        try:
+            rows = conn.execute("SELECT url, state, status, error, checked_at FROM link_status").fetchall()
+        finally:
+            conn.close()
+        return {url: (state, status, error, checked_at) for url, state, status, error, checked_at in rows}
+
+    # (last check time, frozenset of dead urls); the time changes whenever an audit writes
+    def dead_links(self):
+        conn = connect(self.path)
+        try:
+            (version,) = conn.execute("SELECT COALESCE(MAX(checked_at), 0) FROM link_status").fetchone()
+            dead = frozenset(url for (url,) in conn.execute("SELECT url FROM link_status WHERE state = 'dead'"))
+        finally:
+            conn.close()
+        return version, dead
+
+
+# Per-host concurrency limit plus a minimum gap between request starts
+class _HostGate:
+    def __init__(self, per_host, delay):
+        self.semaphore = asyncio.Semaphore(per_host)
+        self.delay = delay
+        self.next_start = 0.0
+        self.lock = asyncio.Lock()
+
+    async def wait_turn(self):
+        async with self.lock:
+            now = time.monotonic()
+            if self.next_start > now:
+                await asyncio.sleep(self.next_start - now)
+            self.next_start = max(now, self.next_start) + self.delay
+
+
+def _make_session(pool_size):
+    import requests
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+# Blocking single check, run in the thread pool: (status, error)
+def _fetch(session, url, timeout):
+    try:
+        with session.head(url, timeout=timeout, allow_redirects=True) as response:
+            status = response.status_code
+        if status in HEAD_UNSUPPORTED:
+            with session.get(url, timeout=timeout, allow_redirects=True, stream=True) as response:
+                status = response.status_code
+        return status, None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"[:500]
+
+
+# Check `urls` concurrently; returns [(url, state, status, error, checked_at)]
+async def check_links(urls, concurrency=32, per_host=2, host_delay=0.0, timeout=10.0):
+    loop = asyncio.get_running_loop()
+    session = _make_session(concurrency)
+    gates = {}
+    limit = asyncio.Semaphore(concurrency)
+
+    async def check(url, executor):
+        gate = gates.setdefault(urlparse(url).netloc.lower(), _HostGate(per_host, host_delay))
+        async with limit, gate.semaphore:
+            await gate.wait_turn()
+            status, error = await loop.run_in_executor(executor, _fetch, session, url, timeout)
+        return url, classify(status, error), status, error, time.time()
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="linkcheck") as executor:
+            return await asyncio.gather(*(check(url, executor) for url in urls))
+    finally:
+        session.close()
+
+
+# Urls in the catalog that have not been checked within `max_age` seconds
+def urls_due(urls, stored, max_age, now=None):
+    now = time.time() if now is None else now
+    return [url for url in urls if url not in stored or now - stored[url][3] >= max_age]
+
+
+def catalog_urls(catalog_path):
+    from catalog import load_catalog
+
+    return sorted({resource["link"] for resource in load_catalog(catalog_path).by_id.values()})
+
+
+def main(argv=None):
+    from catalog import CATALOG_PATH
+
+    parser = argparse.ArgumentParser(description="Check every catalog link and cache the result.")
+    parser.add_argument("--catalog", default=CATALOG_PATH)
+    parser.add_argument("--db", default=DB_PATH, help="SQLite database the app reads link states from")
+    parser.add_argument("--concurrency", type=int, default=32, help="requests in flight overall")
+    parser.add_argument("--per-host", type=int, default=2, help="requests in flight per host")
+    parser.add_argument("--host-delay", type=float, default=0.25, help="seconds between requests to one host")
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--max-age-hours", type=float, default=24.0, help="recheck links older than this")
+    parser.add_argument("--force", action="store_true", help="recheck every link")
+    args = parser.parse_args(argv)
+
+    store = LinkStatusStore(args.db)
+    urls = catalog_urls(args.catalog)
+    due = urls if args.force else urls_due(urls, store.load_all(), args.max_age_hours * 3600)
+    started = time.perf_counter()
+    results = asyncio.run(check_links(
+        due, concurrency=args.concurrency, per_host=args.per_host,
+        host_delay=args.host_delay, timeout=args.timeout,
+    ))
+    store.save_many(results)
+    elapsed = time.perf_counter() - started
+
+    states = {}
+    for url, state, status, error, _ in results:
+        states[state] = states.get(state, 0) + 1
+        if state != "ok":
+            print(f"{state:<8} {status or '-':>4} {url} {error or ''}".rstrip())
+    summary = ", ".join(f"{count} {state}" for state, count in sorted(states.items())) or "nothing due"
+    print(f"Checked {len(due)} of {len(urls)} links in {elapsed:.1f}s: {summary}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
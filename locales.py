@@ -0,0 +1,195 @@
+"""Locale bundles: translated UI strings, field names, goals and step templates.
+
+One JSON file per locale in data/locales, named after its code (es.json,
+pt-br.json). Every section maps English source text to its translation, and
+anything left out stays in English:
+
+    {"version": 1, "name": "Español",
+     "strings": {"Save Inputs": "Guardar datos", "Step {number}:": "Paso {number}:"},
+     "fields": {"Cooking": "Cocina"}, "types": {"Book": "Libro"},
+     "goals": {"Read more books": "Leer más libros"},
+     "steps": {"Set a daily {sub_field} practice schedule": "..."},
+     "titles": {"<resource id>": "translated resource title"}}
+
+Bundles are checked when they are loaded: a translation must use exactly the
+same {placeholders} as its English text. English ("en") is always available.
+
+Usage:
+    python locales.py check        # report missing, unused and broken translations
+"""
+import argparse
+import ast
+import glob
+import hashlib
+import json
+import os
+import string
+import sys
+
+import streamlit as st
+
+LOCALES_PATH = os.environ.get(
+    "LPC_LOCALES_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "locales"),
+)
+DEFAULT_LOCALE = os.environ.get("LPC_DEFAULT_LOCALE", "en").lower()
+SECTIONS = ("strings", "fields", "types", "goals", "steps", "titles")
+
+_formatter = string.Formatter()
+
+
+def placeholders(text):
+    return sorted({name for _, name, _, _ in _formatter.parse(text) if name is not None})
+
+
+# One language's translations. Lookups are plain dict gets with the English
+# text as the fallback, so an untranslated entry costs the same as a translated one.
+class Locale:
+    __slots__ = ("code", "name", "etag", *SECTIONS)
+
+    def __init__(self, code, name, etag="", **sections):
+        self.code = code
+        self.name = name
+        # Content hash of the bundle; empty for the built-in English locale
+        self.etag = etag
+        for section in SECTIONS:
+            setattr(self, section, sections.get(section) or {})
+
+    # Translate a UI string, filling in any {placeholders} from `values`
+    def t(self, text, **values):
+        text = self.strings.get(text, text)
+        return text.format(**values) if values else text
+
+    def field(self, name):
+        return self.fields.get(name, name)
+
+    def goal(self, name):
+        return self.goals.get(name, name)
+
+    def type(self, name):
+        return self.types.get(name, name)
+
+
+ENGLISH = Locale("en", "English")
+
+
+def _bundle_files(path):
+    return sorted(glob.glob(os.path.join(path, "*.json"))) if os.path.isdir(path) else []
+
+
+# Parse and check one bundle file
+def load_locale(file_path):
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    data = json.loads(raw)
+    code = os.path.splitext(os.path.basename(file_path))[0].lower()
+    sections = {}
+    for section in SECTIONS:
+        entries = data.get(section) or {}
+        for source, text in entries.items():
+            if not isinstance(text, str):
+                raise ValueError(f"{code}.json: {section}[{source!r}] must be a string")
+            if section in ("strings", "steps") and placeholders(text) != placeholders(source):
+                raise ValueError(f"{code}.json: {section}[{source!r}] must use {placeholders(source)}, not {placeholders(text)}")
+        sections[section] = dict(entries)
+    return Locale(code, data.get("name") or code, hashlib.sha256(raw).hexdigest()[:12], **sections)
+
+
+# {code: Locale} for every bundle under `path`, plus English
+def load_locales(path=LOCALES_PATH):
+    locales = {ENGLISH.code: ENGLISH}
+    for file_path in _bundle_files(path):
+        locale = load_locale(file_path)
+        locales[locale.code] = locale
+    return locales
+
+
+# Changes whenever a bundle is added, removed or edited
+def _signature(path):
+    return tuple((file_path, os.stat(file_path).st_mtime_ns) for file_path in _bundle_files(path))
+
+
+# Built once per process per revision of the bundle files
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _cached_locales(path, signature):
+    return load_locales(path)
+
+
+# Return the shared bundles, reloading them when a bundle file changes
+def get_locales(path=LOCALES_PATH):
+    return _cached_locales(path, _signature(path))
+
+
+# Language tags from an Accept-Language header, most preferred first
+def accept_languages(header):
+    tags = []
+    for position, item in enumerate((header or "").split(",")):
+        tag, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                continue
+        if tag and tag != "*" and quality > 0:
+            tags.append((-quality, position, tag.lower().replace("_", "-")))
+    return [tag for _, _, tag in sorted(tags)]
+
+
+# Pick a locale code: the requested one (e.g. ?lang=), then the browser's preferences,
+# then the default. "pt-BR" falls back to "pt" when only that bundle exists.
+def negotiate(available, requested=None, accept_language=None, default=DEFAULT_LOCALE):
+    candidates = [requested.lower().replace("_", "-")] if requested else []
+    for tag in candidates + accept_languages(accept_language):
+        if tag in available:
+            return tag
+        base = tag.split("-")[0]
+        if base in available:
+            return base
+    return default if default in available else ENGLISH.code
+
+
+# English texts passed to t(...) or locale.t(...) in a script, with their line numbers
+def source_strings(script_path):
+    with open(script_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), script_path)
+    found = {}
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and getattr(node.func, "id", getattr(node.func, "attr", None)) == "t"
+            and node.args and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str)
+        ):
+            found.setdefault(node.args[0].value, node.lineno)
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check locale bundles against the app's UI strings.")
+    parser.add_argument("command", choices=("check",))
+    parser.add_argument("--locales", default=LOCALES_PATH)
+    parser.add_argument("--script", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py"))
+    args = parser.parse_args(argv)
+
+    used = source_strings(args.script)
+    failed = False
+    for file_path in _bundle_files(args.locales):
+        try:
+            locale = load_locale(file_path)
+        except ValueError as e:
+            print(e)
+            failed = True
+            continue
+        missing = [text for text in used if text not in locale.strings]
+        unused = [text for text in locale.strings if text not in used]
+        print(f"{locale.code} ({locale.name}): {len(used) - len(missing)}/{len(used)} strings translated")
+        for text in missing:
+            print(f"  missing (app.py:{used[text]}): {text!r}")
+        for text in unused:
+            print(f"  unused: {text!r}")
+        failed = failed or bool(missing)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
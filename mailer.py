@@ -0,0 +1,168 @@
+import logging
+import queue
+import smtplib
+import threading
+import time
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+logger = logging.getLogger(__name__)
+
+
+# Reusable, authenticated SMTP connection that reconnects when the server drops it
+class SMTPTransport:
+    def __init__(self, host, port, username=None, password=None, use_tls=True,
+                 timeout=30, keepalive=60):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.keepalive = keepalive
+        self._server = None
+        self._last_used = 0.0
+
+    def _connect(self):
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.use_tls:
+            server.starttls()
+        if self.username:
+            server.login(self.username, self.password)
+        self._server = server
+
+    # Check an idle connection is still alive before reusing it
+    def _ensure_connected(self):
+        if self._server is not None and time.monotonic() - self._last_used > self.keepalive:
+            try:
+                if self._server.noop()[0] != 250:
+                    self.close()
+            except smtplib.SMTPException:
+                self.close()
+        if self._server is None:
+            self._connect()
+
+    def send(self, sender, recipients, message):
+        self._ensure_connected()
+        try:
+            self._server.sendmail(sender, recipients, message)
+        except smtplib.SMTPServerDisconnected:
+            # Server closed the connection between noops; retry once on a fresh one
+            self.close()
+            self._connect()
+            self._server.sendmail(sender, recipients, message)
+        self._last_used = time.monotonic()
+
+    def close(self):
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._server = None
+
+
+# Transport that keeps messages in memory instead of sending them (offline runs, benchmarks)
+class MemoryTransport:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, sender, recipients, message):
+        self.sent.append((sender, recipients, message))
+
+    def close(self):
+        pass
+
+
+# Background mail queue: submissions return immediately and a worker thread delivers them
+class Mailer:
+    def __init__(self, transport, sender, receiver, queue_size=100, batch_window=2.0,
+                 max_batch=20, max_retries=3, backoff=1.0):
+        self.transport = transport
+        self.sender = sender
+        self.receiver = receiver
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._worker = threading.Thread(target=self._run, name="mailer", daemon=True)
+        self._worker.start()
+
+    # Queue a message for delivery; returns False when the queue is full
+    def submit(self, subject, body):
+        try:
+            self._queue.put_nowait((subject, body))
+            return True
+        except queue.Full:
+            logger.warning("Mail queue full, dropping message: %s", subject)
+            return False
+
+    # Block until every queued message has been handled (used by scripts and shutdown)
+    def flush(self):
+        self._queue.join()
+
+    # Collect everything that arrives within the batch window, up to max_batch messages
+    def _next_batch(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.batch_window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    # The only worker: an unexpected error loses that digest, never the thread
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            try:
+                for subject, body in group_digests(batch):
+                    try:
+                        self._deliver(subject, body)
+                    except Exception:
+                        logger.exception("Failed to send email %r", subject)
+            except Exception:
+                logger.exception("Failed to group %d queued emails", len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _deliver(self, subject, body):
+        message = build_message(self.sender, self.receiver, subject, body)
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.transport.send(self.sender, [self.receiver], message)
+                return True
+            except (smtplib.SMTPException, OSError) as e:
+                self.transport.close()
+                if attempt == self.max_retries:
+                    logger.error("Failed to send email %r: %s", subject, e)
+                    return False
+                time.sleep(self.backoff * 2 ** attempt)
+
+
+# Merge queued messages sharing a subject into a single digest email
+def group_digests(batch):
+    grouped = {}
+    for subject, body in batch:
+        grouped.setdefault(subject, []).append(body)
+    for subject, bodies in grouped.items():
+        if len(bodies) == 1:
+            yield subject, bodies[0]
+        else:
+            separator = "\n" + "-" * 40 + "\n"
+            yield f"{subject} ({len(bodies)} submissions)", separator.join(bodies)
+
+
+def build_message(sender, receiver, subject, body):
+    message = MIMEMultipart()
+    message["From"] = sender
+    message["To"] = receiver
+    message["Subject"] = subject
+    message.attach(MIMEText(body, "plain"))
+    return message.as_string()
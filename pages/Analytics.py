@@ -0,0 +1,88 @@
+import os
+
+import pandas as pd
+import streamlit as st
+
+from analytics import AnalyticsStore
+from catalog import get_catalog
+from store import DB_PATH
+
+# The dashboard shows aggregate usage of every learner, so it is off unless enabled
+ANALYTICS_ADMIN = os.environ.get("LPC_ANALYTICS_ADMIN") == "1"
+TOP = 15
+RATING_DAYS = 90
+
+# Shared analytics store, opened once per process
+@st.cache_resource(show_spinner=False)
+def get_analytics():
+    return AnalyticsStore(DB_PATH)
+
+# Everything the charts need, read from the rollup tables only. Each query is
+# bounded by TOP or RATING_DAYS, so this costs the same at any event volume.
+@st.cache_data(ttl=30, show_spinner=False)
+def dashboard_data():
+    store = get_analytics()
+    return {
+        "totals": store.totals(),
+        "main_field": store.top("main_field", TOP),
+        "sub_field": store.top("sub_field", TOP),
+        "goal": store.top("goal", TOP),
+        "interest": store.top("interest", TOP),
+        "favorite": store.top("favorite", TOP),
+        "ratings": store.daily_ratings(RATING_DAYS),
+    }
+
+def bar_chart(title, rows, label):
+    st.subheader(title)
+    if not rows:
+        st.caption("No data yet.")
+        return
+    st.bar_chart(pd.DataFrame(rows, columns=[label, "users"]), x=label, y="users", horizontal=True)
+
+def main():
+    st.set_page_config(page_title="Analytics - Learning Path Creator", page_icon="📊", layout="wide")
+    st.title("📊 Usage Analytics")
+    if not ANALYTICS_ADMIN:
+        st.info("The analytics dashboard is for admins. Set LPC_ANALYTICS_ADMIN=1 to enable it.")
+        st.stop()
+
+    data = dashboard_data()
+    totals = data["totals"]
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Saved inputs", totals.get("inputs", 0))
+    col2.metric("Favorites added", totals.get("favorite", 0))
+    col3.metric("Feedback ratings", totals.get("feedback", 0))
+
+    st.subheader("⭐ Average app rating")
+    if data["ratings"]:
+        ratings = pd.DataFrame(data["ratings"], columns=["day", "ratings", "average"])
+        ratings["day"] = pd.to_datetime(ratings["day"])
+        st.line_chart(ratings, x="day", y="average")
+        st.bar_chart(ratings, x="day", y="ratings", height=150)
+    else:
+        st.caption("No feedback yet.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        bar_chart("🎯 Popular main fields", data["main_field"], "main field")
+        bar_chart("🚀 Popular goals", data["goal"], "goal")
+    with col2:
+        bar_chart("🔍 Popular sub-fields", data["sub_field"], "sub-field")
+        bar_chart("🎨 Popular interests", data["interest"], "interest")
+
+    st.subheader("❤️ Most-favorited resources")
+    if data["favorite"]:
+        by_id = get_catalog().by_id
+        st.dataframe(
+            [
+                {"resource": by_id[rid]["title"] if rid in by_id else rid, "users": count}
+                for rid, count in data["favorite"]
+            ],
+            hide_index=True,
+            use_container_width=True,
+        )
+    else:
+        st.caption("No favorites yet.")
+    st.caption("Figures refresh every 30 seconds.")
+
+main()
@@ -0,0 +1,159 @@
+import contextlib
+import functools
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Profiling is on for the whole process with LPC_PROFILE=1, or per script run via enable_for_run()
+ENABLED = os.environ.get("LPC_PROFILE", "") not in ("", "0")
+DUMP_INTERVAL = float(os.environ.get("LPC_PROFILE_DUMP_SECONDS", "60"))
+
+# Histogram bucket upper bounds, in seconds
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+_run_state = threading.local()
+_NULL_SECTION = contextlib.nullcontext()
+
+
+# Latency histogram for one instrumented section
+class _Metric:
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def observe(self, seconds):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+
+# Process-wide store of section timings, shared by every session
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+        self._dumper = None
+
+    def observe(self, name, seconds):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = _Metric()
+            metric.observe(seconds)
+
+    # Per-section summary rows: name, count, mean/max in milliseconds
+    def summary(self):
+        with self._lock:
+            return [
+                {
+                    "section": name,
+                    "count": m.count,
+                    "mean_ms": m.total / m.count * 1000,
+                    "max_ms": m.max * 1000,
+                }
+                for name, m in sorted(self._metrics.items())
+            ]
+
+    # Prometheus text exposition format
+    def prometheus_text(self):
+        lines = [
+            "# HELP lpc_section_seconds Time spent in an app section per rerun.",
+            "# TYPE lpc_section_seconds histogram",
+        ]
+        with self._lock:
+            for name, m in sorted(self._metrics.items()):
+                cumulative = 0
+                for bound, hits in zip(BUCKETS + ("+Inf",), m.buckets):
+                    cumulative += hits
+                    lines.append(f'lpc_section_seconds_bucket{{section="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'lpc_section_seconds_sum{{section="{name}"}} {m.total:.6f}')
+                lines.append(f'lpc_section_seconds_count{{section="{name}"}} {m.count}')
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._metrics.clear()
+
+    # Log the metrics every DUMP_INTERVAL seconds from a background thread
+    def start_periodic_dump(self, interval=DUMP_INTERVAL):
+        with self._lock:
+            if self._dumper is not None or interval <= 0:
+                return
+            self._dumper = threading.Thread(
+                target=self._dump_loop, args=(interval,), name="profiler-dump", daemon=True
+            )
+            self._dumper.start()
+
+    def _dump_loop(self, interval):
+        while True:
+            time.sleep(interval)
+            logger.info("Section timings:\n%s", self.prometheus_text())
+
+
+REGISTRY = Registry()
+
+
+# Turn profiling on or off for the current script run (e.g. from a ?profile=1 query param).
+# Sections are recorded in REGISTRY and, if given, in the session's own Registry too.
+def enable_for_run(enabled, session=None):
+    _run_state.enabled = enabled
+    _run_state.session = session
+    if enabled or ENABLED:
+        REGISTRY.start_periodic_dump()
+
+
+def is_enabled():
+    return ENABLED or getattr(_run_state, "enabled", False)
+
+
+class _Section:
+    __slots__ = ("name", "started")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self.started
+        REGISTRY.observe(self.name, seconds)
+        session = getattr(_run_state, "session", None)
+        if session is not None:
+            session.observe(self.name, seconds)
+        return False
+
+
+# Time a block: `with section("sidebar"): ...`. A shared no-op context when profiling is off.
+def section(name):
+    if ENABLED or getattr(_run_state, "enabled", False):
+        return _Section(name)
+    return _NULL_SECTION
+
+
+# Decorator form of section()
+def timed(name):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not (ENABLED or getattr(_run_state, "enabled", False)):
+                return func(*args, **kwargs)
+            with _Section(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,169 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from search import domain_tokens, tokenize
+
+# How much each kind of resource feature counts towards a match
+FEATURE_WEIGHTS = {"main": 1.0, "sub": 2.0, "type": 0.5, "word": 1.0, "host": 0.5}
+# How much each part of the profile counts
+INTEREST_WEIGHT = 1.0
+FIELD_WEIGHT = 2.0
+GOAL_WEIGHT = 0.5
+FAVORITE_WEIGHT = 1.0
+# Ratings are centred on 3 stars, so a 1-star review pushes similar resources down
+RATING_CENTRE = 3.0
+CACHE_SIZE = 4096
+
+
+def resource_features(main_field, sub_field, resource):
+    features = [("main", main_field), ("sub", f"{main_field}/{sub_field}"), ("type", resource["type"].lower())]
+    features += [("word", token) for token in tokenize(resource["title"])]
+    features += [("host", token) for token in domain_tokens(resource["link"])]
+    return features
+
+
+# Everything about a user the recommender looks at, in a hashable, order-independent form
+def make_profile(user_data, favorites=(), ratings=None):
+    return (
+        tuple(sorted(user_data.get("interests") or ())),
+        user_data.get("main_field") or "",
+        user_data.get("sub_field") or "",
+        user_data.get("goal") or "",
+        tuple(sorted(favorites)),
+        tuple(sorted((ratings or {}).items())),
+    )
+
+
+def profile_digest(profile):
+    return hashlib.sha1(json.dumps(profile).encode("utf-8")).hexdigest()
+
+
+# Mean star rating per resource id from session reviews ({resource_id: [Review, ...]})
+def review_ratings(reviews):
+    ratings = {}
+    for resource_id, items in reviews.items():
+        stars = [r.rating for r in items if r.rating is not None]
+        if stars:
+            ratings[resource_id] = sum(stars) / len(stars)
+    return ratings
+
+
+# Content-based recommender over a sparse resource x feature matrix.
+# The matrix is stored column-wise (CSC: indptr/rows/values per feature), so scoring a
+# profile only touches the columns of the handful of features the profile mentions,
+# not every resource; top-K is an argpartition over the accumulated scores.
+class Recommender:
+    def __init__(self, entries):
+        # entries: sequence of (main_field, sub_field, resource) in catalog order
+        self.entries = tuple(entries)
+        self.row_of = {resource["id"]: row for row, (_, _, resource) in enumerate(self.entries)}
+        columns = {}
+        rows, cols, base = [], [], []
+        for row, (main_field, sub_field, resource) in enumerate(self.entries):
+            features = {}
+            for kind, value in resource_features(main_field, sub_field, resource):
+                col = columns.setdefault((kind, value), len(columns))
+                features[col] = max(features.get(col, 0.0), FEATURE_WEIGHTS[kind])
+            rows.extend([row] * len(features))
+            cols.extend(features)
+            base.extend(features.values())
+        self.columns = columns
+        n_rows = len(self.entries)
+        rows = np.asarray(rows, dtype=np.int32)
+        cols = np.asarray(cols, dtype=np.int32)
+
+        # idf down-weights features shared by most of the catalog; rows are L2-normalised
+        df = np.bincount(cols, minlength=len(columns))
+        idf = np.log((1 + n_rows) / (1 + df)) + 1.0
+        weights = np.asarray(base) * idf[cols]
+        norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=n_rows))
+        values = (weights / np.where(norms > 0, norms, 1.0)[rows]).astype(np.float32)
+
+        order = np.argsort(cols, kind="stable")
+        self._rows = rows[order]
+        self._values = values[order]
+        self._indptr = np.zeros(len(columns) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cols, minlength=len(columns)), out=self._indptr[1:])
+        # Row-wise copy for reading a single resource's features (favorites, reviews)
+        self._row_indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n_rows), out=self._row_indptr[1:])
+        self._row_cols = cols
+        self._row_values = values
+
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _add_feature(self, weights, kind, value, weight):
+        col = self.columns.get((kind, value))
+        if col is not None:
+            weights[col] = weights.get(col, 0.0) + weight
+
+    def _add_resource(self, weights, resource_id, weight):
+        row = self.row_of.get(resource_id)
+        if row is None:
+            return
+        start, end = self._row_indptr[row], self._row_indptr[row + 1]
+        for col, value in zip(self._row_cols[start:end].tolist(), self._row_values[start:end].tolist()):
+            weights[col] = weights.get(col, 0.0) + weight * value
+
+    # Sparse profile vector as {column: weight}
+    def profile_weights(self, profile):
+        interests, main_field, sub_field, goal, favorites, ratings = profile
+        weights = {}
+        for interest in interests:
+            self._add_feature(weights, "main", interest, INTEREST_WEIGHT)
+        if main_field:
+            self._add_feature(weights, "main", main_field, FIELD_WEIGHT)
+            self._add_feature(weights, "sub", f"{main_field}/{sub_field}", FIELD_WEIGHT)
+        for token in tokenize(goal):
+            self._add_feature(weights, "word", token, GOAL_WEIGHT)
+        for resource_id in favorites:
+            self._add_resource(weights, resource_id, FAVORITE_WEIGHT)
+        for resource_id, rating in ratings:
+            self._add_resource(weights, resource_id, (rating - RATING_CENTRE) / 2)
+        return weights
+
+    # Score every resource against the profile; returns a dense float32 array
+    def scores(self, profile):
+        weights = self.profile_weights(profile)
+        if not weights:
+            return np.zeros(len(self.entries), dtype=np.float32)
+        # Gather the touched columns and sum them per row in one pass
+        spans = [(self._indptr[col], self._indptr[col + 1], weight) for col, weight in weights.items()]
+        rows = np.concatenate([self._rows[start:end] for start, end, _ in spans])
+        values = np.concatenate([self._values[start:end] * weight for start, end, weight in spans])
+        return np.bincount(rows, weights=values, minlength=len(self.entries)).astype(np.float32)
+
+    def _top_k(self, profile, k, exclude):
+        scores = self.scores(profile)
+        skip = [self.row_of[rid] for rid in (*profile[4], *exclude) if rid in self.row_of]
+        scores[skip] = -np.inf
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        # Highest score first, catalog order between ties
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+        return tuple(self.entries[row] for row in candidates.tolist())
+
+    # Top `k` (main_field, sub_field, resource) entries for a profile (see make_profile),
+    # leaving out its favorites and any ids in `exclude`. Cached per profile hash.
+    def recommend(self, profile, k=10, exclude=()):
+        exclude = tuple(sorted(exclude))
+        key = (profile_digest(profile), k, hashlib.sha1("\x1f".join(exclude).encode("utf-8")).hexdigest())
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        result = self._top_k(profile, k, exclude)
+        with self._lock:
+            self._cache[key] = result
+            if len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
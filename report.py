@@ -0,0 +1,117 @@
+import hashlib
+import json
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfgen import canvas
+
+PAGE_WIDTH, PAGE_HEIGHT = letter
+MARGIN = 72
+LINE_HEIGHT = 16
+FONT = "Helvetica"
+BOLD_FONT = "Helvetica-Bold"
+
+PROFILE_LABELS = {
+    "interests": "Interests",
+    "main_field": "Main field",
+    "sub_field": "Sub-field",
+    "goal": "Goal",
+}
+# Sections rendered in their own block rather than in the profile summary
+SECTION_KEYS = ("learning_path", "favorites", "reviews")
+
+
+# Stable content hash of a report payload, used as its cache key
+def report_digest(data):
+    encoded = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+# Replace the resource ids in saved favorites/reviews with catalog entries and titles
+def expand_resource_ids(data, resources_by_id):
+    data = dict(data)
+    data["favorites"] = [
+        resources_by_id[rid] for rid in data.get("favorites") or [] if rid in resources_by_id
+    ]
+    data["reviews"] = {
+        resources_by_id[rid]["title"]: [r["text"] if isinstance(r, dict) else r for r in items]
+        for rid, items in (data.get("reviews") or {}).items()
+        if rid in resources_by_id
+    }
+    return data
+
+
+# Canvas wrapper that keeps track of the cursor and starts a new page when one fills up
+class _ReportWriter:
+    def __init__(self, out):
+        self.canvas = canvas.Canvas(out, pagesize=letter)
+        self.page = 1
+        self._start_page()
+
+    def _start_page(self):
+        self.y = PAGE_HEIGHT - MARGIN
+        self.canvas.setFont(FONT, 9)
+        self.canvas.drawRightString(PAGE_WIDTH - MARGIN, MARGIN / 2, f"Page {self.page}")
+
+    def _ensure_room(self, lines=1):
+        if self.y - lines * LINE_HEIGHT < MARGIN:
+            self.canvas.showPage()
+            self.page += 1
+            self._start_page()
+
+    def heading(self, text, size=14):
+        self.y -= LINE_HEIGHT / 2
+        self._ensure_room(2)
+        self.canvas.setFont(BOLD_FONT, size)
+        self.canvas.drawString(MARGIN, self.y, text)
+        self.y -= LINE_HEIGHT * 1.5
+
+    # Draw text wrapped to the page width, breaking across pages as needed
+    def text(self, text, indent=0, font=FONT, size=11):
+        width = PAGE_WIDTH - 2 * MARGIN - indent
+        for line in simpleSplit(str(text), font, size, width) or [""]:
+            self._ensure_room()
+            self.canvas.setFont(font, size)
+            self.canvas.drawString(MARGIN + indent, self.y, line)
+            self.y -= LINE_HEIGHT
+
+    def save(self):
+        self.canvas.save()
+
+
+# Render a learning path report (saved user_data shape) as PDF into the binary file `out`
+def render_pdf(data, out):
+    writer = _ReportWriter(out)
+    writer.heading("Learning Path Report", size=18)
+
+    for key, value in data.items():
+        if key in SECTION_KEYS:
+            continue
+        label = PROFILE_LABELS.get(key, key)
+        if isinstance(value, list):
+            value = ", ".join(map(str, value)) or "-"
+        writer.text(f"{label}: {value}")
+
+    steps = data.get("learning_path") or []
+    if steps:
+        writer.heading("Learning Path")
+        for idx, step in enumerate(steps, 1):
+            writer.text(f"{idx}. {step}", indent=12)
+
+    favorites = data.get("favorites") or []
+    if favorites:
+        writer.heading("Favorite Resources")
+        for fav in favorites:
+            writer.text(f"- {fav['title']} ({fav['type']})", indent=12)
+            writer.text(fav["link"], indent=24, size=9)
+
+    reviews = data.get("reviews") or {}
+    if reviews:
+        writer.heading("Reviews")
+        for title, texts in reviews.items():
+            writer.text(title, font=BOLD_FONT, indent=12)
+            for text in texts:
+                writer.text(f"- {text}", indent=24)
+
+    writer.save()
+    return writer.page
@@ -0,0 +1,123 @@
+import threading
+import time
+
+from store import ConnectionPool
+
+
+# One user review; slotted so thousands of them stay small in session state
+class Review:
+    __slots__ = ("text", "rating", "created_at")
+
+    def __init__(self, text, rating=None, created_at=None):
+        self.text = text
+        self.rating = rating
+        self.created_at = time.time() if created_at is None else created_at
+
+    def to_dict(self):
+        return {"text": self.text, "rating": self.rating, "created_at": self.created_at}
+
+    @classmethod
+    def from_dict(cls, data):
+        if isinstance(data, str):  # paths saved before reviews were records
+            return cls(data, None, 0.0)
+        return cls(data["text"], data.get("rating"), data.get("created_at", 0.0))
+
+
+# A session keeps only a learner's latest reviews per resource; every review
+# is still stored in the shared ReviewStore
+SESSION_REVIEWS_PER_RESOURCE = 20
+
+
+# Reviews are kept per resource id: {resource_id: [Review, ...]}
+def add_review(reviews, resource_id, text, rating=None, keep=SESSION_REVIEWS_PER_RESOURCE):
+    items = reviews.setdefault(resource_id, [])
+    items.append(Review(text, rating))
+    del items[:-keep]
+
+
+def dump_reviews(reviews):
+    return {resource_id: [r.to_dict() for r in items] for resource_id, items in reviews.items()}
+
+
+def load_reviews(data):
+    return {resource_id: [Review.from_dict(r) for r in items] for resource_id, items in (data or {}).items()}
+
+
+REVIEW_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reviews (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    resource_id TEXT NOT NULL,
+    user_id TEXT,
+    rating INTEGER,
+    text TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_reviews_resource ON reviews (resource_id, id);
+CREATE TABLE IF NOT EXISTS review_stats (
+    resource_id TEXT PRIMARY KEY,
+    review_count INTEGER NOT NULL,
+    rating_count INTEGER NOT NULL,
+    rating_sum INTEGER NOT NULL
+);
+"""
+
+
+# Aggregates for one resource, maintained on every write
+class ReviewStats:
+    __slots__ = ("count", "rating_count", "rating_sum")
+
+    def __init__(self, count=0, rating_count=0, rating_sum=0):
+        self.count = count
+        self.rating_count = rating_count
+        self.rating_sum = rating_sum
+
+    @property
+    def average(self):
+        return self.rating_sum / self.rating_count if self.rating_count else None
+
+
+# Reviews shared by every user of the server, with per-resource aggregates and
+# keyset pagination so a page costs the same no matter how many reviews exist
+class ReviewStore:
+    def __init__(self, path):
+        self.path = path
+        self._pool = ConnectionPool(path)
+        self._write_lock = threading.Lock()
+        with self._pool.connection() as conn:
+            conn.executescript(REVIEW_SCHEMA)
+
+    def add(self, resource_id, text, rating=None, user_id=None):
+        with self._pool.connection() as conn, self._write_lock, conn:
+            conn.execute(
+                "INSERT INTO reviews (resource_id, user_id, rating, text, created_at) VALUES (?, ?, ?, ?, ?)",
+                (resource_id, user_id, rating, text, time.time()),
+            )
+            conn.execute(
+                "INSERT INTO review_stats (resource_id, review_count, rating_count, rating_sum) "
+                "VALUES (?, 1, ?, ?) ON CONFLICT(resource_id) DO UPDATE SET "
+                "review_count = review_count + 1, "
+                "rating_count = rating_count + excluded.rating_count, "
+                "rating_sum = rating_sum + excluded.rating_sum",
+                (resource_id, 0 if rating is None else 1, rating or 0),
+            )
+
+    def stats(self, resource_id):
+        with self._pool.connection() as conn:
+            row = conn.execute(
+                "SELECT review_count, rating_count, rating_sum FROM review_stats WHERE resource_id = ?",
+                (resource_id,),
+            ).fetchone()
+        return ReviewStats(*row) if row else ReviewStats()
+
+    # Newest-first page of (id, rating, text) rows older than review id `before`
+    def page(self, resource_id, before=None, limit=10):
+        with self._pool.connection() as conn:
+            if before is None:
+                return conn.execute(
+                    "SELECT id, rating, text FROM reviews WHERE resource_id = ? ORDER BY id DESC LIMIT ?",
+                    (resource_id, limit),
+                ).fetchall()
+            return conn.execute(
+                "SELECT id, rating, text FROM reviews WHERE resource_id = ? AND id < ? ORDER BY id DESC LIMIT ?",
+                (resource_id, before, limit),
+            ).fetchall()
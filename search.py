@@ -0,0 +1,90 @@
+import heapq
+import re
+import unicodedata
+from bisect import bisect_left
+from functools import lru_cache
+from urllib.parse import urlparse
+
+# A letter or digit in any script, then letters, digits, "+" or "#" ("c++", "c#")
+TOKEN_RE = re.compile(r"[^\W_](?:[^\W_]|[+#])*")
+
+# Relative weight of a token depending on where it appears in a resource
+FIELD_WEIGHTS = {"title": 3.0, "type": 2.0, "domain": 1.0}
+# Prefix matches count for less than whole-token matches
+PREFIX_FACTOR = 0.5
+
+
+# Case- and accent-insensitive form of text: "Guía" -> "guia", "Straße" -> "strasse"
+def fold(text):
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+# Split text into folded search tokens; used for the index and for queries alike
+def tokenize(text):
+    return TOKEN_RE.findall(fold(text))
+
+
+# Reduce a link to searchable host tokens, e.g. "www.oreilly.com" -> ["oreilly", "com"]
+def domain_tokens(link):
+    host = urlparse(link).netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return tokenize(host.replace(".", " "))
+
+
+# Tokenized inverted index over every resource in the catalog
+class SearchIndex:
+    def __init__(self, entries):
+        # entries: sequence of (main_field, sub_field, resource) in catalog order
+        self.entries = tuple(entries)
+        postings = {}
+        for idx, (_, _, resource) in enumerate(self.entries):
+            fields = (
+                ("title", tokenize(resource["title"])),
+                ("type", tokenize(resource["type"])),
+                ("domain", domain_tokens(resource["link"])),
+            )
+            for field, tokens in fields:
+                for token in tokens:
+                    bucket = postings.setdefault(token, {})
+                    bucket[idx] = bucket.get(idx, 0.0) + FIELD_WEIGHTS[field]
+        self.postings = postings
+        # Sorted vocabulary for prefix lookups via binary search
+        self.vocabulary = sorted(postings)
+        self.search = lru_cache(maxsize=1024)(self._search)
+        self._prefix_scores = lru_cache(maxsize=4096)(self._prefix_scores)
+
+    # Posting scores for every token starting with `prefix`
+    def _prefix_scores(self, prefix):
+        start = bisect_left(self.vocabulary, prefix)
+        end = bisect_left(self.vocabulary, prefix + "\uffff", start)
+        if end - start == 1 and self.vocabulary[start] == prefix:
+            # Exact, unambiguous token: the posting list is already the answer
+            return self.postings[prefix]
+        scores = {}
+        for token in self.vocabulary[start:end]:
+            factor = 1.0 if token == prefix else PREFIX_FACTOR
+            for idx, weight in self.postings[token].items():
+                scores[idx] = max(scores.get(idx, 0.0), weight * factor)
+        return scores
+
+    # Return up to `limit` (main_field, sub_field, resource) tuples ranked by relevance.
+    # Every query token must match (as a whole token or a prefix) somewhere in the entry.
+    def _search(self, query, limit=50):
+        tokens = tokenize(query)
+        if not tokens:
+            return ()
+        ranked = None
+        # Rarest tokens first keeps the running intersection small
+        for scores in sorted((self._prefix_scores(t) for t in set(tokens)), key=len):
+            if ranked is None:
+                ranked = scores
+            else:
+                ranked = {idx: s + scores[idx] for idx, s in ranked.items() if idx in scores}
+            if not ranked:
+                return ()
+        best = heapq.nsmallest(limit, ranked, key=lambda idx: (-ranked[idx], idx))
+        return tuple(self.entries[idx] for idx in best)
@@ -0,0 +1,197 @@
+import logging
+import os
+import pickle
+import sys
+import threading
+import time
+import weakref
+
+from store import DB_PATH
+
+logger = logging.getLogger(__name__)
+
+# Sessions idle for this long have their app data written to disk
+IDLE_SPILL_SECONDS = float(os.environ.get("LPC_SPILL_IDLE_SECONDS", "900"))
+SWEEP_INTERVAL = float(os.environ.get("LPC_SPILL_SWEEP_SECONDS", "60"))
+# Private to the app (0700) and next to its database by default, never in a shared temp directory
+SPILL_DIR = os.environ.get("LPC_SPILL_DIR", os.path.join(os.path.dirname(os.path.abspath(DB_PATH)), "lpc-spill"))
+# Session state key holding the spill file of a session whose data is on disk
+SPILL_KEY = "_spilled_to"
+
+
+# Approximate deep size in bytes of an object graph, counting shared objects once.
+# Follows containers, instance dicts and __slots__; strings and numbers are leaves.
+def deep_size(obj, seen=None):
+    seen = set() if seen is None else seen
+    stack = [obj]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, (str, bytes, int, float, bool, type(None))):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        else:
+            if hasattr(obj, "__dict__"):
+                stack.append(obj.__dict__)
+            for cls in type(obj).__mro__:
+                for name in getattr(cls, "__slots__", ()):
+                    if hasattr(obj, name):
+                        stack.append(getattr(obj, name))
+    return total
+
+
+# {key: bytes} for every entry of a session state, largest first
+def footprint(state):
+    seen = set()
+    sizes = {key: deep_size(state[key], seen) for key in list(state.filtered_state)}
+    return dict(sorted(sizes.items(), key=lambda item: -item[1]))
+
+
+class _Entry:
+    __slots__ = ("state", "lock", "last_active", "bytes", "spilled")
+
+    def __init__(self, state):
+        self.state = weakref.ref(state)
+        self.lock = threading.Lock()
+        self.last_active = time.time()
+        self.bytes = 0
+        self.spilled = False
+
+
+# Every live session in this process, so idle ones can be measured and spilled.
+# A rerun calls `activate`, which also brings back spilled data; a background
+# sweeper spills the `keys` of sessions idle for longer than `idle_seconds`.
+class SessionRegistry:
+    def __init__(self, keys, spill_dir=SPILL_DIR, idle_seconds=IDLE_SPILL_SECONDS):
+        self.keys = tuple(keys)
+        self.spill_dir = spill_dir
+        self.idle_seconds = idle_seconds
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._sweeper = None
+
+    def _entry(self, session_id, state):
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None or entry.state() is not state:
+                entry = self._entries[session_id] = _Entry(state)
+            return entry
+
+    # Mark a session active for this rerun, restoring its data if it was spilled.
+    # Returns False when spilled data could not be read back; the session then
+    # starts over without it.
+    def activate(self, session_id, state):
+        entry = self._entry(session_id, state)
+        with entry.lock:
+            entry.last_active = time.time()
+            restored = True
+            if entry.spilled or SPILL_KEY in state:
+                restored = self._restore(session_id, state)
+                entry.spilled = False
+            return restored
+
+    def _spill_path(self, session_id):
+        return os.path.join(self.spill_dir, f"{session_id}.pkl")
+
+    # The spill directory, created private to this user; refuses one others can write to
+    def _private_dir(self):
+        os.makedirs(self.spill_dir, mode=0o700, exist_ok=True)
+        info = os.stat(self.spill_dir)
+        if info.st_mode & 0o077 or (hasattr(os, "getuid") and info.st_uid != os.getuid()):
+            raise PermissionError(f"{self.spill_dir} must be owned by this user with mode 0700")
+        return self.spill_dir
+
+    def _restore(self, session_id, state):
+        del state[SPILL_KEY]
+        path = self._spill_path(session_id)
+        try:
+            with open(path, "rb") as f:
+                data = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            logger.warning("Could not restore spilled session data from %s", path, exc_info=True)
+            return False
+        for key, value in data.items():
+            state[key] = value
+        os.remove(path)
+        return True
+
+    def _spill(self, session_id, entry, state):
+        data = {key: state[key] for key in self.keys if key in state}
+        if not data:
+            return
+        try:
+            path = os.path.join(self._private_dir(), f"{session_id}.pkl")
+        except OSError as e:
+            logger.error("Not spilling idle sessions: %s", e)
+            return
+        # Written under a temporary name first so a crash never leaves half a file behind
+        partial = f"{path}.{threading.get_ident()}.tmp"
+        with os.fdopen(os.open(partial, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(partial, path)
+        state[SPILL_KEY] = path
+        for key in data:
+            del state[key]
+        entry.spilled = True
+
+    # Measure every session and spill the idle ones; returns the number spilled
+    def sweep(self, now=None):
+        now = time.time() if now is None else now
+        spilled = 0
+        with self._lock:
+            entries = list(self._entries.items())
+        for session_id, entry in entries:
+            state = entry.state()
+            if state is None:  # session closed; drop it and any spill file
+                with self._lock:
+                    self._entries.pop(session_id, None)
+                try:
+                    os.remove(self._spill_path(session_id))
+                except FileNotFoundError:
+                    pass
+                continue
+            with entry.lock:
+                if not entry.spilled and now - entry.last_active >= self.idle_seconds:
+                    self._spill(session_id, entry, state)
+                    spilled += entry.spilled
+                entry.bytes = 0 if entry.spilled else sum(footprint(state).values())
+        return spilled
+
+    # One row per live session: id, idle seconds, measured bytes, spilled or not
+    def report(self, now=None):
+        now = time.time() if now is None else now
+        with self._lock:
+            entries = list(self._entries.items())
+        return [
+            {
+                "session": session_id[:8],
+                "idle_s": round(now - entry.last_active),
+                "kib": round(entry.bytes / 1024, 1),
+                "spilled": entry.spilled,
+            }
+            for session_id, entry in entries
+            if entry.state() is not None
+        ]
+
+    def start_sweeper(self, interval=SWEEP_INTERVAL):
+        with self._lock:
+            if self._sweeper is not None:
+                return
+            self._sweeper = threading.Thread(target=self._sweep_loop, args=(interval,), name="session-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def _sweep_loop(self, interval):
+        while True:
+            time.sleep(interval)
+            try:
+                self.sweep()
+            except Exception:
+                logger.exception("Session sweep failed")
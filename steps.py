@@ -0,0 +1,94 @@
+import itertools
+
+# Ids are unique per process so widget keys never collide with a previous path's steps
+_step_ids = itertools.count(1)
+
+
+# Ordered learning path steps with stable per-step ids.
+# Widgets are keyed by step id, so editing, inserting, moving or deleting one
+# step leaves every other step (and its widget) untouched. Iterating yields
+# the step texts in order, so it can be used wherever a list of steps was.
+class StepList:
+    __slots__ = ("_order", "_text", "dirty", "deleted")
+
+    def __init__(self, texts=()):
+        self._order = []
+        self._text = {}
+        self.dirty = set()  # ids of steps added, edited or moved since the last save
+        self.deleted = set()  # ids of steps removed since the last save
+        for text in texts:
+            self.insert(len(self._order), text)
+        self.mark_clean()
+
+    def __iter__(self):
+        return (self._text[step_id] for step_id in self._order)
+
+    def __len__(self):
+        return len(self._order)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._text[step_id] for step_id in self._order[index]]
+        return self._text[self._order[index]]
+
+    # (step_id, text) pairs in order
+    def items(self):
+        return [(step_id, self._text[step_id]) for step_id in self._order]
+
+    def insert(self, position, text):
+        step_id = next(_step_ids)
+        self._order.insert(position, step_id)
+        self._text[step_id] = text
+        self.dirty.add(step_id)
+        return step_id
+
+    def append(self, text):
+        return self.insert(len(self._order), text)
+
+    # Change one step's text; a no-op (and not dirty) when the text is unchanged
+    def update(self, step_id, text):
+        if self._text.get(step_id) == text:
+            return False
+        self._text[step_id] = text
+        self.dirty.add(step_id)
+        return True
+
+    def move(self, step_id, position):
+        self._order.remove(step_id)
+        position = max(0, min(position, len(self._order)))
+        self._order.insert(position, step_id)
+        self.dirty.add(step_id)
+
+    def position(self, step_id):
+        return self._order.index(step_id)
+
+    def delete(self, step_id):
+        self._order.remove(step_id)
+        del self._text[step_id]
+        self.dirty.discard(step_id)
+        self.deleted.add(step_id)
+
+    def pop(self):
+        step_id = self._order[-1]
+        text = self._text[step_id]
+        self.delete(step_id)
+        return text
+
+    # Apply a full list of texts (e.g. from a grid editor), keeping ids by position
+    # and touching only the steps whose text actually changed
+    def assign(self, texts):
+        texts = list(texts)
+        for step_id, text in zip(self._order, texts):
+            self.update(step_id, text)
+        for text in texts[len(self._order):]:
+            self.append(text)
+        for step_id in self._order[len(texts):]:
+            self.delete(step_id)
+
+    @property
+    def has_changes(self):
+        return bool(self.dirty or self.deleted)
+
+    def mark_clean(self):
+        self.dirty.clear()
+        self.deleted.clear()
@@ -0,0 +1,145 @@
+import contextlib
+import json
+import os
+import pathlib
+import queue
+import sqlite3
+import threading
+import time
+
+DB_PATH = os.environ.get("LPC_DB_PATH", "user_data.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS learning_paths (
+    user_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_learning_paths_updated ON learning_paths (updated_at);
+"""
+
+
+# A batch of rows waiting for the writer thread
+class _WriteJob:
+    __slots__ = ("rows", "done", "error")
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.done = threading.Event()
+        self.error = None
+
+
+# Open a connection tuned for many concurrent readers and one writer
+def connect(path):
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=30000")
+    return conn
+
+
+# Stream every saved (user_id, data) pair in the database at `path` without loading them
+# all at once. With read_only the file is neither created nor written to.
+def iter_saved_paths(path, read_only=False):
+    if read_only:
+        conn = sqlite3.connect(f"{pathlib.Path(path).resolve().as_uri()}?mode=ro", uri=True)
+    else:
+        conn = connect(path)
+    try:
+        for user_id, data in conn.execute("SELECT user_id, data FROM learning_paths ORDER BY user_id"):
+            yield user_id, json.loads(data)
+    finally:
+        conn.close()
+
+
+# Open connections shared by every thread. Streamlit runs each rerun on a new
+# thread, so per-thread connections would be opened (and tuned) on every rerun;
+# a pool hands the same few out again. Up to `size` idle connections are kept.
+class ConnectionPool:
+    def __init__(self, path, size=8):
+        self.path = path
+        self._idle = queue.LifoQueue(maxsize=size)
+
+    @contextlib.contextmanager
+    def connection(self):
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = connect(self.path)
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            try:
+                self._idle.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+
+# Per-user saved learning paths backed by SQLite.
+# Writes go through a single writer thread that commits everything queued
+# since its last transaction at once (group commit); readers take pooled
+# connections and never block on the writer in WAL mode.
+class PathStore:
+    def __init__(self, path=DB_PATH, max_batch=256):
+        self.path = path
+        self.max_batch = max_batch
+        self._pool = ConnectionPool(path)
+        with self._pool.connection() as conn:
+            conn.executescript(SCHEMA)
+        self._pending = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="path-store", daemon=True)
+        self._writer.start()
+
+    # Save one user's data; blocks until it is committed
+    def save(self, user_id, data):
+        self.save_many([(user_id, data)])
+
+    # Save many (user_id, data) pairs in the writer's next transaction
+    def save_many(self, items):
+        rows = [(user_id, json.dumps(data), time.time()) for user_id, data in items]
+        if not rows:
+            return
+        job = _WriteJob(rows)
+        self._pending.put(job)
+        job.done.wait()
+        if job.error is not None:
+            raise job.error
+
+    def load(self, user_id):
+        with self._pool.connection() as conn:
+            row = conn.execute("SELECT data FROM learning_paths WHERE user_id = ?", (user_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    # Stream every saved (user_id, data) pair without loading them all at once
+    def iter_all(self):
+        return iter_saved_paths(self.path)
+
+    def _write_loop(self):
+        conn = connect(self.path)
+        while True:
+            jobs = [self._pending.get()]
+            count = len(jobs[0].rows)
+            while count < self.max_batch:
+                try:
+                    job = self._pending.get_nowait()
+                except queue.Empty:
+                    break
+                jobs.append(job)
+                count += len(job.rows)
+            error = None
+            try:
+                with conn:
+                    for job in jobs:
+                        conn.executemany(
+                            "INSERT INTO learning_paths (user_id, data, updated_at) VALUES (?, ?, ?) "
+                            "ON CONFLICT(user_id) DO UPDATE SET data = excluded.data, "
+                            "updated_at = excluded.updated_at",
+                            job.rows,
+                        )
+            except sqlite3.Error as e:
+                error = e
+            for job in jobs:
+                job.error = error
+                job.done.set()
@@ -0,0 +1,129 @@
+import glob
+import json
+import os
+import string
+import threading
+
+import streamlit as st
+
+TEMPLATES_PATH = os.environ.get(
+    "LPC_TEMPLATES_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "templates"),
+)
+# Matches any main field or sub-field
+ANY = "*"
+# Variables a step may use, e.g. "Set a {sub_field} practice schedule"
+VARIABLES = ("goal", "main_field", "sub_field")
+
+_formatter = string.Formatter()
+
+
+# One step, split once into literal text and variable names so rendering is just a join
+def compile_step(text, source):
+    parts = []
+    for literal, name, spec, conversion in _formatter.parse(text):
+        if literal:
+            parts.append((literal, None))
+        if name is None:
+            continue
+        if name not in VARIABLES or spec or conversion:
+            raise ValueError(f"{source}: unknown variable {{{name}}} in step {text!r}")
+        parts.append((None, name))
+    # Steps without variables are stored as plain strings
+    if all(name is None for _, name in parts):
+        return "".join(literal for literal, _ in parts)
+    return tuple(parts)
+
+
+def render_step(step, values):
+    if isinstance(step, str):
+        return step
+    return "".join(literal if name is None else values[name] for literal, name in step)
+
+
+# Precompiled goal x main field x sub-field step templates.
+# Lookups try the exact sub-field, then the whole main field, then the goal alone,
+# so a path is at most three dict lookups however many templates are loaded.
+# A localized set compiles the translated steps and fills in translated names;
+# goals and fields are still looked up by their English keys.
+class TemplateSet:
+    def __init__(self, templates, locale=None):
+        templates = tuple(templates)
+        self.locale = locale
+        self._templates = templates
+        self._localized = {}
+        self._localized_lock = threading.Lock()
+        self._lookup = {}
+        steps_of = locale.steps if locale is not None else {}
+        generic, specific = {}, {}
+        for source, template in templates:
+            key = (template["goal"], template.get("main_field") or ANY, template.get("sub_field") or ANY)
+            if key[1] == ANY and key[2] != ANY:
+                raise ValueError(f"{source}: a sub_field template needs a main_field too")
+            if key in self._lookup:
+                raise ValueError(f"{source}: duplicate template for {key}")
+            self._lookup[key] = tuple(compile_step(steps_of.get(text, text), source) for text in template["steps"])
+            (generic if key[1:] == (ANY, ANY) else specific).setdefault(key[0], None)
+        # Goals with a generic path first (in file order), then field-only goals
+        self.goals = tuple(generic) + tuple(goal for goal in specific if goal not in generic)
+
+    def steps_for(self, goal, main_field="", sub_field=""):
+        lookup = self._lookup
+        steps = (
+            lookup.get((goal, main_field, sub_field))
+            or lookup.get((goal, main_field, ANY))
+            or lookup.get((goal, ANY, ANY))
+            or ()
+        )
+        locale = self.locale
+        if locale is None:
+            values = {"goal": goal, "main_field": main_field, "sub_field": sub_field}
+        else:
+            values = {"goal": locale.goal(goal), "main_field": locale.field(main_field), "sub_field": locale.field(sub_field)}
+        return [render_step(step, values) for step in steps]
+
+    # This template set for `locale`, compiled on first use and kept until a file changes
+    def localized(self, locale):
+        if locale is None or not locale.etag:
+            return self
+        with self._localized_lock:
+            templates = self._localized.get(locale.code)
+            if templates is None or templates.locale.etag != locale.etag:
+                templates = self._localized[locale.code] = TemplateSet(self._templates, locale)
+        return templates
+
+    def __len__(self):
+        return len(self._lookup)
+
+
+def _template_files(path):
+    if os.path.isdir(path):
+        return sorted(glob.glob(os.path.join(path, "*.json")))
+    return [path]
+
+
+# Parse every template file under `path` (a directory or a single JSON file)
+def load_templates(path=TEMPLATES_PATH):
+    templates = []
+    for file_path in _template_files(path):
+        with open(file_path, encoding="utf-8") as f:
+            data = json.load(f)
+        source = os.path.basename(file_path)
+        templates.extend((source, template) for template in data["templates"])
+    return TemplateSet(templates)
+
+
+# Changes whenever a template file is added, removed or edited
+def _signature(path):
+    return tuple((file_path, os.stat(file_path).st_mtime_ns) for file_path in _template_files(path))
+
+
+# Built once per process per revision of the template files
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _cached_templates(path, signature):
+    return load_templates(path)
+
+
+# Return the shared template set, reloading it when a template file changes
+def get_templates(path=TEMPLATES_PATH):
+    return _cached_templates(path, _signature(path))
@@ -0,0 +1,132 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# Feedback and reviews a session may send in a burst, and how many more it earns per minute
+SESSION_BURST = int(os.environ.get("LPC_SUBMIT_BURST", "5"))
+SESSION_PER_MINUTE = float(os.environ.get("LPC_SUBMIT_PER_MINUTE", "6"))
+# Learners behind one address (an office, a school) share a larger bucket
+ADDRESS_BURST = int(os.environ.get("LPC_SUBMIT_ADDRESS_BURST", "30"))
+ADDRESS_PER_MINUTE = float(os.environ.get("LPC_SUBMIT_ADDRESS_PER_MINUTE", "60"))
+# The same text from the same session within this window is dropped as a duplicate
+DEDUP_SECONDS = float(os.environ.get("LPC_SUBMIT_DEDUP_SECONDS", "600"))
+# Keys tracked per structure; the least recently used are forgotten beyond this
+MAX_KEYS = 100_000
+STRIPES = 64
+OUTCOMES = ("accepted", "duplicate", "rate_limited")
+
+
+# Token buckets keyed by client. Keys are spread over lock stripes so concurrent
+# sessions rarely wait on each other. A check is O(1): a bucket refills lazily from
+# the time since its last use, and a full stripe forgets its least recently used key.
+class RateLimiter:
+    def __init__(self, per_minute, burst, max_keys=MAX_KEYS, stripes=STRIPES, clock=time.monotonic):
+        self.rate = per_minute / 60
+        self.burst = burst
+        self.clock = clock
+        self._stripe_size = max(1, max_keys // stripes)
+        self._stripes = [(threading.Lock(), OrderedDict()) for _ in range(stripes)]
+
+    def allow(self, key, cost=1):
+        lock, buckets = self._stripes[hash(key) % len(self._stripes)]
+        now = self.clock()
+        with lock:
+            bucket = buckets.get(key)
+            if bucket is None:
+                tokens = self.burst
+                if len(buckets) >= self._stripe_size:
+                    buckets.popitem(last=False)
+            else:
+                tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                buckets.move_to_end(key)
+            allowed = tokens >= cost
+            buckets[key] = (tokens - cost if allowed else tokens, now)
+        return allowed
+
+
+# Content hashes seen within the last `window` seconds, striped like RateLimiter.
+# Entries sit in each stripe in the order they were added, so expired ones are
+# always at the front and are dropped as new ones arrive.
+class Deduper:
+    def __init__(self, window, max_keys=MAX_KEYS, stripes=STRIPES, clock=time.monotonic):
+        self.window = window
+        self.clock = clock
+        self._stripe_size = max(1, max_keys // stripes)
+        self._stripes = [(threading.Lock(), OrderedDict()) for _ in range(stripes)]
+
+    def _stripe(self, digest):
+        return self._stripes[int(digest[:8], 16) % len(self._stripes)]
+
+    # Record `digest`; False if it was already recorded within the window
+    def claim(self, digest):
+        lock, entries = self._stripe(digest)
+        now = self.clock()
+        with lock:
+            while entries:
+                oldest, added = next(iter(entries.items()))
+                if now - added < self.window and len(entries) < self._stripe_size:
+                    break
+                entries.popitem(last=False)
+            if digest in entries:
+                return False
+            entries[digest] = now
+            return True
+
+    # Forget a claim, e.g. when the submission was dropped for another reason
+    def release(self, digest):
+        lock, entries = self._stripe(digest)
+        with lock:
+            entries.pop(digest, None)
+
+
+def submission_digest(client, kind, target, text):
+    normalized = " ".join(text.split()).casefold()
+    return hashlib.sha256("\x1f".join((client, kind, target, normalized)).encode("utf-8")).hexdigest()
+
+
+# Server-wide gate for user submissions (feedback, reviews): drops repeats of the
+# same text and sessions or addresses sending faster than their token buckets allow,
+# and counts every outcome per kind of submission
+class SubmissionGuard:
+    def __init__(self, session_limiter=None, address_limiter=None, deduper=None):
+        self.session_limiter = session_limiter or RateLimiter(SESSION_PER_MINUTE, SESSION_BURST)
+        self.address_limiter = address_limiter or RateLimiter(ADDRESS_PER_MINUTE, ADDRESS_BURST)
+        self.deduper = deduper or Deduper(DEDUP_SECONDS)
+        self._lock = threading.Lock()
+        self._counts = {}
+
+    # "accepted", "duplicate" or "rate_limited" for one submission; `address` may be None
+    def check(self, kind, session_id, address, target, text):
+        digest = submission_digest(session_id, kind, target, text)
+        if not self.deduper.claim(digest):
+            outcome = "duplicate"
+        elif not self.session_limiter.allow(session_id) or (
+            address is not None and not self.address_limiter.allow(address)
+        ):
+            self.deduper.release(digest)
+            outcome = "rate_limited"
+        else:
+            outcome = "accepted"
+        with self._lock:
+            self._counts[kind, outcome] = self._counts.get((kind, outcome), 0) + 1
+        return outcome
+
+    # One row per kind of submission with a count per outcome
+    def summary(self):
+        with self._lock:
+            counts = dict(self._counts)
+        kinds = sorted({kind for kind, _ in counts})
+        return [{"submission": kind, **{outcome: counts.get((kind, outcome), 0) for outcome in OUTCOMES}} for kind in kinds]
+
+    # Prometheus text exposition format
+    def prometheus_text(self):
+        lines = [
+            "# HELP lpc_submissions_total Feedback and review submissions by outcome.",
+            "# TYPE lpc_submissions_total counter",
+        ]
+        with self._lock:
+            for (kind, outcome), count in sorted(self._counts.items()):
+                lines.append(f'lpc_submissions_total{{kind="{kind}",outcome="{outcome}"}} {count}')
+        return "\n".join(lines) + "\n"